@@ -0,0 +1,11 @@
+"""Make ``wbdlib`` importable when pytest runs from the repository root."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+ANALYSIS_DIR = Path(__file__).resolve().parents[1]
+if str(ANALYSIS_DIR) not in sys.path:
+    sys.path.insert(0, str(ANALYSIS_DIR))
@@ -0,0 +1,178 @@
+"""Equivalence of the vectorised ``bin_time_series`` with the per-bin loop."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wbdlib.timeseries import bin_time_series
+
+
+_EMPTY_COLUMNS = [
+    "bin",
+    "bin_start",
+    "bin_end",
+    "bin_midpoint",
+    "value_mean",
+    "value_median",
+    "value_std",
+    "sample_count",
+    "coverage",
+    "passes_coverage",
+]
+
+
+def _reference_bin_time_series(
+    frame: pd.DataFrame,
+    value_column: str,
+    *,
+    time_column: str = "time_seconds",
+    bin_width: float,
+    min_coverage: float | None = None,
+) -> pd.DataFrame:
+    """The groupby implementation ``bin_time_series`` replaced, verbatim."""
+
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+    if time_column not in frame.columns:
+        raise KeyError(f"Column '{time_column}' not present for binning")
+    if value_column not in frame.columns:
+        raise KeyError(f"Column '{value_column}' not present for binning")
+    cleaned = frame[[time_column, value_column]].dropna()
+    if cleaned.empty:
+        return pd.DataFrame(
+            columns=[
+                "bin",
+                "bin_start",
+                "bin_end",
+                "bin_midpoint",
+                "value_mean",
+                "value_median",
+                "value_std",
+                "sample_count",
+                "coverage",
+                "passes_coverage",
+            ]
+        )
+    cleaned = cleaned.sort_values(time_column)
+    bin_indices = np.floor(cleaned[time_column] / bin_width).astype(int)
+    cleaned = cleaned.assign(bin=bin_indices)
+    records: list[dict[str, float | int | bool]] = []
+    for bin_id, chunk in cleaned.groupby("bin"):
+        chunk = chunk.loc[(chunk[value_column] < 9000) &
+                          (chunk[value_column] > -9000)]
+        if chunk.empty:
+            continue
+        span = float(chunk[time_column].max() - chunk[time_column].min())
+        effective_span = span
+        if not np.isfinite(effective_span) or effective_span <= 0.0:
+            diffs = (
+                chunk[time_column]
+                .sort_values()
+                .diff()
+                .dropna()
+                .astype(float)
+            )
+            approx_spacing = (
+                float(diffs.median()) if not diffs.empty else np.nan
+            )
+            if not np.isfinite(approx_spacing) or approx_spacing <= 0.0:
+                approx_spacing = bin_width
+            effective_span = approx_spacing
+        coverage = min(1.0, effective_span / bin_width) if bin_width else 0.0
+        passes = coverage >= (min_coverage or 0.0)
+        values = chunk[value_column].astype(float)
+        record = {
+            "bin": int(bin_id),
+            "bin_start": float(bin_id * bin_width),
+            "bin_end": float((bin_id + 1) * bin_width),
+            "bin_midpoint": float((bin_id + 0.5) * bin_width),
+            "value_mean": float(values.mean()),
+            "value_median": float(values.median()),
+            "value_std": float(values.std(ddof=1)) if values.size > 1 else 0.0,
+            "sample_count": int(values.size),
+            "coverage": coverage,
+            "passes_coverage": passes,
+        }
+        records.append(record)
+    result = pd.DataFrame.from_records(records)
+    result = result.sort_values("bin").reset_index(drop=True)
+    return result
+
+
+def _random_series(seed: int) -> pd.DataFrame:
+    """A shuffled series with sentinels, gaps and repeated timestamps."""
+
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 300))
+    if seed % 3 == 0:
+        # Every timestamp three times, so some bins have zero span.
+        times = np.repeat(rng.uniform(0, 20, n // 3 + 1), 3)[:n]
+    else:
+        times = np.sort(rng.uniform(-3, 40, n))
+    values = rng.normal(0, 50, n)
+    if seed % 7 == 0:
+        values = np.round(values)
+    values[rng.random(n) < 0.05] = 9000.0
+    values[rng.random(n) < 0.05] = -9000.0
+    values[rng.random(n) < 0.05] = 99999.0
+    values[rng.random(n) < 0.05] = -99999.0
+    values[rng.random(n) < 0.1] = np.nan
+    times[rng.random(n) < 0.02] = np.nan
+    frame = pd.DataFrame({"time_seconds": times, "value": values})
+    return frame.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def _assert_same_bins(frame: pd.DataFrame, **kwargs) -> None:
+    expected = _reference_bin_time_series(frame, "value", **kwargs)
+    result = bin_time_series(frame, "value", **kwargs)
+    pd.testing.assert_frame_equal(
+        result, expected, check_exact=False, rtol=1e-12, atol=1e-9
+    )
+
+
+@pytest.mark.parametrize("min_coverage", [None, 0.0, 0.5, 0.9, 1.0])
+@pytest.mark.parametrize("bin_width", [0.25, 0.5, 1.0, 2.0, 7.5])
+@pytest.mark.parametrize("seed", range(12))
+def test_matches_reference_on_random_series(seed, bin_width, min_coverage):
+    frame = _random_series(seed)
+    if not (frame["value"].abs() < 9000).any():
+        pytest.skip("every sample is a sentinel")
+    _assert_same_bins(frame, bin_width=bin_width, min_coverage=min_coverage)
+
+
+@pytest.mark.parametrize("bin_width", [0.5, 1.0])
+def test_zero_span_and_single_sample_bins(bin_width):
+    frame = pd.DataFrame(
+        {
+            "time_seconds": [0.2, 0.2, 0.2, 1.7, 3.1, 3.1, 3.4],
+            "value": [1.0, 2.0, 4.0, 5.0, -1.0, 9000.0, 3.0],
+        }
+    )
+    _assert_same_bins(frame, bin_width=bin_width, min_coverage=0.5)
+
+
+def test_sentinel_only_bins_are_dropped():
+    frame = pd.DataFrame(
+        {
+            "time_seconds": [0.1, 0.4, 1.2, 1.6, 2.5],
+            "value": [9000.0, -9000.0, 2.0, -8999.5, 8999.5],
+        }
+    )
+    _assert_same_bins(frame, bin_width=1.0)
+
+
+def test_empty_after_dropping_missing():
+    frame = pd.DataFrame({"time_seconds": [np.nan, 1.0], "value": [1.0, np.nan]})
+    result = bin_time_series(frame, "value", bin_width=1.0)
+    assert result.empty
+    assert list(result.columns) == _EMPTY_COLUMNS
+
+
+def test_all_sentinels_give_empty_frame():
+    # The loop raised a KeyError here; the vectorised version returns no bins.
+    frame = pd.DataFrame({"time_seconds": [0.1, 0.7], "value": [9000.0, -9500.0]})
+    with pytest.raises(KeyError):
+        _reference_bin_time_series(frame, "value", bin_width=1.0)
+    assert bin_time_series(frame, "value", bin_width=1.0).empty
@@ -3,14 +3,25 @@
 from .constants import BOXPLOT_MEANPROPS, COLOR_MAP
 from .biometric import (
     BiometricHeader,
+    DEFAULT_POSTHOC_CORRECTIONS,
+    DURATION_CHECK_COLUMNS,
     FORM_ORDER,
+    POSTHOC_RESULT_COLUMNS,
     KNOWN_SENSORS,
     KNOWN_STATS,
+    RESAMPLING_SUMMARY_COLUMNS,
+    WINSORIZE_SUMMARY_COLUMNS,
     TITLE_FIXES,
+    WITHIN_SUBJECT_SUMMARY_COLUMNS,
+    WithinSubjectBatch,
+    WithinSubjectRegistry,
     WithinSubjectSummary,
     bin_biometric_time_series,
+    biometric_header_catalogue,
     build_within_subject_table,
     canonicalise_title,
+    check_key_moment_durations,
+    compute_within_subject_batch,
     compute_within_subject_summary,
     get_duration_differences,
     parse_biometric_header,
@@ -18,9 +29,23 @@ from .biometric import (
     summarise_biometric_structure,
 )
 from .imotions import (
+    IMotionsFileIndex,
+    StimulusRun,
+    build_imotions_index,
+    build_stimulus_index,
     extract_imotions_metadata,
     read_imotions,
+    read_imotions_data,
     read_imotions_metadata,
+    read_imotions_rows,
+    scan_imotions_file,
+)
+from .sensor_store import (
+    convert_sensor_exports,
+    ensure_sensor_store,
+    get_sensor_store,
+    read_sensor_store,
+    set_sensor_store,
 )
 from .formatting import (
     _fmt_stat,
@@ -55,7 +80,14 @@ from .recall_scoring import (
     parse_model_events,
     resolve_event_list,
 )
-from .stats import one_tailed_p_from_paired_t
+from .stats import (
+    adjust_p_values,
+    bootstrap_index_matrix,
+    one_tailed_p_from_paired_t,
+    one_tailed_paired_t_matrix,
+    paired_resampling_test,
+    sign_flip_matrix,
+)
 from .survey import (
     build_group_short_long_map,
     clean_response,
@@ -79,17 +111,28 @@ from .uv import (
     rename_survey_columns,
 )
 from .recall import build_open_recall_structures
+from .batch import (
+    RespondentSensorJob,
+    coerce_job,
+    is_picklable,
+    run_respondent_jobs,
+)
 from .timeseries import (
     DEFAULT_SENSOR_METRICS,
     KeyMomentWindow,
+    SENTINEL_LIMIT,
+    SensorBatchResult,
     SensorProcessingResult,
+    TIME_SERIES_CODE_VERSION,
     TimeSeriesProcessingConfig,
     aggregate_binned_time_series,
+    bin_segment_multi,
     bin_time_series,
     build_stimulus_lookup,
     butterworth_bandpass_filter,
     butterworth_highpass_filter,
     butterworth_lowpass_filter,
+    butterworth_sos,
     default_metric_columns,
     default_time_series_processing_config,
     extract_stimulus_segment,
@@ -97,12 +140,78 @@ from .timeseries import (
     load_key_moments,
     load_sensor_file,
     load_stimulus_map,
+    load_stimulus_segment,
     moving_average,
     parse_duration_to_milliseconds,
     process_sensor_time_series,
+    process_sensor_time_series_batch,
     resolve_stimulus_identity,
+    resolve_stimulus_in_group,
+    smooth_segments,
+    zero_phase_filter_matrix,
     zscore_series,
 )
+from .timeseries_stream import StreamingTimeSeriesAggregator
+from .timeseries_cache import (
+    load_cached_result,
+    store_cached_result,
+    time_series_cache_key,
+)
+from .schema import ColumnSpec, LONG_TABLE_SCHEMA, apply_long_schema
+from .binned_tensor import (
+    BinnedTensor,
+    aggregate_binned_tensor,
+    aggregate_binned_tensors,
+    binned_tensors_from_frame,
+    binned_tensors_to_frame,
+)
+from .outliers import (
+    OUTLIER_AUDIT_COLUMNS,
+    OutlierFlags,
+    PAIRED_OUTLIER_COLUMNS,
+    detect_outliers,
+    nan_quantiles,
+    outlier_audit,
+    outlier_bounds,
+    paired_outlier_columns,
+    winsorize,
+)
+from .models import (
+    MIXED_MODEL_COEFFICIENT_COLUMNS,
+    MixedModelConfig,
+    MixedModelFit,
+    MixedModelResults,
+    fit_mixed_models,
+)
+from .events import (
+    EVENT_RATE_COLUMNS,
+    EventRuns,
+    bin_event_rates,
+    detect_events,
+    event_rate_series,
+)
+from .features import (
+    DEFAULT_FEATURE_REGISTRY,
+    FeatureBatchResult,
+    FeatureSpec,
+    RespondentFeatures,
+    extract_features_batch,
+    extract_respondent_features,
+)
+from .isc import (
+    ISCResult,
+    RespondentBinMatrix,
+    compute_isc,
+    leave_one_out_window_correlations,
+    pairwise_window_correlations,
+    pivot_respondent_bins,
+    summarise_isc_curves,
+)
+from .isc_null import (
+    circular_shift_surrogates,
+    isc_null_test,
+    surrogate_isc_curves,
+)
 
 __all__ = [
     "BOXPLOT_MEANPROPS",
@@ -111,14 +220,24 @@ __all__ = [
     "SYSTEM_PROMPT_STAGE51",
     "FORM_ORDER",
     "_fmt_stat",
+    "RESAMPLING_SUMMARY_COLUMNS",
+    "WINSORIZE_SUMMARY_COLUMNS",
+    "WITHIN_SUBJECT_SUMMARY_COLUMNS",
+    "WithinSubjectBatch",
+    "WithinSubjectRegistry",
     "WithinSubjectSummary",
+    "DEFAULT_POSTHOC_CORRECTIONS",
+    "POSTHOC_RESULT_COLUMNS",
     "KNOWN_SENSORS",
     "KNOWN_STATS",
     "TITLE_FIXES",
     "bin_biometric_time_series",
+    "biometric_header_catalogue",
     "build_batch_prompt",
     "build_within_subject_table",
     "canonicalise_title",
+    "check_key_moment_durations",
+    "DURATION_CHECK_COLUMNS",
     "get_duration_differences",
     "annotate_boxplot_means",
     "assign_category",
@@ -145,8 +264,14 @@ __all__ = [
     "normalise_form",
     "normalise_title",
     "one_tailed_p_from_paired_t",
+    "one_tailed_paired_t_matrix",
+    "adjust_p_values",
+    "bootstrap_index_matrix",
+    "paired_resampling_test",
+    "sign_flip_matrix",
     "percentage_point_phrase",
     "print_long_short_summary",
+    "compute_within_subject_batch",
     "compute_within_subject_summary",
     "parse_gender",
     "parse_llm_json",
@@ -157,7 +282,19 @@ __all__ = [
     "reverse_likert",
     "reshape_biometric_long",
     "read_imotions",
+    "read_imotions_data",
     "read_imotions_metadata",
+    "scan_imotions_file",
+    "IMotionsFileIndex",
+    "StimulusRun",
+    "build_imotions_index",
+    "build_stimulus_index",
+    "read_imotions_rows",
+    "convert_sensor_exports",
+    "ensure_sensor_store",
+    "get_sensor_store",
+    "read_sensor_store",
+    "set_sensor_store",
     "rename_survey_columns",
     "resolve_event_list",
     "score_familiarity",
@@ -172,23 +309,84 @@ __all__ = [
     "DEFAULT_SENSOR_METRICS",
     "KeyMomentWindow",
     "SensorProcessingResult",
+    "SensorBatchResult",
+    "RespondentSensorJob",
+    "SENTINEL_LIMIT",
     "TimeSeriesProcessingConfig",
     "bin_time_series",
+    "bin_segment_multi",
     "build_stimulus_lookup",
     "butterworth_bandpass_filter",
     "butterworth_highpass_filter",
     "butterworth_lowpass_filter",
+    "butterworth_sos",
     "default_metric_columns",
     "default_time_series_processing_config",
     "extract_stimulus_segment",
     "get_key_moment_window",
     "load_key_moments",
     "load_sensor_file",
+    "load_stimulus_segment",
     "load_stimulus_map",
     "moving_average",
     "parse_duration_to_milliseconds",
     "process_sensor_time_series",
+    "process_sensor_time_series_batch",
+    "TIME_SERIES_CODE_VERSION",
+    "StreamingTimeSeriesAggregator",
+    "time_series_cache_key",
+    "load_cached_result",
+    "store_cached_result",
     "resolve_stimulus_identity",
+    "resolve_stimulus_in_group",
+    "smooth_segments",
+    "zero_phase_filter_matrix",
     "zscore_series",
     "aggregate_binned_time_series",
+    "ColumnSpec",
+    "LONG_TABLE_SCHEMA",
+    "apply_long_schema",
+    "BinnedTensor",
+    "aggregate_binned_tensor",
+    "aggregate_binned_tensors",
+    "binned_tensors_from_frame",
+    "binned_tensors_to_frame",
+    "OUTLIER_AUDIT_COLUMNS",
+    "OutlierFlags",
+    "PAIRED_OUTLIER_COLUMNS",
+    "detect_outliers",
+    "nan_quantiles",
+    "outlier_audit",
+    "outlier_bounds",
+    "paired_outlier_columns",
+    "winsorize",
+    "MIXED_MODEL_COEFFICIENT_COLUMNS",
+    "MixedModelConfig",
+    "MixedModelFit",
+    "MixedModelResults",
+    "fit_mixed_models",
+    "coerce_job",
+    "is_picklable",
+    "run_respondent_jobs",
+    "EVENT_RATE_COLUMNS",
+    "EventRuns",
+    "bin_event_rates",
+    "detect_events",
+    "event_rate_series",
+    "DEFAULT_FEATURE_REGISTRY",
+    "FeatureBatchResult",
+    "FeatureSpec",
+    "RespondentFeatures",
+    "extract_features_batch",
+    "extract_respondent_features",
+    "ISCResult",
+    "RespondentBinMatrix",
+    "compute_isc",
+    "leave_one_out_window_correlations",
+    "pairwise_window_correlations",
+    "pivot_respondent_bins",
+    "summarise_isc_curves",
+    "circular_shift_surrogates",
+    "isc_null_test",
+    "surrogate_isc_curves",
 ]
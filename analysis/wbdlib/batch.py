@@ -0,0 +1,147 @@
+"""Process-pool runner shared by the per-respondent batch APIs.
+
+:func:`~wbdlib.timeseries.process_sensor_time_series_batch` and
+:func:`~wbdlib.features.extract_features_batch` both run one function per
+respondent sensor export with the same read-only inputs (stimulus lookup,
+key moments, configs). :func:`run_respondent_jobs` sends those inputs to
+each worker once through the pool initializer, forwards the sensor store
+and reports per-respondent failures through ``on_error`` instead of
+raising.
+"""
+
+from __future__ import annotations
+
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+
+@dataclass(frozen=True)
+class RespondentSensorJob:
+    """One respondent's sensor export queued for batch processing."""
+
+    respondent_id: object
+    group: object | None
+    sensor_path: str | Path
+
+
+def coerce_job(item: object) -> RespondentSensorJob:
+    """Accept a job or a ``(respondent_id, group, sensor_path)`` tuple."""
+
+    if isinstance(item, RespondentSensorJob):
+        return item
+    respondent_id, group, sensor_path = item  # type: ignore[misc]
+    return RespondentSensorJob(respondent_id, group, sensor_path)
+
+
+def is_picklable(value: object) -> bool:
+    """Return whether ``value`` can be sent to a worker process."""
+
+    try:
+        pickle.dumps(value)
+    except Exception:  # noqa: BLE001 - any failure means "not shippable"
+        return False
+    return True
+
+
+# The job function and its shared inputs in a worker process. Set once by
+# ``_init_worker`` so they are not re-pickled for every respondent.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_worker(
+    process: Callable[..., Any],
+    on_error: Callable[[RespondentSensorJob, Exception], Any],
+    inputs: Mapping[str, Any],
+    read_csv_kwargs: Mapping[str, Any],
+    sensor_store_dir: str | None,
+) -> None:
+    from .sensor_store import set_sensor_store
+
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(
+        process=process,
+        on_error=on_error,
+        inputs=inputs,
+        read_csv_kwargs=read_csv_kwargs,
+    )
+    if sensor_store_dir is not None:
+        set_sensor_store(sensor_store_dir)
+
+
+def _call_job(
+    job: RespondentSensorJob,
+    process: Callable[..., Any],
+    on_error: Callable[[RespondentSensorJob, Exception], Any],
+    inputs: Mapping[str, Any],
+    read_csv_kwargs: Mapping[str, Any],
+) -> Any:
+    try:
+        return process(
+            job.sensor_path,
+            respondent_id=job.respondent_id,
+            group=job.group,
+            **inputs,
+            **read_csv_kwargs,
+        )
+    except Exception as exc:  # noqa: BLE001 - reported through on_error
+        return on_error(job, exc)
+
+
+def _run_worker_job(job: RespondentSensorJob) -> Any:
+    return _call_job(job, **_WORKER_STATE)
+
+
+def run_respondent_jobs(
+    process: Callable[..., Any],
+    jobs: Sequence[RespondentSensorJob],
+    inputs: Mapping[str, Any],
+    *,
+    on_error: Callable[[RespondentSensorJob, Exception], Any],
+    read_csv_kwargs: Mapping[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> list[Any]:
+    """Run ``process`` for every job and return the outcomes in job order.
+
+    Each call is ``process(job.sensor_path, respondent_id=..., group=...,
+    **inputs, **read_csv_kwargs)``; an exception becomes
+    ``on_error(job, exc)``. ``process`` and ``on_error`` must be module-level
+    functions. Jobs are spread over a process pool; ``max_workers=1`` (or
+    0) or a single job runs serially in this process, and so do inputs that
+    cannot be pickled, with a ``RuntimeWarning``.
+    """
+
+    payload = (process, on_error, dict(inputs), dict(read_csv_kwargs or {}))
+    serial = (max_workers is not None and max_workers <= 1) or len(jobs) <= 1
+    if not serial and not is_picklable(payload):
+        warnings.warn(
+            "Batch inputs cannot be sent to worker processes (e.g. a "
+            "smoothing closure); falling back to serial execution.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        serial = True
+    if serial:
+        return [_call_job(job, *payload) for job in jobs]
+
+    from .sensor_store import get_sensor_store
+
+    store_dir = get_sensor_store()
+    store_arg = str(store_dir) if store_dir is not None else None
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(*payload, store_arg),
+    ) as executor:
+        return list(executor.map(_run_worker_job, jobs))
+
+
+__all__ = [
+    "RespondentSensorJob",
+    "coerce_job",
+    "is_picklable",
+    "run_respondent_jobs",
+]
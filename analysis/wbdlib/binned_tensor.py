@@ -0,0 +1,569 @@
+"""Dense respondent x metric x bin storage for binned time series.
+
+The long frame produced by :func:`wbdlib.timeseries.process_sensor_time_series`
+repeats every identifying string on every bin row. :class:`BinnedTensor`
+keeps one title/form (at one bin width) as dense ``(respondent, metric,
+bin)`` arrays instead: values are float32, counts int32, and missing or
+failing bins are tracked with boolean masks. Identifying labels live once on
+the axes. Cohort aggregation and ISC matrices are computed with masked numpy
+reductions, without pandas groupbys.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .isc import RespondentBinMatrix
+from .timeseries import (
+    _AGGREGATED_COLUMNS,
+    _BINNED_COLUMNS,
+    _empty_aggregated_frame,
+    _empty_binned_frame,
+)
+
+
+_VALUE_FIELDS = ("value_mean", "value_median", "value_std", "value_smoothed")
+_CELL_FIELDS = (
+    *_VALUE_FIELDS,
+    "sample_count",
+    "coverage",
+    "present",
+    "passes_coverage",
+)
+
+
+@dataclass(frozen=True)
+class BinnedTensor:
+    """Binned series for one title/form and bin width as dense arrays.
+
+    Cell arrays are shaped ``(respondents, metrics, bins)``. ``present``
+    marks cells that had samples, ``passes_coverage`` those that also met
+    the coverage threshold. ``bins`` spans every bin index from the first to
+    the last observed one.
+    """
+
+    title: object
+    form: object
+    bin_width: float
+    respondents: pd.Index
+    groups: pd.Categorical
+    raw_stimuli: pd.Categorical
+    metrics: pd.MultiIndex
+    smoothing_labels: tuple[object, ...]
+    bins: np.ndarray
+    value_mean: np.ndarray
+    value_median: np.ndarray
+    value_std: np.ndarray
+    value_smoothed: np.ndarray
+    sample_count: np.ndarray
+    coverage: np.ndarray
+    present: np.ndarray
+    passes_coverage: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.present.shape
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the cell arrays and bin axis."""
+
+        return int(
+            sum(getattr(self, name).nbytes for name in _CELL_FIELDS)
+            + self.bins.nbytes
+        )
+
+    @property
+    def bin_start(self) -> np.ndarray:
+        return self.bins * self.bin_width
+
+    @property
+    def bin_end(self) -> np.ndarray:
+        return (self.bins + 1) * self.bin_width
+
+    @property
+    def bin_midpoint(self) -> np.ndarray:
+        return (self.bins + 0.5) * self.bin_width
+
+    def subset(
+        self,
+        *,
+        respondents: Iterable[object] | None = None,
+        groups: Iterable[object] | None = None,
+        metrics: Iterable[str | tuple[str, str]] | None = None,
+        bins: slice | Sequence[int] | None = None,
+    ) -> "BinnedTensor":
+        """Return the tensor restricted to the given axis labels.
+
+        ``metrics`` accepts metric names or ``(sensor, metric)`` tuples and
+        ``bins`` accepts bin indices or a slice of bin indices.
+        """
+
+        respondent_mask = np.ones(len(self.respondents), dtype=bool)
+        if respondents is not None:
+            respondent_mask &= self.respondents.isin(list(respondents))
+        if groups is not None:
+            respondent_mask &= np.isin(
+                np.asarray(self.groups, dtype=object),
+                list(groups),
+            )
+        respondent_idx = np.flatnonzero(respondent_mask)
+        metric_idx = (
+            np.arange(len(self.metrics))
+            if metrics is None
+            else np.asarray(
+                [self.metric_position(metric) for metric in metrics],
+                dtype=np.int64,
+            )
+        )
+        if bins is None:
+            bin_idx = np.arange(self.bins.size)
+        elif isinstance(bins, slice):
+            bin_idx = np.flatnonzero(
+                (self.bins >= (self.bins[0] if bins.start is None else bins.start))
+                & (self.bins < (self.bins[-1] + 1 if bins.stop is None else bins.stop))
+            )
+        else:
+            bin_idx = np.searchsorted(self.bins, np.asarray(bins))
+            if (
+                np.any(bin_idx >= self.bins.size)
+                or np.any(self.bins[bin_idx] != np.asarray(bins))
+            ):
+                raise KeyError("Requested bins are outside the tensor")
+
+        cells = {
+            name: getattr(self, name)[np.ix_(respondent_idx, metric_idx, bin_idx)]
+            for name in _CELL_FIELDS
+        }
+        return replace(
+            self,
+            respondents=self.respondents[respondent_idx],
+            groups=self.groups[respondent_idx],
+            raw_stimuli=self.raw_stimuli[respondent_idx],
+            metrics=self.metrics[metric_idx],
+            smoothing_labels=tuple(self.smoothing_labels[i] for i in metric_idx),
+            bins=self.bins[bin_idx],
+            **cells,
+        )
+
+    def metric_position(self, metric: str | tuple[str, str]) -> int:
+        """Return the metric-axis position of a metric name or tuple."""
+
+        if isinstance(metric, tuple):
+            return int(self.metrics.get_loc(metric))
+        matches = np.flatnonzero(
+            self.metrics.get_level_values("metric") == metric
+        )
+        if matches.size != 1:
+            raise KeyError(
+                f"Metric {metric!r} matches {matches.size} tensor metrics"
+            )
+        return int(matches[0])
+
+    def masked(
+        self,
+        field: str = "value_smoothed",
+        *,
+        passes_only: bool = True,
+    ) -> np.ndarray:
+        """Return ``field`` as float64 with excluded cells set to NaN."""
+
+        if field not in _VALUE_FIELDS and field != "coverage":
+            raise KeyError(f"Unknown tensor field {field!r}")
+        mask = self.passes_coverage if passes_only else self.present
+        return np.where(mask, getattr(self, field).astype(float), np.nan)
+
+    def reduce(
+        self,
+        field: str = "value_smoothed",
+        *,
+        how: str = "mean",
+        passes_only: bool = True,
+    ) -> np.ndarray:
+        """Reduce ``field`` over respondents to a (metrics x bins) array.
+
+        ``how`` is ``"mean"``, ``"median"``, ``"std"`` (ddof=1) or
+        ``"count"``; cells without contributors are NaN (0 for counts).
+        """
+
+        values = self.masked(field, passes_only=passes_only)
+        counts = np.isfinite(values).sum(axis=0)
+        if how == "count":
+            return counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            total = np.where(np.isfinite(values), values, 0.0).sum(axis=0)
+            mean = np.where(counts > 0, total / counts, np.nan)
+            if how == "mean":
+                return mean
+            if how == "std":
+                deviations = np.where(np.isfinite(values), values - mean, 0.0)
+                return np.where(
+                    counts > 1,
+                    np.sqrt((deviations * deviations).sum(axis=0) / (counts - 1)),
+                    np.nan,
+                )
+        if how == "median":
+            sorted_values = np.sort(values, axis=0)
+            lower = np.clip((counts - 1) // 2, 0, None)
+            upper = np.clip(counts // 2, 0, None)
+            median = 0.5 * (
+                np.take_along_axis(sorted_values, lower[None], axis=0)[0]
+                + np.take_along_axis(sorted_values, upper[None], axis=0)[0]
+            )
+            return np.where(counts > 0, median, np.nan)
+        raise ValueError(f"Unknown reduction {how!r}")
+
+    def respondent_matrix(
+        self,
+        metric: str | tuple[str, str],
+        *,
+        field: str = "value_smoothed",
+        passes_only: bool = True,
+        group: object | None = None,
+    ) -> RespondentBinMatrix:
+        """Return one metric as a respondent x bin matrix for ISC.
+
+        Respondents are sorted and those without any usable bin are dropped,
+        matching :func:`wbdlib.isc.pivot_respondent_bins`.
+        """
+
+        values = self.masked(field, passes_only=passes_only)[
+            :, self.metric_position(metric), :
+        ]
+        keep = np.isfinite(values).any(axis=1)
+        if group is not None:
+            keep &= np.asarray(self.groups, dtype=object) == group
+        rows = np.flatnonzero(keep)
+        order = rows[np.argsort(self.respondents[rows], kind="stable")]
+        return RespondentBinMatrix(
+            respondents=tuple(self.respondents[order]),
+            bins=self.bins.copy(),
+            values=np.ascontiguousarray(values[order]),
+            bin_start=self.bin_start,
+            bin_end=self.bin_end,
+            bin_midpoint=self.bin_midpoint,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Expand back to the long ``_BINNED_COLUMNS`` frame.
+
+        Rows are ordered by respondent, metric and bin. Values come back as
+        float64 but carry the tensor's storage precision.
+        """
+
+        r_idx, m_idx, b_idx = np.nonzero(self.present)
+        if r_idx.size == 0:
+            return _empty_binned_frame()
+        bins = self.bins[b_idx]
+        frame = pd.DataFrame(
+            {
+                "respondent_id": self.respondents.take(r_idx),
+                "group": np.asarray(self.groups, dtype=object)[r_idx],
+                "title": self.title,
+                "form": self.form,
+                "sensor": self.metrics.get_level_values("sensor")[m_idx],
+                "metric": self.metrics.get_level_values("metric")[m_idx],
+                "raw_stimulus": np.asarray(self.raw_stimuli, dtype=object)[r_idx],
+                "bin_width": self.bin_width,
+                "smoothing_label": pd.Series(
+                    np.asarray(self.smoothing_labels, dtype=object)[m_idx],
+                    dtype=object,
+                ),
+                "bin": bins,
+                "bin_start": bins * self.bin_width,
+                "bin_end": (bins + 1) * self.bin_width,
+                "bin_midpoint": (bins + 0.5) * self.bin_width,
+                **{
+                    name: getattr(self, name)[r_idx, m_idx, b_idx].astype(float)
+                    for name in ("value_mean", "value_median", "value_std")
+                },
+                "sample_count": self.sample_count[r_idx, m_idx, b_idx].astype(
+                    np.int64
+                ),
+                "coverage": self.coverage[r_idx, m_idx, b_idx].astype(float),
+                "passes_coverage": self.passes_coverage[r_idx, m_idx, b_idx],
+                "value_smoothed": self.value_smoothed[r_idx, m_idx, b_idx].astype(
+                    float
+                ),
+            }
+        )
+        return frame[_BINNED_COLUMNS]
+
+
+def _axis_codes(values: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    codes, uniques = pd.factorize(values.to_numpy(), sort=False)
+    return codes, pd.Index(uniques)
+
+
+_CELL_KEYS = ["respondent_id", "sensor", "metric", "bin"]
+
+
+def _merge_duplicate_cells(frame: pd.DataFrame) -> pd.DataFrame:
+    """Collapse rows that share a respondent/metric/bin into one cell.
+
+    This happens when two raw stimulus labels resolve to the same
+    title/form. Values and coverage are averaged and sample counts summed;
+    when some of the rows pass coverage only those are kept.
+    """
+
+    if not frame.duplicated(_CELL_KEYS).any():
+        return frame
+    passes = frame["passes_coverage"].astype(bool)
+    any_passing = passes.groupby(
+        [frame[key] for key in _CELL_KEYS],
+        sort=False,
+        dropna=False,
+        observed=True,
+    ).transform("any")
+    kept = frame.loc[passes | ~any_passing]
+    cells = kept.groupby(_CELL_KEYS, sort=False, dropna=False, observed=True)
+    merged = cells.agg(
+        {
+            **{name: "mean" for name in _VALUE_FIELDS},
+            "coverage": "mean",
+            "sample_count": "sum",
+            "passes_coverage": "any",
+            "group": "first",
+            "raw_stimulus": "first",
+            "smoothing_label": "first",
+        }
+    )
+    return merged.reset_index()
+
+
+def _tensor_from_group(
+    frame: pd.DataFrame,
+    title: object,
+    form: object,
+    bin_width: float,
+    dtype: np.dtype,
+) -> BinnedTensor:
+    frame = _merge_duplicate_cells(frame)
+    respondent_codes, respondents = _axis_codes(frame["respondent_id"])
+    metric_keys = pd.MultiIndex.from_frame(
+        frame[["sensor", "metric"]].astype(object)
+    )
+    metric_codes, metrics = pd.factorize(metric_keys, sort=False)
+    metrics = pd.MultiIndex.from_tuples(list(metrics), names=["sensor", "metric"])
+    bin_values = frame["bin"].to_numpy(dtype=np.int64)
+    first_bin = int(bin_values.min())
+    bins = np.arange(first_bin, int(bin_values.max()) + 1, dtype=np.int64)
+    bin_codes = bin_values - first_bin
+
+    shape = (len(respondents), len(metrics), bins.size)
+    flat = np.ravel_multi_index((respondent_codes, metric_codes, bin_codes), shape)
+
+    def cells(column: str, fill: object, cell_dtype: np.dtype) -> np.ndarray:
+        out = np.full(shape, fill, dtype=cell_dtype)
+        out.flat[flat] = frame[column].to_numpy(dtype=cell_dtype)
+        return out
+
+    present = np.zeros(shape, dtype=bool)
+    present.flat[flat] = True
+    first_rows = np.unique(respondent_codes, return_index=True)[1]
+    metric_rows = np.unique(metric_codes, return_index=True)[1]
+    return BinnedTensor(
+        title=title,
+        form=form,
+        bin_width=float(bin_width),
+        respondents=respondents,
+        groups=pd.Categorical(frame["group"].to_numpy(dtype=object)[first_rows]),
+        raw_stimuli=pd.Categorical(
+            frame["raw_stimulus"].to_numpy(dtype=object)[first_rows]
+        ),
+        metrics=metrics,
+        smoothing_labels=tuple(
+            frame["smoothing_label"].to_numpy(dtype=object)[metric_rows]
+        ),
+        bins=bins,
+        value_mean=cells("value_mean", np.nan, dtype),
+        value_median=cells("value_median", np.nan, dtype),
+        value_std=cells("value_std", np.nan, dtype),
+        value_smoothed=cells("value_smoothed", np.nan, dtype),
+        sample_count=cells("sample_count", 0, np.dtype(np.int32)),
+        coverage=cells("coverage", np.nan, dtype),
+        present=present,
+        passes_coverage=cells("passes_coverage", False, np.dtype(bool)),
+    )
+
+
+def binned_tensors_from_frame(
+    binned: pd.DataFrame,
+    *,
+    dtype: np.dtype | type = np.float32,
+) -> dict[tuple[object, object, float], BinnedTensor]:
+    """Split a ``_BINNED_COLUMNS`` frame into tensors keyed by title/form.
+
+    Keys are ``(title, form, bin_width)`` because metrics binned at
+    different widths do not share a bin axis. ``dtype`` sets the storage
+    precision of the value arrays. Repeated respondent/metric/bin rows (two
+    raw stimuli resolving to one title/form) are averaged into one cell.
+    """
+
+    missing = set(_BINNED_COLUMNS).difference(binned.columns)
+    if missing:
+        raise KeyError(
+            "binned frame missing required columns: "
+            + ", ".join(sorted(missing))
+        )
+    tensors: dict[tuple[object, object, float], BinnedTensor] = {}
+    if binned.empty:
+        return tensors
+    for (title, form, bin_width), group_df in binned.groupby(
+        ["title", "form", "bin_width"],
+        sort=True,
+        dropna=False,
+        observed=True,
+    ):
+        tensors[(title, form, float(bin_width))] = _tensor_from_group(
+            group_df,
+            title,
+            form,
+            bin_width,
+            np.dtype(dtype),
+        )
+    return tensors
+
+
+def binned_tensors_to_frame(
+    tensors: Mapping[object, BinnedTensor] | Iterable[BinnedTensor],
+) -> pd.DataFrame:
+    """Concatenate tensors back into one long binned frame."""
+
+    items = tensors.values() if isinstance(tensors, Mapping) else tensors
+    frames = [tensor.to_frame() for tensor in items]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return _empty_binned_frame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def aggregate_binned_tensor(
+    tensor: BinnedTensor,
+    *,
+    min_contributors: int | None = None,
+    pooled_group: str | None = None,
+) -> pd.DataFrame:
+    """Cohort aggregates per group, matching ``aggregate_binned_time_series``.
+
+    ``pooled_group`` aggregates every respondent under that one label, the
+    tensor equivalent of ``binned.assign(group=...)`` on the long frame.
+    """
+
+    frames: list[pd.DataFrame] = []
+    group_labels = np.asarray(tensor.groups, dtype=object)
+    if pooled_group is not None:
+        group_labels = np.full(group_labels.shape, pooled_group, dtype=object)
+    n_metrics, n_bins = len(tensor.metrics), tensor.bins.size
+    metric_idx, bin_idx = np.divmod(np.arange(n_metrics * n_bins), n_bins)
+    for group in pd.unique(group_labels):
+        members = tensor.subset(
+            respondents=tensor.respondents[group_labels == group]
+        )
+        contributors = members.reduce("value_mean", how="count").ravel()
+        keep = contributors > 0
+        if min_contributors:
+            keep &= contributors >= min_contributors
+        if not keep.any():
+            continue
+        count = np.maximum(contributors, 1).astype(float)
+        passes = members.passes_coverage
+        stats = {
+            "contributors": contributors,
+            "total_samples": np.where(passes, members.sample_count, 0)
+            .sum(axis=0)
+            .ravel(),
+            "mean_value": members.reduce("value_mean").ravel(),
+            "median_value": members.reduce("value_mean", how="median").ravel(),
+            "std_value": np.nan_to_num(
+                members.reduce("value_mean", how="std").ravel()
+            ),
+            "mean_smoothed": members.reduce("value_smoothed").ravel(),
+            "median_smoothed": members.reduce(
+                "value_smoothed",
+                how="median",
+            ).ravel(),
+            "std_smoothed": np.nan_to_num(
+                members.reduce("value_smoothed", how="std").ravel()
+            ),
+            "mean_coverage": members.reduce("coverage").ravel(),
+        }
+        stats["sem_value"] = stats["std_value"] / np.sqrt(count)
+        stats["sem_smoothed"] = stats["std_smoothed"] / np.sqrt(count)
+        stats["ci95_low"] = stats["mean_value"] - 1.96 * stats["sem_value"]
+        stats["ci95_high"] = stats["mean_value"] + 1.96 * stats["sem_value"]
+        stats["ci95_low_smoothed"] = (
+            stats["mean_smoothed"] - 1.96 * stats["sem_smoothed"]
+        )
+        stats["ci95_high_smoothed"] = (
+            stats["mean_smoothed"] + 1.96 * stats["sem_smoothed"]
+        )
+        bins = tensor.bins[bin_idx]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "group": group,
+                    "title": tensor.title,
+                    "form": tensor.form,
+                    "sensor": tensor.metrics.get_level_values("sensor")[
+                        metric_idx
+                    ],
+                    "metric": tensor.metrics.get_level_values("metric")[
+                        metric_idx
+                    ],
+                    "bin_width": tensor.bin_width,
+                    "smoothing_label": np.asarray(
+                        tensor.smoothing_labels,
+                        dtype=object,
+                    )[metric_idx],
+                    "bin": bins,
+                    "bin_start": bins * tensor.bin_width,
+                    "bin_end": (bins + 1) * tensor.bin_width,
+                    "bin_midpoint": (bins + 0.5) * tensor.bin_width,
+                    **stats,
+                }
+            ).loc[keep, _AGGREGATED_COLUMNS]
+        )
+    if not frames:
+        return _empty_aggregated_frame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def aggregate_binned_tensors(
+    tensors: Mapping[object, BinnedTensor] | Iterable[BinnedTensor],
+    *,
+    min_contributors: int | None = None,
+    pooled_group: str | None = None,
+) -> pd.DataFrame:
+    """Aggregate many tensors into one frame sorted like the long-form path."""
+
+    items = tensors.values() if isinstance(tensors, Mapping) else tensors
+    frames = [
+        aggregate_binned_tensor(
+            tensor,
+            min_contributors=min_contributors,
+            pooled_group=pooled_group,
+        )
+        for tensor in items
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return _empty_aggregated_frame()
+    aggregated = pd.concat(frames, ignore_index=True)
+    return aggregated.sort_values(
+        ["title", "form", "sensor", "metric", "bin"],
+        kind="stable",
+    ).reset_index(drop=True)
+
+
+__all__ = [
+    "BinnedTensor",
+    "aggregate_binned_tensor",
+    "aggregate_binned_tensors",
+    "binned_tensors_from_frame",
+    "binned_tensors_to_frame",
+]
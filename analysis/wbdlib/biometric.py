@@ -1,13 +1,32 @@
 
 from __future__ import annotations
 
+import re
+import warnings
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Callable, Iterable, Literal, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
 
-from .stats import one_tailed_p_from_paired_t
+from .outliers import (
+    DEFAULT_OUTLIER_METHOD,
+    OUTLIER_AUDIT_COLUMNS,
+    OutlierAction,
+    OutlierMethod,
+    detect_outliers,
+    outlier_audit,
+    paired_outlier_columns,
+    winsorize,
+)
+from .stats import (
+    CorrectionMethod,
+    adjust_p_values,
+    one_tailed_paired_t_matrix,
+    paired_resampling_test,
+)
 
 
 def bin_biometric_time_series(
@@ -57,46 +76,62 @@ def bin_biometric_time_series(
         DataFrame with binned (and optionally smoothed) values, preserving group
         columns and bin label.
     """
-    df = long_df.copy()
-    if time_col not in df.columns:
+    if time_col not in long_df.columns:
         raise ValueError(f"Time column '{time_col}' not found in DataFrame.")
-    if value_col not in df.columns:
+    if value_col not in long_df.columns:
         raise ValueError(f"Value column '{value_col}' not found in DataFrame.")
-    # Ensure time is float
-    df[time_col] = pd.to_numeric(df[time_col], errors="coerce")
+    groupby_cols = list(groupby_cols)
+    df = long_df[[*groupby_cols, value_col]].assign(
+        **{time_col: pd.to_numeric(long_df[time_col], errors="coerce")}
+    )
     df = df.dropna(subset=[time_col, value_col])
     # Set min/max time
-    min_t = min_time if min_time is not None else df[time_col].min()
-    max_t = max_time if max_time is not None else df[time_col].max()
-    # Clip to range
-    df = df[(df[time_col] >= min_t) & (df[time_col] <= max_t)]
-    # Compute bin edges and assign bins
-    bin_edges = np.arange(min_t, max_t + bin_width, bin_width)
-    df[bin_label] = pd.cut(
-        df[time_col], bins=bin_edges, right=False, labels=bin_edges[:-1]
+    times = df[time_col].to_numpy(dtype=float)
+    min_t = min_time if min_time is not None else times.min(initial=np.inf)
+    max_t = max_time if max_time is not None else times.max(initial=-np.inf)
+    # Assign bins with the same half-open edges pd.cut(right=False) used;
+    # times past the last edge fall outside every bin and are dropped.
+    bin_edges = (
+        np.arange(min_t, max_t + bin_width, bin_width)
+        if min_t <= max_t
+        else np.empty(0)
+    )
+    positions = np.searchsorted(bin_edges, times, side="right") - 1
+    keep = (
+        (times >= min_t)
+        & (times <= max_t)
+        & (positions >= 0)
+        & (positions < bin_edges.size - 1)
     )
-    # Convert bin label to float
-    df[bin_label] = df[bin_label].astype(float)
-    # Group and aggregate
-    agg_cols = list(groupby_cols) + [bin_label]
+    df = df.loc[keep]
+    df[bin_label] = bin_edges[positions[keep]]
+    # Group and aggregate; the result is sorted by group, then bin.
+    agg_cols = groupby_cols + [bin_label]
     binned = (
         df.groupby(agg_cols, observed=True)[value_col]
         .mean()
         .reset_index()
     )
-    # Optional smoothing per group
-    if smoothing is not None:
-        def _apply_smooth(subdf):
-            subdf = subdf.sort_values(bin_label)
-            subdf[value_col] = smoothing(subdf[value_col])
-            return subdf
-        binned = (
-            binned.groupby(groupby_cols, group_keys=False, observed=True)
-            .apply(_apply_smooth)
-            .reset_index(drop=True)
+    # Optional smoothing per group over one contiguous array.
+    if smoothing is not None and not binned.empty:
+        from .timeseries import smooth_segments
+
+        keys = binned.groupby(
+            groupby_cols,
+            observed=True,
+            sort=False,
+        ).ngroup().to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        binned[value_col] = smooth_segments(
+            binned[value_col].to_numpy(dtype=float),
+            starts,
+            smoothing,
         )
 
-    return binned
+    # Imported here because the schema draws its category sets from this module.
+    from .schema import apply_long_schema
+
+    return apply_long_schema(binned)
 
 
 # Biometric data helpers shared across notebooks.
@@ -113,7 +148,7 @@ KNOWN_SENSORS: tuple[str, ...] = (
     "Survey",
 )
 
-# Stats observed in the biometric UV. We rely on the longest suffix match to
+# Stats observed in the biometric UV. We rely on the shortest suffix match to
 # separate metric and stat tokens when parsing column headers.
 KNOWN_STATS: tuple[str, ...] = (
     "AUC",
@@ -199,86 +234,7 @@ KNOWN_STATS: tuple[str, ...] = (
     "WBD5",
 )
 
-OutlierMethod = Literal["iqr", "zscore"]
-DEFAULT_OUTLIER_METHOD: OutlierMethod = "iqr"
-
-
-def _iqr_bounds(
-    series: pd.Series, *, whisker_width: float = 1.5
-) -> tuple[float, float] | None:
-    """Return Tukey IQR bounds for the provided series."""
-
-    finite = series.dropna()
-    if finite.empty:
-        return None
-    q1 = finite.quantile(0.25)
-    q3 = finite.quantile(0.75)
-    iqr = q3 - q1
-    if not np.isfinite(iqr) or iqr == 0:
-        return None
-    lower = q1 - whisker_width * iqr
-    upper = q3 + whisker_width * iqr
-    return float(lower), float(upper)
-
-
-def _z_scores(series: pd.Series) -> pd.Series | None:
-    """Return z-scores for the provided series, or None if undefined."""
-
-    finite = series.dropna()
-    if finite.empty:
-        return None
-    std = finite.std(ddof=0)
-    if not np.isfinite(std) or std == 0:
-        return None
-    mean = float(finite.mean())
-    return (series - mean) / std
-
-
-def _identify_outlier_rows(
-    pivot: pd.DataFrame,
-    *,
-    method: OutlierMethod,
-    whisker_width: float = 1.5,
-    z_threshold: float = 3.0,
-) -> pd.Series:
-    """Return boolean mask covering respondents flagged as outliers."""
-
-    if pivot.empty:
-        return pd.Series(False, index=pivot.index, dtype=bool)
-
-    mask = pd.Series(False, index=pivot.index, dtype=bool)
-    value_columns = [col for col in ("Long", "Short") if col in pivot.columns]
-    if not value_columns:
-        return mask
-
-    if method == "iqr":
-        for column in value_columns:
-            bounds = _iqr_bounds(pivot[column], whisker_width=whisker_width)
-            if bounds is None:
-                continue
-            lower, upper = bounds
-            mask = mask | (pivot[column] < lower) | (pivot[column] > upper)
-        if set(value_columns) == {"Long", "Short"}:
-            diff = pivot["Long"] - pivot["Short"]
-            bounds = _iqr_bounds(diff, whisker_width=whisker_width)
-            if bounds is not None:
-                lower, upper = bounds
-                mask = mask | (diff < lower) | (diff > upper)
-    elif method == "zscore":
-        for column in value_columns:
-            z_scores = _z_scores(pivot[column])
-            if z_scores is None:
-                continue
-            mask = mask | (z_scores.abs() > z_threshold)
-        if set(value_columns) == {"Long", "Short"}:
-            diff = pivot["Long"] - pivot["Short"]
-            z_scores = _z_scores(diff)
-            if z_scores is not None:
-                mask = mask | (z_scores.abs() > z_threshold)
-    else:
-        raise ValueError(f"Unsupported outlier method '{method}'")
-
-    return mask.fillna(False)
+WithinSubjectTest = Literal["t", "bootstrap", "permutation"]
 
 
 # Common title corrections. Keys are stored in lower case for quick lookups.
@@ -323,6 +279,122 @@ def canonicalise_title(text: str) -> str:
     return _normalise_title(str(text))
 
 
+# Sentinel marking a complete stat inside the suffix trie.
+_STAT_END = object()
+
+# Distinct column strings remembered by each header parser.
+_HEADER_MEMO_SIZE = 1 << 16
+
+
+def _build_stat_trie(known_stats: Iterable[str]) -> dict:
+    """Nest the underscore tokens of each stat, read right to left."""
+
+    root: dict = {}
+    for stat in known_stats:
+        node = root
+        for token in reversed(stat.split("_")):
+            node = node.setdefault(token, {})
+        node[_STAT_END] = stat
+    return root
+
+
+def _stat_suffix_length(tokens: Sequence[str], trie: dict) -> int:
+    """Token count of the shortest known-stat suffix that leaves a metric.
+
+    Returns 0 when no such suffix exists.
+    """
+
+    node = trie
+    for size in range(1, len(tokens)):
+        node = node.get(tokens[-size])
+        if node is None:
+            return 0
+        if _STAT_END in node:
+            return size
+    return 0
+
+
+class _HeaderParser:
+    """Header parser with a precompiled sensor set and stat trie.
+
+    ``parse`` is memoised per column string, so re-reading the same UV
+    header is a cache lookup.
+    """
+
+    def __init__(
+        self,
+        sensors: Iterable[str],
+        known_stats: Iterable[str],
+    ) -> None:
+        self.sensors = frozenset(sensor.strip() for sensor in sensors)
+        self.stat_trie = _build_stat_trie(known_stats)
+        self.parse = lru_cache(maxsize=_HEADER_MEMO_SIZE)(self._parse)
+
+    def split_tail(
+        self,
+        tokens: Sequence[str],
+    ) -> tuple[str, Sequence[str]] | None:
+        if len(tokens) < 2:
+            return None
+        size = _stat_suffix_length(tokens, self.stat_trie) or 1
+        return "_".join(tokens[-size:]), tokens[:-size]
+
+    def _parse(self, column: str) -> BiometricHeader | None:
+        if "_" not in column:
+            return None
+        tokens = column.split("_")
+        if tokens[0] not in FORM_ORDER:
+            return None
+        form = tokens[0]
+        sensor_index = None
+        for idx in range(1, len(tokens)):
+            token = tokens[idx].strip()
+            if token in self.sensors:
+                sensor_index = idx
+                sensor = token
+                break
+        if sensor_index is None or sensor_index + 1 >= len(tokens):
+            return None
+        raw_title_tokens = tokens[1:sensor_index]
+        if not raw_title_tokens:
+            return None
+        title = _normalise_title("_".join(raw_title_tokens))
+        parsed_tail = self.split_tail(tokens[sensor_index + 1:])
+        if not parsed_tail:
+            return None
+        stat, metric_tokens = parsed_tail
+        metric = "_".join(metric_tokens)
+        if not metric:
+            return None
+        return BiometricHeader(
+            form=form,
+            title=title,
+            sensor=sensor,
+            metric=metric,
+            stat=stat,
+            column=column,
+        )
+
+
+@lru_cache(maxsize=8)
+def _header_parser(
+    sensors: tuple[str, ...],
+    known_stats: tuple[str, ...],
+) -> _HeaderParser:
+    return _HeaderParser(sensors, known_stats)
+
+
+def _get_header_parser(
+    sensors: Sequence[str],
+    known_stats: Sequence[str],
+) -> _HeaderParser:
+    """Return the memoised parser for a sensor/stat catalogue."""
+
+    if sensors is KNOWN_SENSORS and known_stats is KNOWN_STATS:
+        return _DEFAULT_HEADER_PARSER
+    return _header_parser(tuple(sensors), tuple(known_stats))
+
+
 def _stat_from_tokens(
     tokens: Sequence[str],
     *,
@@ -330,20 +402,7 @@ def _stat_from_tokens(
 ) -> tuple[str, Sequence[str]] | None:
     """Return (stat, metric_tokens) given the tail tokens of a header."""
 
-    if len(tokens) < 2:
-        return None
-    stats_set = set(known_stats)
-    for size in range(1, len(tokens) + 1):
-        stat_candidate = "_".join(tokens[-size:])
-        if stat_candidate in stats_set:
-            metric_tokens = tokens[:-size]
-            if metric_tokens:
-                return stat_candidate, metric_tokens
-    stat_candidate = tokens[-1]
-    metric_tokens = tokens[:-1]
-    if metric_tokens:
-        return stat_candidate, metric_tokens
-    return None
+    return _get_header_parser(KNOWN_SENSORS, known_stats).split_tail(tokens)
 
 
 def parse_biometric_header(
@@ -352,44 +411,17 @@ def parse_biometric_header(
     sensors: Sequence[str] = KNOWN_SENSORS,
     known_stats: Sequence[str] = KNOWN_STATS,
 ) -> BiometricHeader | None:
-    """Parse a UV biometric column into its constituent components."""
-
-    if "_" not in column:
-        return None
-    tokens = column.split("_")
-    if not tokens or tokens[0] not in FORM_ORDER:
-        return None
-    form = tokens[0]
-    sensors_set = {sensor.strip() for sensor in sensors}
-    sensor_index = None
-    for idx in range(1, len(tokens)):
-        token = tokens[idx].strip()
-        if token in sensors_set:
-            sensor_index = idx
-            sensor = token
-            break
-    if sensor_index is None or sensor_index + 1 >= len(tokens):
-        return None
-    raw_title_tokens = tokens[1:sensor_index]
-    if not raw_title_tokens:
-        return None
-    title = _normalise_title("_".join(raw_title_tokens))
-    tail_tokens = tokens[sensor_index + 1:]
-    parsed_tail = _stat_from_tokens(tail_tokens, known_stats=known_stats)
-    if not parsed_tail:
-        return None
-    stat, metric_tokens = parsed_tail
-    metric = "_".join(metric_tokens)
-    if not metric:
-        return None
-    return BiometricHeader(
-        form=form,
-        title=title,
-        sensor=sensor,
-        metric=metric,
-        stat=stat,
-        column=column,
-    )
+    """Parse a UV biometric column into its constituent components.
+
+    The stat is the shortest suffix of the tokens after the sensor that is
+    in ``known_stats`` and leaves a metric, falling back to the last token.
+    Results are memoised per column for each sensor/stat catalogue.
+    """
+
+    return _get_header_parser(sensors, known_stats).parse(column)
+
+
+_DEFAULT_HEADER_PARSER = _HeaderParser(KNOWN_SENSORS, KNOWN_STATS)
 
 
 def _default_id_column(df: pd.DataFrame) -> str:
@@ -406,6 +438,82 @@ def _default_id_column(df: pd.DataFrame) -> str:
     return df.columns[0]
 
 
+_HEADER_FIELDS: tuple[str, ...] = ("form", "title", "sensor", "metric", "stat")
+
+
+@lru_cache(maxsize=16)
+def _header_catalogue(
+    columns: tuple[object, ...],
+    sensors: tuple[str, ...],
+    known_stats: tuple[str, ...],
+) -> pd.DataFrame:
+    records = []
+    for position, column in enumerate(columns):
+        if not isinstance(column, str):
+            continue
+        header = parse_biometric_header(
+            column,
+            sensors=sensors,
+            known_stats=known_stats,
+        )
+        if header:
+            fields = (getattr(header, field) for field in _HEADER_FIELDS)
+            records.append((column, position, *fields))
+    return pd.DataFrame.from_records(
+        records,
+        columns=["column", "position", *_HEADER_FIELDS],
+    ).set_index("column")
+
+
+def _column_key(columns: Iterable[object]) -> tuple[object, ...]:
+    """Hashable key for a column set; ``Index.tolist`` avoids slow boxing."""
+
+    if isinstance(columns, pd.Index):
+        return tuple(columns.tolist())
+    return tuple(columns)
+
+
+def biometric_header_catalogue(
+    columns: Iterable[object],
+    *,
+    sensors: Sequence[str] = KNOWN_SENSORS,
+    known_stats: Sequence[str] = KNOWN_STATS,
+) -> pd.DataFrame:
+    """Return the parsed biometric headers among ``columns`` as a table.
+
+    One row per parseable column, indexed by column name, with its
+    ``position`` in ``columns`` and the ``BiometricHeader`` fields. Parsing
+    is cached per column set, so repeated calls on the same UV are cheap.
+    """
+
+    return _header_catalogue(
+        _column_key(columns),
+        tuple(sensors),
+        tuple(known_stats),
+    ).copy()
+
+
+def _numeric_block(block: pd.DataFrame) -> np.ndarray:
+    """Coerce ``block`` to a float matrix in one pass per dtype kind."""
+
+    values = np.empty(block.shape, dtype=float)
+    numeric = block.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(
+        dtype=bool
+    )
+    if numeric.any():
+        values[:, numeric] = block.iloc[:, numeric].to_numpy(
+            dtype=float,
+            na_value=np.nan,
+        )
+    if not numeric.all():
+        other = block.iloc[:, ~numeric].to_numpy(dtype=object)
+        values[:, ~numeric] = pd.to_numeric(
+            other.ravel(),
+            errors="coerce",
+        ).reshape(other.shape)
+    return values
+
+
 def reshape_biometric_long(
     df: pd.DataFrame,
     *,
@@ -415,68 +523,69 @@ def reshape_biometric_long(
     id_column: str | None = None,
     dropna: bool = True,
 ) -> pd.DataFrame:
-    """Convert wide biometric UV data into a tidy long-form table."""
+    """Convert wide biometric UV data into a tidy long-form table.
+
+    Headers come from :func:`biometric_header_catalogue`; the selected
+    columns are converted to numbers once and melted column by column, so
+    rows are ordered by column and then by respondent.
+
+    ``value`` is float32 (see :mod:`wbdlib.schema`). Downstream statistics
+    upcast to float64 but start from the rounded scores, so they differ
+    from float64 input at float32 precision (relative error around 1e-7),
+    and a score lying on an outlier fence can change side.
+    """
+
+    from .schema import apply_long_schema
 
     target_sensors = (
         tuple(sensors) if sensors is not None else ("EEG", "ET", "FAC", "GSR")
     )
     sensor_set = {sensor.strip() for sensor in target_sensors}
     id_col = id_column or _default_id_column(df)
-    respondent_series = df[id_col].astype(str)
-    title_set = None
+
+    catalogue = _header_catalogue(
+        _column_key(df.columns),
+        KNOWN_SENSORS,
+        KNOWN_STATS,
+    )
+    keep = catalogue["sensor"].isin(sensor_set)
     if titles is not None:
         title_set = {_normalise_title(title).lower() for title in titles}
-    stats_set = None
+        keep &= catalogue["title"].str.lower().isin(title_set)
     if stats is not None:
-        stats_set = {stat for stat in stats}
-
-    frames: list[pd.DataFrame] = []
-    for column in df.columns:
-        header = parse_biometric_header(column)
-        if not header:
-            continue
-        if header.sensor not in sensor_set:
-            continue
-        if title_set is not None and header.title.lower() not in title_set:
-            continue
-        if stats_set is not None and header.stat not in stats_set:
-            continue
-        values = pd.to_numeric(df[column], errors="coerce")
-        frame = pd.DataFrame(
-            {
-                "respondent_id": respondent_series,
-                "form": header.form,
-                "title": header.title,
-                "sensor": header.sensor,
-                "metric": header.metric,
-                "stat": header.stat,
-                "value": values,
-            }
+        keep &= catalogue["stat"].isin(set(stats))
+    selected = catalogue.loc[keep]
+    if selected.empty:
+        return apply_long_schema(
+            pd.DataFrame(columns=["respondent_id", *_HEADER_FIELDS, "value"])
         )
-        if dropna:
-            frame = frame.dropna(subset=["value"])
-        frames.append(frame)
 
-    if not frames:
-        return pd.DataFrame(
-            columns=[
-                "respondent_id",
-                "form",
-                "title",
-                "sensor",
-                "metric",
-                "stat",
-                "value",
-            ]
-        )
-
-    long_df = pd.concat(frames, ignore_index=True)
-    long_df["form"] = pd.Categorical(
-        long_df["form"],
-        categories=FORM_ORDER,
-        ordered=True,
+    values = _numeric_block(df.iloc[:, selected["position"].to_numpy()])
+    n_rows, n_columns = values.shape
+    # Column-major order: every respondent for the first column, then the
+    # next column, matching one melt of the selected block.
+    value = values.ravel(order="F")
+    rows = np.tile(np.arange(n_rows), n_columns)
+    columns = np.repeat(np.arange(n_columns), n_rows)
+    if dropna:
+        finite = ~np.isnan(value)
+        value, rows, columns = value[finite], rows[finite], columns[finite]
+
+    respondents = apply_long_schema(
+        pd.DataFrame({"respondent_id": df[id_col].astype(str).to_numpy()})
+    )["respondent_id"].array
+    headers = apply_long_schema(selected[list(_HEADER_FIELDS)])
+    long_df = pd.DataFrame(
+        {
+            "respondent_id": respondents.take(rows),
+            **{
+                field: headers[field].array.take(columns)
+                for field in _HEADER_FIELDS
+            },
+            "value": value,
+        }
     )
-    return long_df
+    return apply_long_schema(long_df)
 
 
 @dataclass(frozen=True)
@@ -496,31 +605,40 @@ class WithinSubjectSummary:
     outlier_ids: tuple[object, ...]
     summary_row: Mapping[str, float | int | str]
     paired: pd.DataFrame
+    test: WithinSubjectTest = "t"
+    ci_low: float = np.nan
+    ci_high: float = np.nan
+    outliers_winsorised: int = 0
+    winsorised_ids: tuple[object, ...] = ()
+
+
+WITHIN_SUBJECT_SUMMARY_COLUMNS: tuple[str, ...] = (
+    "Metric",
+    "Stat",
+    "Long mean",
+    "Short mean",
+    "Difference",
+    "t statistic",
+    "df",
+    "p (one-tailed)",
+    "n paired",
+    "Outliers removed",
+)
 
+# Extra summary columns for the resampling tests: a percentile interval for
+# the mean paired difference (NaN under the permutation test).
+RESAMPLING_SUMMARY_COLUMNS: tuple[str, ...] = ("CI low", "CI high")
 
-def compute_within_subject_summary(
-    long_df: pd.DataFrame,
-    metric: str,
-    stat: str,
-    *,
-    id_column: str = "respondent_id",
-    outlier_method: OutlierMethod | None = DEFAULT_OUTLIER_METHOD,
-) -> WithinSubjectSummary:
-    """Return descriptive and inferential stats for a metric/stat pairing."""
-
-    columns = [
-        "Metric",
-        "Stat",
-        "Long mean",
-        "Short mean",
-        "Difference",
-        "t statistic",
-        "df",
-        "p (one-tailed)",
-        "n paired",
-        "Outliers removed",
-    ]
-    empty_summary = {
+# Extra summary column for ``outlier_action="winsorize"``: respondents whose
+# Long or Short score was clipped ("Outliers removed" is then zero).
+WINSORIZE_SUMMARY_COLUMNS: tuple[str, ...] = ("Outliers winsorised",)
+
+# Form order along the last axis of a within-subject score cube.
+_PAIRED_FORMS: tuple[str, str] = ("Long", "Short")
+
+
+def _empty_summary_row(metric: str, stat: str) -> dict[str, object]:
+    return {
         "Metric": metric,
         "Stat": stat,
         "Long mean": np.nan,
@@ -532,115 +650,301 @@ def compute_within_subject_summary(
         "n paired": 0,
         "Outliers removed": 0,
     }
-    subset = long_df.loc[
-        (long_df["metric"] == metric) & (long_df["stat"] == stat)
-    ]
-    if subset.empty:
-        paired_empty = pd.DataFrame(columns=["Long", "Short"])
+
+
+@dataclass(frozen=True)
+class WithinSubjectBatch:
+    """Paired long-vs-short results for many metric/stat keys at once.
+
+    ``scores`` is the (respondent x key x form) cube of mean values with
+    Long then Short on the last axis, ``outliers`` the (respondent x key)
+    mask removed before testing, ``winsorised`` the mask of respondents
+    clipped instead (``None`` unless winsorising) and ``summary`` one
+    ``summary_row`` per
+    key in ``keys`` order. :meth:`result` rebuilds the full
+    ``WithinSubjectSummary`` for a key on demand. ``test`` records which
+    test produced the p-values. ``cleaned`` is the cube the tests ran on
+    (outliers removed or winsorised) and ``audit`` lists every outlier flag
+    as returned by :func:`~wbdlib.outliers.outlier_audit`.
+    """
+
+    keys: tuple[tuple[str, str], ...]
+    respondents: pd.Index
+    scores: np.ndarray
+    outliers: np.ndarray
+    observed: np.ndarray
+    summary: pd.DataFrame
+    test: WithinSubjectTest = "t"
+    cleaned: np.ndarray | None = None
+    audit: pd.DataFrame | None = None
+    winsorised: np.ndarray | None = None
+
+    def key_position(self, metric: str, stat: str) -> int:
+        try:
+            return self.keys.index((metric, stat))
+        except ValueError:
+            raise KeyError((metric, stat)) from None
+
+    def result(self, metric: str, stat: str) -> WithinSubjectSummary:
+        """Return the ``WithinSubjectSummary`` for one metric/stat key."""
+
+        position = self.key_position(metric, stat)
+        summary_row = self.summary.iloc[position].to_dict()
+        outliers = self.outliers[:, position]
+        if self.cleaned is not None:
+            scores = self.cleaned[:, position]
+        else:
+            scores = np.where(
+                outliers[:, None],
+                np.nan,
+                self.scores[:, position],
+            )
+        both = np.isfinite(scores).all(axis=1)
+        if both.any():
+            paired = pd.DataFrame(
+                scores[both],
+                index=self.respondents[both],
+                columns=list(_PAIRED_FORMS),
+            )
+        else:
+            paired = pd.DataFrame(columns=list(_PAIRED_FORMS))
+        n_pairs = int(both.sum())
+        if self.winsorised is not None:
+            winsorised = self.winsorised[:, position]
+        else:
+            winsorised = np.zeros(len(self.respondents), dtype=bool)
         return WithinSubjectSummary(
             metric=metric,
             stat=stat,
-            long_mean=np.nan,
-            short_mean=np.nan,
-            difference=np.nan,
-            p_value=np.nan,
-            t_stat=np.nan,
-            df=0,
-            n_pairs=0,
-            outliers_removed=0,
-            outlier_ids=tuple(),
-            summary_row=empty_summary,
-            paired=paired_empty,
+            long_mean=float(summary_row["Long mean"]),
+            short_mean=float(summary_row["Short mean"]),
+            difference=float(summary_row["Difference"]),
+            p_value=float(summary_row["p (one-tailed)"]),
+            t_stat=float(summary_row["t statistic"]),
+            df=max(n_pairs - 1, 0),
+            n_pairs=n_pairs,
+            outliers_removed=int(outliers.sum()),
+            outlier_ids=tuple(self.respondents[outliers]),
+            summary_row=summary_row,
+            paired=paired,
+            test=self.test,
+            ci_low=float(summary_row.get("CI low", np.nan)),
+            ci_high=float(summary_row.get("CI high", np.nan)),
+            outliers_winsorised=int(winsorised.sum()),
+            winsorised_ids=tuple(self.respondents[winsorised]),
         )
 
-    pivot = subset.pivot_table(
-        index=id_column,
-        columns="form",
-        values="value",
-        aggfunc="mean",
+    def results(self) -> dict[tuple[str, str], WithinSubjectSummary]:
+        """Return every key's ``WithinSubjectSummary``."""
+
+        return {key: self.result(*key) for key in self.keys}
+
+
+def compute_within_subject_batch(
+    long_df: pd.DataFrame,
+    keys: Sequence[tuple[str, str]] | None = None,
+    *,
+    id_column: str = "respondent_id",
+    outlier_method: OutlierMethod | None = DEFAULT_OUTLIER_METHOD,
+    outlier_action: OutlierAction = "remove",
+    test: WithinSubjectTest = "t",
+    n_resamples: int = 10_000,
+    seed: int | np.random.Generator | None = None,
+) -> WithinSubjectBatch:
+    """Paired long-vs-short tests for many metric/stat keys in one pass.
+
+    ``keys`` lists (metric, stat) pairs and defaults to every pair in
+    ``long_df``. Values are averaged per respondent, key and form into one
+    cube; outlier masks, means and one-tailed paired t-tests are then
+    computed for all keys together. Each summary row matches
+    :func:`compute_within_subject_summary` for the same key.
+
+    ``test="bootstrap"`` or ``"permutation"`` takes "p (one-tailed)" from
+    :func:`~wbdlib.stats.paired_resampling_test` with ``n_resamples``
+    draws instead of the t distribution, and adds "CI low"/"CI high"
+    columns; the t statistic is still reported.
+
+    Outliers are screened on each key's Long, Short and Long-Short columns
+    (see :mod:`wbdlib.outliers`). ``outlier_action="remove"`` drops a
+    flagged respondent from the key; ``"winsorize"`` instead clips their
+    Long and Short scores to the bounds and keeps them, counting them under
+    "Outliers winsorised". The difference itself is not clipped, so a
+    respondent flagged only on Long-Short is kept unchanged and not counted;
+    the flag still appears in ``audit``.
+    """
+
+    if outlier_action not in ("remove", "winsorize"):
+        raise ValueError(
+            f"Unknown outlier action {outlier_action!r}; "
+            "expected 'remove' or 'winsorize'"
+        )
+    if test not in ("t", "bootstrap", "permutation"):
+        raise ValueError(
+            f"Unknown within-subject test {test!r}; "
+            "expected 't', 'bootstrap' or 'permutation'"
+        )
+
+    frame = long_df[[id_column, "metric", "stat", "form", "value"]]
+    if keys is None:
+        pairs = frame[["metric", "stat"]].drop_duplicates().astype(object)
+        keys = sorted(pairs.itertuples(index=False, name=None))
+    else:
+        keys = [tuple(key) for key in keys]
+        frame = frame.loc[
+            frame["metric"].isin({metric for metric, _ in keys})
+            & frame["stat"].isin({stat for _, stat in keys})
+        ]
+    keys = tuple(keys)
+    key_index = pd.MultiIndex.from_tuples(keys, names=["metric", "stat"])
+
+    means = frame.groupby(
+        [id_column, "metric", "stat", "form"],
         observed=True,
+    )["value"].mean()
+    levels = [
+        np.asarray(means.index.get_level_values(level), dtype=object)
+        for level in range(4)
+    ]
+    key_codes = key_index.get_indexer(
+        pd.MultiIndex.from_arrays([levels[1], levels[2]])
     )
-    if isinstance(pivot.columns, pd.MultiIndex):
-        pivot.columns = pivot.columns.droplevel(0)
-    outliers_removed = 0
-    outlier_ids: tuple[object, ...] = tuple()
-    if outlier_method is not None:
-        outlier_mask = _identify_outlier_rows(
-            pivot, method=outlier_method
+    form_codes = pd.Index(_PAIRED_FORMS).get_indexer(levels[3])
+    observed = np.zeros(len(keys), dtype=bool)
+    observed[key_codes[key_codes >= 0]] = True
+
+    keep = (key_codes >= 0) & (form_codes >= 0)
+    respondents = pd.Index(pd.unique(levels[0][keep])).sort_values()
+    scores = np.full((len(respondents), len(keys), 2), np.nan)
+    scores[
+        respondents.get_indexer(levels[0][keep]),
+        key_codes[keep],
+        form_codes[keep],
+    ] = means.to_numpy(dtype=float)[keep]
+    respondents = respondents.rename(id_column)
+
+    winsorised = None
+    if outlier_method is None:
+        outliers = np.zeros(scores.shape[:2], dtype=bool)
+        audit = pd.DataFrame(
+            columns=[id_column, "metric", "stat", *OUTLIER_AUDIT_COLUMNS]
+        )
+        clean = scores
+    else:
+        columns = paired_outlier_columns(scores)
+        flags = detect_outliers(columns, method=outlier_method)
+        outliers = flags.mask
+        audit = outlier_audit(
+            flags,
+            columns,
+            respondents,
+            keys,
+            id_column=id_column,
         )
-        outliers_removed = int(outlier_mask.sum())
-        if outliers_removed:
-            outlier_ids = tuple(pivot.index[outlier_mask])
-            pivot = pivot.loc[~outlier_mask]
+        if outlier_action == "winsorize":
+            clean = winsorize(scores, flags.lower[:, :2], flags.upper[:, :2])
+            winsorised = (flags.low[..., :2] | flags.high[..., :2]).any(axis=-1)
+            outliers = np.zeros_like(outliers)
         else:
-            outlier_ids = tuple()
-    long_scores = (
-        pivot["Long"]
-        if "Long" in pivot.columns
-        else pd.Series(dtype=float)
-    )
-    short_scores = (
-        pivot["Short"]
-        if "Short" in pivot.columns
-        else pd.Series(dtype=float)
-    )
-    long_mean = float(long_scores.mean()) if not long_scores.empty else np.nan
-    short_mean = (
-        float(short_scores.mean()) if not short_scores.empty else np.nan
+            clean = np.where(outliers[..., None], np.nan, scores)
+    long_scores, short_scores = clean[..., 0], clean[..., 1]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        long_mean = np.nanmean(long_scores, axis=0)
+        short_mean = np.nanmean(short_scores, axis=0)
+    difference = long_mean - short_mean
+
+    t_stat, df, p_value, n_pairs = one_tailed_paired_t_matrix(
+        long_scores,
+        short_scores,
     )
-    difference = (
-        long_mean - short_mean
-        if np.isfinite(long_mean) and np.isfinite(short_mean)
-        else np.nan
-    )
-    paired = pd.DataFrame(columns=["Long", "Short"])
-    p_value = np.nan
-    t_statistic = np.nan
-    df = 0
-    n_pairs = 0
-    try:
-        t_statistic, df, p_one, paired = one_tailed_p_from_paired_t(
+    outliers_removed = outliers.sum(axis=0)
+    columns = list(WITHIN_SUBJECT_SUMMARY_COLUMNS)
+    if test != "t":
+        p_value, ci_low, ci_high = paired_resampling_test(
             long_scores,
             short_scores,
+            test=test,
+            n_resamples=n_resamples,
+            seed=seed,
+        )
+        columns.extend(RESAMPLING_SUMMARY_COLUMNS)
+    if outlier_action == "winsorize":
+        columns.extend(WINSORIZE_SUMMARY_COLUMNS)
+        outliers_winsorised = (
+            np.zeros(len(keys), dtype=np.int64)
+            if winsorised is None
+            else winsorised.sum(axis=0)
         )
-        p_value = float(p_one)
-        t_statistic = float(t_statistic)
-        n_pairs = paired.shape[0]
-    except ValueError:
-        paired = pd.DataFrame(columns=["Long", "Short"])
 
-    summary_row = {
-        "Metric": metric,
-        "Stat": stat,
-        "Long mean": long_mean,
-        "Short mean": short_mean,
-        "Difference": difference,
-        "t statistic": t_statistic,
-        "df": df,
-        "p (one-tailed)": p_value,
-        "n paired": n_pairs,
-        "Outliers removed": outliers_removed,
-    }
-    for column in columns:
-        summary_row.setdefault(column, empty_summary[column])
-
-    return WithinSubjectSummary(
-        metric=metric,
-        stat=stat,
-        long_mean=long_mean,
-        short_mean=short_mean,
-        difference=difference,
-        p_value=p_value,
-        t_stat=t_statistic,
-        df=df,
-        n_pairs=n_pairs,
-        outliers_removed=outliers_removed,
-        outlier_ids=outlier_ids,
-        summary_row=summary_row,
-        paired=paired,
+    rows: list[Mapping[str, object]] = []
+    for position, (metric, stat) in enumerate(keys):
+        if not observed[position]:
+            row = _empty_summary_row(metric, stat)
+        else:
+            row = {
+                "Metric": metric,
+                "Stat": stat,
+                "Long mean": float(long_mean[position]),
+                "Short mean": float(short_mean[position]),
+                "Difference": float(difference[position]),
+                "t statistic": float(t_stat[position]),
+                "df": int(df[position]),
+                "p (one-tailed)": float(p_value[position]),
+                "n paired": int(n_pairs[position]),
+                "Outliers removed": int(outliers_removed[position]),
+            }
+        if test != "t":
+            row["CI low"] = float(ci_low[position])
+            row["CI high"] = float(ci_high[position])
+        if outlier_action == "winsorize":
+            row["Outliers winsorised"] = int(outliers_winsorised[position])
+        rows.append(row)
+    summary = pd.DataFrame(rows, columns=columns)
+    return WithinSubjectBatch(
+        keys=keys,
+        respondents=respondents,
+        scores=scores,
+        outliers=outliers,
+        observed=observed,
+        summary=summary,
+        test=test,
+        cleaned=clean,
+        audit=audit,
+        winsorised=winsorised,
     )
 
 
+def compute_within_subject_summary(
+    long_df: pd.DataFrame,
+    metric: str,
+    stat: str,
+    *,
+    id_column: str = "respondent_id",
+    outlier_method: OutlierMethod | None = DEFAULT_OUTLIER_METHOD,
+    outlier_action: OutlierAction = "remove",
+    test: WithinSubjectTest = "t",
+    n_resamples: int = 10_000,
+    seed: int | np.random.Generator | None = None,
+) -> WithinSubjectSummary:
+    """Return descriptive and inferential stats for a metric/stat pairing.
+
+    ``test`` selects the paired t-test (default) or a bootstrap or
+    sign-flip permutation test; see :func:`compute_within_subject_batch`.
+    """
+
+    return compute_within_subject_batch(
+        long_df,
+        [(metric, stat)],
+        id_column=id_column,
+        outlier_method=outlier_method,
+        outlier_action=outlier_action,
+        test=test,
+        n_resamples=n_resamples,
+        seed=seed,
+    ).result(metric, stat)
+
+
 def build_within_subject_table(
     long_df: pd.DataFrame,
     metric: str,
@@ -648,42 +952,359 @@ def build_within_subject_table(
     stats: Sequence[str] | None = None,
     id_column: str = "respondent_id",
     outlier_method: OutlierMethod | None = DEFAULT_OUTLIER_METHOD,
+    outlier_action: OutlierAction = "remove",
+    test: WithinSubjectTest = "t",
+    n_resamples: int = 10_000,
+    seed: int | np.random.Generator | None = None,
 ) -> tuple[pd.DataFrame, dict[str, WithinSubjectSummary]]:
     """Aggregate Part 1 results for all stats tied to a metric."""
 
     subset = long_df.loc[long_df["metric"] == metric]
     if stats is None:
         stats = tuple(sorted(subset["stat"].unique()))
-    summary_rows: list[Mapping[str, float | int | str]] = []
-    details: dict[str, WithinSubjectSummary] = {}
-    for stat_item in stats:
-        result = compute_within_subject_summary(
-            subset,
-            metric,
-            stat_item,
-            id_column=id_column,
-            outlier_method=outlier_method,
+    batch = compute_within_subject_batch(
+        subset,
+        [(metric, stat_item) for stat_item in stats],
+        id_column=id_column,
+        outlier_method=outlier_method,
+        outlier_action=outlier_action,
+        test=test,
+        n_resamples=n_resamples,
+        seed=seed,
+    )
+    details = {
+        stat_item: batch.result(metric, stat_item) for stat_item in stats
+    }
+    return batch.summary, details
+
+
+POSTHOC_RESULT_COLUMNS: tuple[str, ...] = (
+    "part",
+    "sensor",
+    "metric",
+    "stat",
+    "title",
+    "long_mean",
+    "short_mean",
+    "difference",
+    "t_stat",
+    "p_value",
+    "n_long",
+    "n_short",
+    "overall_p_value",
+)
+
+# (method, family columns) pairs added by ``WithinSubjectRegistry.to_frame``.
+DEFAULT_POSTHOC_CORRECTIONS: tuple[
+    tuple[CorrectionMethod, tuple[str, ...]], ...
+] = (
+    ("holm", ("sensor",)),
+    ("fdr_bh", ("sensor",)),
+    ("holm", ("title",)),
+    ("fdr_bh", ("title",)),
+)
+
+
+class WithinSubjectRegistry:
+    """Columnar store of within-subject results across the catalogue.
+
+    Results are appended as they are produced, either one
+    ``WithinSubjectSummary`` at a time or a whole ``WithinSubjectBatch``.
+    Labels are kept as integer codes and statistics in preallocated arrays
+    that grow by doubling, so appending never rebuilds a frame. Multiple
+    comparison corrections run over all rows at once, grouped by any of the
+    label columns, and :meth:`to_frame` produces a table laid out like
+    ``biometric_posthoc_results.csv``. Outlier audits of added batches are
+    kept with their labels and returned by :meth:`audit_frame`.
+    """
+
+    _LABEL_FIELDS = ("part", "sensor", "metric", "stat", "title")
+    _VALUE_FIELDS = (
+        "long_mean",
+        "short_mean",
+        "difference",
+        "t_stat",
+        "p_value",
+        "overall_p_value",
+        "ci_low",
+        "ci_high",
+    )
+    _COUNT_FIELDS = (
+        "df",
+        "n_pairs",
+        "outliers_removed",
+        "outliers_winsorised",
+    )
+
+    def __init__(self, capacity: int = 256) -> None:
+        capacity = max(int(capacity), 1)
+        self._size = 0
+        self._audits: list[pd.DataFrame] = []
+        self._labels: dict[str, list[object]] = {
+            field: [] for field in self._LABEL_FIELDS
+        }
+        self._lookup: dict[str, dict[object, int]] = {
+            field: {} for field in self._LABEL_FIELDS
+        }
+        self._columns: dict[str, np.ndarray] = {
+            **{
+                field: np.empty(capacity, dtype=np.int32)
+                for field in self._LABEL_FIELDS
+            },
+            **{
+                field: np.empty(capacity, dtype=float)
+                for field in self._VALUE_FIELDS
+            },
+            **{
+                field: np.empty(capacity, dtype=np.int64)
+                for field in self._COUNT_FIELDS
+            },
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> slice:
+        needed = self._size + extra
+        capacity = len(self._columns["p_value"])
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            for field, column in self._columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                self._columns[field] = grown
+        rows = slice(self._size, needed)
+        self._size = needed
+        return rows
+
+    def _codes(self, field: str, labels: Iterable[object]) -> np.ndarray:
+        # Missing labels (e.g. no title for pooled results) get code -1.
+        lookup = self._lookup[field]
+        codes = []
+        for label in labels:
+            if label is None or (isinstance(label, float) and np.isnan(label)):
+                codes.append(-1)
+                continue
+            code = lookup.get(label)
+            if code is None:
+                code = lookup[label] = len(self._labels[field])
+                self._labels[field].append(label)
+            codes.append(code)
+        return np.asarray(codes, dtype=np.int32)
+
+    def _append(
+        self,
+        labels: Mapping[str, Sequence[object]],
+        values: Mapping[str, np.ndarray],
+    ) -> None:
+        n_rows = len(values["p_value"])
+        if n_rows == 0:
+            return
+        rows = self._reserve(n_rows)
+        for field in self._LABEL_FIELDS:
+            self._columns[field][rows] = self._codes(field, labels[field])
+        for field in (*self._VALUE_FIELDS, *self._COUNT_FIELDS):
+            self._columns[field][rows] = values[field]
+
+    def add(
+        self,
+        summary: WithinSubjectSummary,
+        *,
+        sensor: str,
+        title: str | None = None,
+        part: str = "Part 1",
+        overall_p_value: float = np.nan,
+    ) -> None:
+        """Append one ``WithinSubjectSummary``."""
+
+        self._append(
+            {
+                "part": [part],
+                "sensor": [sensor],
+                "metric": [summary.metric],
+                "stat": [summary.stat],
+                "title": [title],
+            },
+            {
+                "long_mean": [summary.long_mean],
+                "short_mean": [summary.short_mean],
+                "difference": [summary.difference],
+                "t_stat": [summary.t_stat],
+                "p_value": [summary.p_value],
+                "overall_p_value": [overall_p_value],
+                "ci_low": [summary.ci_low],
+                "ci_high": [summary.ci_high],
+                "df": [summary.df],
+                "n_pairs": [summary.n_pairs],
+                "outliers_removed": [summary.outliers_removed],
+                "outliers_winsorised": [summary.outliers_winsorised],
+            },
         )
-        summary_rows.append(result.summary_row)
-        details[stat_item] = result
-    if summary_rows:
-        summary_df = pd.DataFrame(summary_rows)
-    else:
-        summary_df = pd.DataFrame(
+
+    def extend(
+        self,
+        summaries: Iterable[WithinSubjectSummary],
+        *,
+        sensor: str,
+        title: str | None = None,
+        part: str = "Part 1",
+    ) -> None:
+        """Append several summaries sharing the same labels."""
+
+        for summary in summaries:
+            self.add(summary, sensor=sensor, title=title, part=part)
+
+    def add_batch(
+        self,
+        batch: WithinSubjectBatch,
+        *,
+        sensor: str,
+        title: str | None = None,
+        part: str = "Part 1",
+    ) -> None:
+        """Append every observed key of a ``WithinSubjectBatch``."""
+
+        summary = batch.summary.loc[batch.observed]
+        n_rows = len(summary)
+
+        def column(name: str) -> np.ndarray:
+            if name not in summary:
+                return np.full(n_rows, np.nan)
+            return summary[name].to_numpy(dtype=float)
+
+        n_pairs = summary["n paired"].to_numpy(dtype=np.int64)
+        self._append(
+            {
+                "part": [part] * n_rows,
+                "sensor": [sensor] * n_rows,
+                "metric": summary["Metric"].tolist(),
+                "stat": summary["Stat"].tolist(),
+                "title": [title] * n_rows,
+            },
+            {
+                "long_mean": column("Long mean"),
+                "short_mean": column("Short mean"),
+                "difference": column("Difference"),
+                "t_stat": column("t statistic"),
+                "p_value": column("p (one-tailed)"),
+                "overall_p_value": np.full(n_rows, np.nan),
+                "ci_low": column("CI low"),
+                "ci_high": column("CI high"),
+                "df": np.maximum(n_pairs - 1, 0),
+                "n_pairs": n_pairs,
+                "outliers_removed": summary["Outliers removed"].to_numpy(
+                    dtype=np.int64
+                ),
+                "outliers_winsorised": (
+                    summary["Outliers winsorised"].to_numpy(dtype=np.int64)
+                    if "Outliers winsorised" in summary
+                    else np.zeros(n_rows, dtype=np.int64)
+                ),
+            },
+        )
+        if batch.audit is not None and not batch.audit.empty:
+            self._audits.append(
+                batch.audit.assign(part=part, sensor=sensor, title=title)
+            )
+
+    def audit_frame(self) -> pd.DataFrame:
+        """Return the outlier audits of every added batch in one table."""
+
+        if not self._audits:
+            return pd.DataFrame(
+                columns=[
+                    "part",
+                    "sensor",
+                    "title",
+                    "respondent_id",
+                    "metric",
+                    "stat",
+                    *OUTLIER_AUDIT_COLUMNS,
+                ]
+            )
+        audit = pd.concat(self._audits, ignore_index=True)
+        labels = ["part", "sensor", "title"]
+        return audit[
+            [*labels, *[column for column in audit if column not in labels]]
+        ]
+
+    def adjusted_p_values(
+        self,
+        method: CorrectionMethod = "holm",
+        family: Sequence[str] = ("sensor",),
+    ) -> np.ndarray:
+        """Return ``p_value`` adjusted within families of ``family`` labels."""
+
+        family = list(family)
+        unknown = [
+            field for field in family if field not in self._LABEL_FIELDS
+        ]
+        if unknown:
+            raise KeyError(f"Unknown family columns: {unknown}")
+        rows = slice(0, self._size)
+        families = None
+        if family:
+            families = np.ravel_multi_index(
+                tuple(self._columns[field][rows] + 1 for field in family),
+                tuple(len(self._labels[field]) + 1 for field in family),
+            )
+        return adjust_p_values(
+            self._columns["p_value"][rows],
+            families,
+            method=method,
+        )
+
+    def to_frame(
+        self,
+        corrections: Sequence[
+            tuple[CorrectionMethod, Sequence[str]]
+        ] = DEFAULT_POSTHOC_CORRECTIONS,
+    ) -> pd.DataFrame:
+        """Return the results as a ``biometric_posthoc_results.csv`` table.
+
+        Paired tests count each respondent in both forms, so ``n_long`` and
+        ``n_short`` both hold the pair count. Each ``(method, family)`` in
+        ``corrections`` adds a ``p_<method>_<family>`` column.
+        """
+
+        rows = slice(0, self._size)
+        columns = {
+            field: self._columns[field][rows].copy()
+            for field in (*self._VALUE_FIELDS, *self._COUNT_FIELDS)
+        }
+        for field in self._LABEL_FIELDS:
+            columns[field] = pd.Categorical.from_codes(
+                self._columns[field][rows],
+                categories=pd.Index(self._labels[field], dtype=object),
+            )
+        columns["n_long"] = columns["n_short"] = columns["n_pairs"]
+        frame = pd.DataFrame(
+            columns,
             columns=[
-                "Metric",
-                "Stat",
-                "Long mean",
-                "Short mean",
-                "Difference",
-                "t statistic",
-                "df",
-                "p (one-tailed)",
-                "n paired",
-                "Outliers removed",
-            ]
+                *POSTHOC_RESULT_COLUMNS,
+                *self._COUNT_FIELDS,
+                "ci_low",
+                "ci_high",
+            ],
         )
-    return summary_df, details
+        for method, family in corrections:
+            name = f"p_{method}_{'_'.join(family) or 'all'}"
+            frame[name] = self.adjusted_p_values(method, family)
+        return frame
+
+    def to_csv(
+        self,
+        path: str | Path,
+        corrections: Sequence[
+            tuple[CorrectionMethod, Sequence[str]]
+        ] = DEFAULT_POSTHOC_CORRECTIONS,
+    ) -> Path:
+        """Write :meth:`to_frame` with :func:`~wbdlib.io.safe_write_csv`."""
+
+        from .io import safe_write_csv
+
+        return safe_write_csv(self.to_frame(corrections), path)
 
 
 def summarise_biometric_structure(
@@ -716,26 +1337,30 @@ def summarise_biometric_structure(
     return grouped
 
 
+def _duration_column_lookup(columns: Iterable[object]) -> dict[str, str]:
+    """Map lower-cased column names to the originals, built once per frame."""
+
+    lookup: dict[str, str] = {}
+    for column in columns:
+        if isinstance(column, str):
+            lookup.setdefault(column.lower(), column)
+    return lookup
+
+
 def _matching_duration_column(
-    columns: Iterable[str],
+    lookup: Mapping[str, str],
     form: str,
     title: str,
 ) -> str | None:
     """Locate the duration column for a given title regardless of spelling."""
 
-    candidates = []
     canon = _normalise_title(title)
-    variants = {canon}
+    variants = [canon]
     for key, value in TITLE_FIXES.items():
         if value == canon:
-            variants.add(value)
-            variants.add(key.title())
-            variants.add(key)
+            variants.append(key)
     for variant in variants:
-        candidates.append(f"{form}_{variant}_duration")
-    lower_lookup = {col.lower(): col for col in columns}
-    for candidate in candidates:
-        match = lower_lookup.get(candidate.lower())
+        match = lookup.get(f"{form}_{variant}_duration".lower())
         if match:
             return match
     return None
@@ -747,72 +1372,180 @@ def get_duration_differences(
     *,
     forms: Sequence[str] = FORM_ORDER,
 ) -> pd.DataFrame:
-    """Compute duration deltas between Long and Short formats per title."""
+    """Compute duration deltas between Long and Short formats per title.
+
+    The matching Long and Short duration columns of every title are coerced
+    to one numeric block, and the paired and unpaired statistics are taken
+    column-wise for all titles together.
+    """
 
     if "Long" not in forms or "Short" not in forms:
         raise ValueError(
             "Duration comparison requires both 'Long' and 'Short' forms."
         )
 
-    records: list[dict[str, float | str]] = []
+    lookup = _duration_column_lookup(df.columns)
+    matched = []
     for title in titles:
-        long_col = _matching_duration_column(df.columns, "Long", title)
-        short_col = _matching_duration_column(df.columns, "Short", title)
-        if not long_col or not short_col:
-            continue
-        long_vals = pd.to_numeric(df[long_col], errors="coerce")
-        short_vals = pd.to_numeric(df[short_col], errors="coerce")
-        delta = short_vals - long_vals
-        valid_delta = delta.dropna()
-        long_mean = float(long_vals.mean()) if not long_vals.empty else np.nan
-        short_mean = (
-            float(short_vals.mean()) if not short_vals.empty else np.nan
-        )
-        mean_diff = (
-            float(short_mean - long_mean)
-            if np.isfinite(long_mean) and np.isfinite(short_mean)
-            else np.nan
-        )
-        stats = {
-            "title": _normalise_title(title),
-            "long_column": long_col,
-            "short_column": short_col,
-            "n": int(valid_delta.count()),
-            "paired_mean_diff": (
-                float(valid_delta.mean()) if not valid_delta.empty else np.nan
-            ),
-            "paired_std_diff": (
-                float(valid_delta.std(ddof=1))
-                if valid_delta.size > 1
-                else np.nan
-            ),
-            "paired_min_diff": (
-                float(valid_delta.min()) if not valid_delta.empty else np.nan
-            ),
-            "paired_max_diff": (
-                float(valid_delta.max()) if not valid_delta.empty else np.nan
-            ),
+        long_col = _matching_duration_column(lookup, "Long", title)
+        short_col = _matching_duration_column(lookup, "Short", title)
+        if long_col and short_col:
+            matched.append((title, long_col, short_col))
+    if not matched:
+        return pd.DataFrame()
+
+    long_columns = [long_col for _, long_col, _ in matched]
+    short_columns = [short_col for _, _, short_col in matched]
+    positions = df.columns.get_indexer([*long_columns, *short_columns])
+    long_vals, short_vals = np.hsplit(
+        _numeric_block(df.iloc[:, positions]),
+        2,
+    )
+    delta = short_vals - long_vals
+    n = np.isfinite(delta).sum(axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        long_mean = np.nanmean(long_vals, axis=0)
+        short_mean = np.nanmean(short_vals, axis=0)
+        paired_mean = np.nanmean(delta, axis=0)
+        paired_std = np.where(n > 1, np.nanstd(delta, axis=0, ddof=1), np.nan)
+        paired_min = np.nanmin(delta, axis=0) if len(delta) else np.nan
+        paired_max = np.nanmax(delta, axis=0) if len(delta) else np.nan
+    mean_diff = short_mean - long_mean
+    return pd.DataFrame(
+        {
+            "title": [_normalise_title(title) for title, _, _ in matched],
+            "long_column": long_columns,
+            "short_column": short_columns,
+            "n": n.astype(int),
+            "paired_mean_diff": paired_mean,
+            "paired_std_diff": paired_std,
+            "paired_min_diff": np.where(n > 0, paired_min, np.nan),
+            "paired_max_diff": np.where(n > 0, paired_max, np.nan),
             "long_mean": long_mean,
             "short_mean": short_mean,
             "mean_diff": mean_diff,
-            "abs_mean_diff": (
-                abs(mean_diff) if np.isfinite(mean_diff) else np.nan
-            ),
+            "abs_mean_diff": np.abs(mean_diff),
+        }
+    )
+
+
+_DURATION_COLUMN_PATTERN = re.compile(r"^(Long|Short)_(.+)_duration$")
+
+# Key-moment field holding the expected segment length for each form: Long
+# segments are windowed to the key moment, Short ones play in full.
+_EXPECTED_DURATION_FIELDS: Mapping[str, str] = {
+    "Long": "key_moment_duration",
+    "Short": "short_duration",
+}
+
+DURATION_CHECK_COLUMNS: tuple[str, ...] = (
+    "title",
+    "form",
+    "column",
+    "observed_seconds",
+    "expected_seconds",
+    "diff_seconds",
+    "within_tolerance",
+)
+
+
+def check_key_moment_durations(
+    df: pd.DataFrame,
+    key_moment_table: pd.DataFrame,
+    *,
+    id_column: str | None = None,
+    forms: Sequence[str] = ("Long",),
+    tolerance: float = 3.0,
+) -> pd.DataFrame:
+    """Cross-check ``{form}_{title}_duration`` columns against key moments.
+
+    ``key_moment_table`` is the frame from
+    :func:`~wbdlib.timeseries.load_key_moments`. Durations in ``df`` are in
+    seconds; Long segments are compared with ``key_moment_duration`` and
+    Short segments with ``short_duration``. Returns one row per respondent
+    and duration column that has both an observed and an expected value,
+    with ``within_tolerance`` marking absolute differences of at most
+    ``tolerance`` seconds.
+    """
+
+    id_column = id_column or _default_id_column(df)
+    unknown = [form for form in forms if form not in _EXPECTED_DURATION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unsupported duration forms: {unknown}")
+    # Titles on both sides go through the same spelling fixes.
+    expected_by_title = (
+        key_moment_table.dropna(subset=["title"])
+        .assign(title=lambda table: table["title"].map(canonicalise_title))
+        .drop_duplicates("title")
+        .set_index("title")[
+            [_EXPECTED_DURATION_FIELDS[form] for form in forms]
+        ]
+    )
+
+    positions, titles, column_forms, expected = [], [], [], []
+    for position, column in enumerate(df.columns):
+        match = (
+            _DURATION_COLUMN_PATTERN.match(column)
+            if isinstance(column, str)
+            else None
+        )
+        if match is None:
+            continue
+        form = match.group(1)
+        title = _normalise_title(match.group(2))
+        if form not in forms or title not in expected_by_title.index:
+            continue
+        value = expected_by_title.at[title, _EXPECTED_DURATION_FIELDS[form]]
+        if pd.isna(value):
+            continue
+        positions.append(position)
+        titles.append(title)
+        column_forms.append(form)
+        expected.append(float(value))
+    if not positions:
+        return pd.DataFrame(columns=[id_column, *DURATION_CHECK_COLUMNS])
+
+    observed = _numeric_block(df.iloc[:, positions])
+    rows, columns = np.nonzero(np.isfinite(observed))
+    expected = np.asarray(expected)[columns]
+    observed = observed[rows, columns]
+    diff = np.abs(observed - expected)
+    return pd.DataFrame(
+        {
+            id_column: df[id_column].to_numpy()[rows],
+            "title": np.asarray(titles, dtype=object)[columns],
+            "form": np.asarray(column_forms, dtype=object)[columns],
+            "column": df.columns[positions].to_numpy(dtype=object)[columns],
+            "observed_seconds": observed,
+            "expected_seconds": expected,
+            "diff_seconds": diff,
+            "within_tolerance": diff <= tolerance,
         }
-        records.append(stats)
-    return pd.DataFrame(records)
+    )
 
 
 __all__ = [
     "BiometricHeader",
+    "DURATION_CHECK_COLUMNS",
+    "DEFAULT_POSTHOC_CORRECTIONS",
     "KNOWN_SENSORS",
     "KNOWN_STATS",
     "TITLE_FIXES",
     "FORM_ORDER",
+    "POSTHOC_RESULT_COLUMNS",
+    "RESAMPLING_SUMMARY_COLUMNS",
+    "WINSORIZE_SUMMARY_COLUMNS",
+    "WITHIN_SUBJECT_SUMMARY_COLUMNS",
+    "WithinSubjectBatch",
+    "WithinSubjectRegistry",
     "WithinSubjectSummary",
     "bin_biometric_time_series",
+    "biometric_header_catalogue",
     "canonicalise_title",
+    "check_key_moment_durations",
     "build_within_subject_table",
+    "compute_within_subject_batch",
     "compute_within_subject_summary",
     "get_duration_differences",
     "parse_biometric_header",
@@ -0,0 +1,219 @@
+"""Run-length event detection for binary sensor channels.
+
+iMotions marks discrete events (``Peak Detected`` for GSR, ``Blink
+Detected`` for eye tracking) as runs of active samples. :func:`detect_events`
+finds every run of one recording in a single ``np.diff`` pass, optionally
+split into segments (one per stimulus) so all stimuli are evaluated
+together, and reports onsets, per-event durations and per-segment counts
+and rates. :func:`bin_event_rates` turns the same runs into a per-bin
+event-rate series.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+EVENT_RATE_COLUMNS: tuple[str, ...] = (
+    "segment",
+    "bin",
+    "bin_start",
+    "bin_end",
+    "bin_midpoint",
+    "event_count",
+    "events_per_minute",
+)
+
+
+@dataclass(frozen=True)
+class EventRuns:
+    """Runs of active samples in a (segmented) binary channel.
+
+    ``onsets`` and ``ends`` index the first active sample of each event and
+    one past its last; ``segments`` gives the segment each event belongs
+    to. ``durations`` run from an event's onset to the first sample after
+    it (the segment's last sample for an event still active at the end)
+    and ``spans`` from each segment's first to last sample, both in the
+    units of ``times`` (NaN when no times were given).
+    """
+
+    starts: np.ndarray
+    n_samples: int
+    onsets: np.ndarray
+    ends: np.ndarray
+    segments: np.ndarray
+    durations: np.ndarray
+    counts: np.ndarray
+    spans: np.ndarray
+
+    @property
+    def rates(self) -> np.ndarray:
+        """Events per minute for every segment, with ``times`` in seconds.
+
+        NaN for segments without a positive time span.
+        """
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.spans > 0,
+                self.counts / (self.spans / 60.0),
+                np.nan,
+            )
+
+    @property
+    def segment_ids(self) -> np.ndarray:
+        """Segment of every sample."""
+
+        lengths = np.diff(np.r_[self.starts, self.n_samples])
+        return np.repeat(np.arange(self.starts.size), lengths)
+
+
+def detect_events(
+    channel: np.ndarray,
+    times: np.ndarray | None = None,
+    *,
+    starts: np.ndarray | None = None,
+    threshold: float = 1.0,
+) -> EventRuns:
+    """Find runs of samples at or above ``threshold`` in ``channel``.
+
+    ``starts`` gives the first sample of each segment in ascending order
+    (one segment when omitted); runs never cross a segment boundary, so a
+    recording's stimuli can be stacked and evaluated in one call. Missing
+    samples count as inactive. With ``times`` (seconds) the result also
+    carries event durations, segment spans and per-minute rates.
+    """
+
+    channel = np.asarray(channel)
+    n_samples = channel.size
+    if starts is None:
+        starts = np.zeros(1 if n_samples else 0, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    with np.errstate(invalid="ignore"):
+        active = channel >= threshold
+    edges = np.diff(active.astype(np.int8), prepend=0, append=0)
+    onsets = np.flatnonzero(edges[:-1] == 1)
+    ends = np.flatnonzero(edges == -1)
+    # A run straddling a segment boundary is two events: close one at the
+    # boundary and open the next there.
+    boundaries = starts[1:]
+    split = boundaries[active[boundaries - 1] & active[boundaries]]
+    if split.size:
+        onsets = np.sort(np.concatenate([onsets, split]))
+        ends = np.sort(np.concatenate([ends, split]))
+    segments = np.searchsorted(starts, onsets, side="right") - 1
+    counts = np.bincount(segments, minlength=starts.size)
+
+    bounds = np.r_[starts, n_samples]
+    if times is None:
+        durations = np.full(onsets.size, np.nan)
+        spans = np.full(starts.size, np.nan)
+    else:
+        times = np.asarray(times, dtype=float)
+        segment_last = bounds[segments + 1] - 1
+        durations = times[np.minimum(ends, segment_last)] - times[onsets]
+        spans = times[bounds[1:] - 1] - times[starts]
+    return EventRuns(
+        starts=starts,
+        n_samples=n_samples,
+        onsets=onsets,
+        ends=ends,
+        segments=segments,
+        durations=durations,
+        counts=counts,
+        spans=spans,
+    )
+
+
+def bin_event_rates(
+    runs: EventRuns,
+    times: np.ndarray,
+    *,
+    bin_width: float,
+) -> pd.DataFrame:
+    """Per-bin event counts and rates for every segment of ``runs``.
+
+    ``times`` (seconds, aligned per segment as in ``time_seconds``) are
+    split into fixed-width bins like :func:`~wbdlib.timeseries.bin_time_series`;
+    every bin holding a sample gets a row, events are counted in the bin of
+    their onset and ``events_per_minute`` is scaled by the bin width.
+    """
+
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+    times = np.asarray(times, dtype=float)
+    known = np.isfinite(times)
+    if not known.any():
+        return pd.DataFrame(columns=list(EVENT_RATE_COLUMNS))
+    bins = np.floor(times[known] / bin_width).astype(np.int64)
+    lowest = bins.min()
+    # One integer key per (segment, bin) so a 1-D unique orders the rows.
+    stride = bins.max() - lowest + 1
+    keys, inverse = np.unique(
+        runs.segment_ids[known] * stride + (bins - lowest),
+        return_inverse=True,
+    )
+    slot = np.full(times.size, -1, dtype=np.int64)
+    slot[known] = inverse
+    onset_slots = slot[runs.onsets]
+    counts = np.bincount(
+        onset_slots[onset_slots >= 0],
+        minlength=keys.size,
+    )
+    ids = keys % stride + lowest
+    return pd.DataFrame(
+        {
+            "segment": keys // stride,
+            "bin": ids,
+            "bin_start": ids * bin_width,
+            "bin_end": (ids + 1) * bin_width,
+            "bin_midpoint": (ids + 0.5) * bin_width,
+            "event_count": counts,
+            "events_per_minute": counts * (60.0 / bin_width),
+        }
+    )
+
+
+def event_rate_series(
+    frame: pd.DataFrame,
+    value_column: str,
+    *,
+    time_column: str = "time_seconds",
+    bin_width: float,
+    threshold: float = 1.0,
+) -> pd.DataFrame:
+    """Per-bin event rate of one aligned stimulus segment.
+
+    The event counterpart of :func:`~wbdlib.timeseries.bin_time_series`:
+    rows are ordered by time, missing channel samples count as inactive
+    and the ``segment`` column is dropped.
+    """
+
+    if time_column not in frame.columns:
+        raise KeyError(f"Column '{time_column}' not present for binning")
+    if value_column not in frame.columns:
+        raise KeyError(f"Column '{value_column}' not present for binning")
+    ordered = frame[[time_column, value_column]].dropna(subset=[time_column])
+    ordered = ordered.sort_values(time_column, kind="stable")
+    times = ordered[time_column].to_numpy(dtype=float)
+    runs = detect_events(
+        pd.to_numeric(ordered[value_column], errors="coerce").to_numpy(
+            dtype=float
+        ),
+        times,
+        threshold=threshold,
+    )
+    rates = bin_event_rates(runs, times, bin_width=float(bin_width))
+    return rates.drop(columns="segment")
+
+
+__all__ = [
+    "EVENT_RATE_COLUMNS",
+    "EventRuns",
+    "bin_event_rates",
+    "detect_events",
+    "event_rate_series",
+]
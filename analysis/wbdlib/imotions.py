@@ -2,32 +2,83 @@
 
 from __future__ import annotations
 
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, Mapping, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 
-def extract_imotions_metadata(
-    path: str | Path,
-    metadata: Iterable[str] | None = None,
-) -> Tuple[dict[str, str], int]:
-    """Read leading metadata rows from an iMotions CSV file."""
-    requested = {item for item in metadata or []}
-    filter_requested = bool(metadata)
-    path_obj = Path(path)
-    meta_lines: list[str] = []
-    header_rows = 0
-    with path_obj.open("r", encoding="latin1") as handle:
-        for line in handle:
-            first_cell = line.split(",", 1)[0]
-            if "#" in first_cell:
-                meta_lines.append(line)
-                header_rows += 1
-            else:
-                break
+DEFAULT_SENSOR_EXPORT_PATTERN = "Group */Analyses/*/Sensor Data/*.csv"
+
+# read_csv options that change where the header or data rows start. When any
+# of these are supplied we cannot reuse the scanned preamble.
+_LAYOUT_KWARGS = frozenset({"header", "names", "skiprows", "skipfooter"})
+
+_STIMULUS_INDEX_SUFFIX = ".stimuli.json"
+
+
+@dataclass(frozen=True)
+class IMotionsFileIndex:
+    """Preamble summary of an iMotions export gathered in a single read."""
+
+    path: Path
+    metadata: Mapping[str, str]
+    header_rows: int
+    header_line: int
+    columns: tuple[str, ...]
+    data_offset: int
+    dtype_hints: Mapping[str, str]
+    encoding: str
+    mtime_ns: int
+    size: int
+
+    def metadata_subset(
+        self,
+        metadata: Iterable[str] | None = None,
+    ) -> dict[str, str]:
+        """Return the requested metadata fields (all fields when omitted)."""
+
+        if not metadata:
+            return dict(self.metadata)
+        requested = set(metadata)
+        return {
+            key: value
+            for key, value in self.metadata.items()
+            if key in requested
+        }
+
+
+@dataclass(frozen=True)
+class StimulusRun:
+    """A contiguous block of rows recorded under one stimulus name.
+
+    Offsets are byte positions in the export (``end_offset`` is exclusive)
+    and are ``None`` when rows could not be mapped to lines, e.g. because a
+    quoted field spans several lines.
+    """
+
+    stimulus: str
+    first_row: int
+    last_row: int
+    start_offset: int | None
+    end_offset: int | None
+    start_media_ms: float | None
+    end_media_ms: float | None
+
+    @property
+    def row_count(self) -> int:
+        return self.last_row - self.first_row + 1
+
+
+def _parse_metadata_lines(lines: Iterable[str]) -> dict[str, str]:
     meta_dict: dict[str, str] = {}
-    for raw_line in meta_lines:
+    for raw_line in lines:
         segments = raw_line.strip().split("#", 1)
         if len(segments) < 2:
             continue
@@ -37,9 +88,160 @@ def extract_imotions_metadata(
             continue
         key = parts[0].strip()
         value = ",".join(parts[1:]).strip()
-        if not filter_requested or key in requested:
-            meta_dict[key] = value
-    return meta_dict, header_rows
+        meta_dict[key] = value
+    return meta_dict
+
+
+def _decode_header(raw: bytes) -> tuple[str, str]:
+    """Decode the header row the way pandas would, falling back to latin1."""
+
+    try:
+        return raw.decode("utf-8-sig"), "utf-8"
+    except UnicodeDecodeError:
+        return raw.decode("latin1"), "latin1"
+
+
+def _normalise_column_names(names: list[str]) -> tuple[str, ...]:
+    """Apply pandas' naming rules for blank and duplicated header cells."""
+
+    labelled = [
+        name if name != "" else f"Unnamed: {idx}"
+        for idx, name in enumerate(names)
+    ]
+    counts: dict[str, int] = {}
+    deduped: list[str] = []
+    for name in labelled:
+        current = counts.get(name, 0)
+        while current > 0:
+            counts[name] = current + 1
+            name = f"{name}.{current}"
+            current = counts.get(name, 0)
+        counts[name] = current + 1
+        deduped.append(name)
+    return tuple(deduped)
+
+
+def _infer_dtype_hints(
+    sample: bytes,
+    columns: tuple[str, ...],
+    encoding: str,
+) -> dict[str, str]:
+    if not sample:
+        return {}
+    try:
+        frame = pd.read_csv(
+            io.BytesIO(sample),
+            header=None,
+            names=list(columns),
+            encoding=encoding,
+        )
+    except (ValueError, pd.errors.ParserError, UnicodeDecodeError):
+        return {}
+    return {column: str(dtype) for column, dtype in frame.dtypes.items()}
+
+
+@lru_cache(maxsize=512)
+def _scan_imotions_cached(
+    resolved: str,
+    mtime_ns: int,
+    size: int,
+    sample_rows: int,
+) -> IMotionsFileIndex:
+    meta_lines: list[str] = []
+    header_rows = 0
+    line_number = 0
+    offset = 0
+    header_raw = b""
+    sample_lines: list[bytes] = []
+    with open(resolved, "rb") as handle:
+        for raw in handle:
+            line_number += 1
+            offset += len(raw)
+            text = raw.decode("latin1")
+            if "#" in text.split(",", 1)[0]:
+                meta_lines.append(text)
+                header_rows += 1
+                continue
+            if not text.strip():
+                # pandas skips blank lines when locating the header row.
+                continue
+            header_raw = raw
+            break
+        for raw in handle:
+            if len(sample_lines) >= sample_rows:
+                break
+            sample_lines.append(raw)
+
+    header_text, encoding = _decode_header(header_raw)
+    row = next(csv.reader([header_text.rstrip("\r\n")]), [])
+    columns = _normalise_column_names(row)
+    dtype_hints = _infer_dtype_hints(b"".join(sample_lines), columns, encoding)
+    return IMotionsFileIndex(
+        path=Path(resolved),
+        metadata=_parse_metadata_lines(meta_lines),
+        header_rows=header_rows,
+        header_line=line_number - 1 if header_raw else line_number,
+        columns=columns,
+        data_offset=offset,
+        dtype_hints=dtype_hints,
+        encoding=encoding,
+        mtime_ns=mtime_ns,
+        size=size,
+    )
+
+
+def scan_imotions_file(
+    path: str | Path,
+    *,
+    sample_rows: int = 200,
+) -> IMotionsFileIndex:
+    """Read an export's preamble once and return its :class:`IMotionsFileIndex`.
+
+    Results are memoised on (path, mtime, size) so repeated calls from
+    different readers do not touch the file again.
+    """
+
+    path_obj = Path(path)
+    stat = path_obj.stat()
+    return _scan_imotions_cached(
+        str(path_obj.resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+        sample_rows,
+    )
+
+
+def build_imotions_index(
+    paths: str | Path | Iterable[str | Path],
+    *,
+    pattern: str = DEFAULT_SENSOR_EXPORT_PATTERN,
+    max_workers: int | None = None,
+) -> dict[Path, IMotionsFileIndex]:
+    """Scan many exports concurrently and return their indices keyed by path.
+
+    ``paths`` may be a directory (searched with ``pattern``) or an iterable of
+    file paths. Scanning is I/O bound, so a thread pool is used.
+    """
+
+    if isinstance(paths, (str, Path)):
+        root = Path(paths)
+        targets = sorted(root.glob(pattern)) if root.is_dir() else [root]
+    else:
+        targets = [Path(item) for item in paths]
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        indices = list(executor.map(scan_imotions_file, targets))
+    return dict(zip(targets, indices))
+
+
+def extract_imotions_metadata(
+    path: str | Path,
+    metadata: Iterable[str] | None = None,
+) -> Tuple[dict[str, str], int]:
+    """Read leading metadata rows from an iMotions CSV file."""
+    index = scan_imotions_file(path)
+    return index.metadata_subset(metadata), index.header_rows
 
 
 def read_imotions_metadata(
@@ -51,21 +253,278 @@ def read_imotions_metadata(
     return meta_dict
 
 
+def read_imotions_data(
+    index: IMotionsFileIndex,
+    **read_csv_kwargs,
+) -> pd.DataFrame:
+    """Parse the data rows of an export, starting at the indexed offset."""
+    csv_kwargs: dict[str, Any] = dict(read_csv_kwargs)
+    csv_kwargs.setdefault("encoding", index.encoding)
+    with open(index.path, "rb") as handle:
+        handle.seek(index.data_offset)
+        return pd.read_csv(
+            handle,
+            header=None,
+            names=list(index.columns),
+            **csv_kwargs,
+        )
+
+
+def _data_line_bounds(index: IMotionsFileIndex) -> tuple[np.ndarray, np.ndarray]:
+    """Return start/end byte offsets of every non-blank data line."""
+
+    if index.size <= index.data_offset:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    raw = np.fromfile(index.path, dtype=np.uint8, offset=index.data_offset)
+    newlines = np.flatnonzero(raw == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines + 1, [raw.size]))
+    keep = starts < raw.size
+    starts, ends = starts[keep], ends[keep]
+    lengths = ends - starts
+    # pandas skips blank lines, so they must not count as rows.
+    first = raw[np.minimum(starts, raw.size - 1)]
+    blank = (lengths == 1) & (first == 0x0A)
+    blank |= (lengths == 1) & (first == 0x0D)
+    blank |= (lengths == 2) & (first == 0x0D)
+    starts, ends = starts[~blank], ends[~blank]
+    return starts + index.data_offset, ends + index.data_offset
+
+
+def _stimulus_runs_from_frame(
+    frame: pd.DataFrame,
+    line_bounds: tuple[np.ndarray, np.ndarray] | None,
+    *,
+    stimulus_col: str,
+    timestamp_col: str,
+    event_col: str,
+    start_label: str,
+    end_label: str,
+) -> tuple[StimulusRun, ...]:
+    if frame.empty or stimulus_col not in frame.columns:
+        return ()
+    names = frame[stimulus_col]
+    run_ids = names.ne(names.shift()).cumsum().to_numpy()
+    boundaries = np.flatnonzero(np.diff(run_ids)) + 1
+    run_starts = np.concatenate(([0], boundaries))
+    run_ends = np.concatenate((boundaries, [len(frame)])) - 1
+
+    timestamps = (
+        pd.to_numeric(frame[timestamp_col], errors="coerce").to_numpy()
+        if timestamp_col in frame.columns
+        else np.full(len(frame), np.nan)
+    )
+    events = (
+        frame[event_col].to_numpy()
+        if event_col in frame.columns
+        else np.full(len(frame), None, dtype=object)
+    )
+    starts_at = np.flatnonzero(events == start_label)
+    ends_at = np.flatnonzero(events == end_label)
+
+    runs: list[StimulusRun] = []
+    values = names.to_numpy()
+    for first, last in zip(run_starts.tolist(), run_ends.tolist()):
+        name = values[first]
+        if pd.isna(name):
+            continue
+        lo = np.searchsorted(starts_at, first)
+        start_media = (
+            float(timestamps[starts_at[lo]])
+            if lo < starts_at.size and starts_at[lo] <= last
+            else None
+        )
+        hi = np.searchsorted(ends_at, last, side="right") - 1
+        end_media = (
+            float(timestamps[ends_at[hi]])
+            if hi >= 0 and ends_at[hi] >= first
+            else None
+        )
+        runs.append(
+            StimulusRun(
+                stimulus=str(name),
+                first_row=int(first),
+                last_row=int(last),
+                start_offset=(
+                    int(line_bounds[0][first]) if line_bounds else None
+                ),
+                end_offset=(
+                    int(line_bounds[1][last]) if line_bounds else None
+                ),
+                start_media_ms=start_media,
+                end_media_ms=end_media,
+            )
+        )
+    return tuple(runs)
+
+
+@lru_cache(maxsize=256)
+def _build_stimulus_index_cached(
+    resolved: str,
+    mtime_ns: int,
+    size: int,
+    settings: tuple[tuple[str, str], ...],
+) -> tuple[StimulusRun, ...]:
+    index = scan_imotions_file(resolved)
+    options = dict(settings)
+    wanted = {
+        options["stimulus_col"],
+        options["timestamp_col"],
+        options["event_col"],
+    }
+    frame = read_imotions_data(
+        index,
+        usecols=lambda name: name in wanted,
+        low_memory=False,
+    )
+    line_bounds: tuple[np.ndarray, np.ndarray] | None = _data_line_bounds(index)
+    if line_bounds[0].size != len(frame):
+        # Embedded newlines inside quoted fields; fall back to row numbers.
+        line_bounds = None
+    return _stimulus_runs_from_frame(frame, line_bounds, **options)
+
+
+def build_stimulus_index(
+    path: str | Path,
+    *,
+    stimulus_col: str = "SourceStimuliName",
+    timestamp_col: str = "Timestamp",
+    event_col: str = "SlideEvent",
+    start_label: str = "StartMedia",
+    end_label: str = "EndMedia",
+    store_dir: str | Path | None = None,
+    refresh: bool = False,
+) -> tuple[StimulusRun, ...]:
+    """Return the stimulus runs of an export, with their row and byte ranges.
+
+    The index is built from a single pass over the stimulus, timestamp and
+    event columns plus a newline scan of the data block. When a sensor store
+    is configured (or ``store_dir`` is given) it is saved next to the
+    columnar copy and reused until the export changes.
+    """
+
+    from . import sensor_store
+
+    settings = {
+        "stimulus_col": stimulus_col,
+        "timestamp_col": timestamp_col,
+        "event_col": event_col,
+        "start_label": start_label,
+        "end_label": end_label,
+    }
+    if not refresh:
+        cached = sensor_store.read_store_sidecar(
+            path,
+            _STIMULUS_INDEX_SUFFIX,
+            store_dir=store_dir,
+        )
+        if cached and cached.get("settings") == settings:
+            return tuple(StimulusRun(**run) for run in cached["runs"])
+
+    index = scan_imotions_file(path)
+    builder = _build_stimulus_index_cached
+    if refresh:
+        builder = builder.__wrapped__
+    runs = builder(
+        str(index.path),
+        index.mtime_ns,
+        index.size,
+        tuple(settings.items()),
+    )
+    sensor_store.write_store_sidecar(
+        path,
+        _STIMULUS_INDEX_SUFFIX,
+        {
+            "settings": settings,
+            "runs": [asdict(run) for run in runs],
+        },
+        store_dir=store_dir,
+    )
+    return runs
+
+
+def read_imotions_rows(
+    index: IMotionsFileIndex,
+    runs: Sequence[StimulusRun],
+    **read_csv_kwargs,
+) -> pd.DataFrame:
+    """Parse only the byte ranges covered by ``runs``.
+
+    Every run must carry byte offsets; rows keep their original order.
+    """
+
+    csv_kwargs: dict[str, Any] = dict(read_csv_kwargs)
+    csv_kwargs.setdefault("encoding", index.encoding)
+    buffer = io.BytesIO()
+    with open(index.path, "rb") as handle:
+        for run in sorted(runs, key=lambda item: item.first_row):
+            if run.start_offset is None or run.end_offset is None:
+                raise ValueError(
+                    f"Stimulus run '{run.stimulus}' has no byte offsets"
+                )
+            handle.seek(run.start_offset)
+            chunk = handle.read(run.end_offset - run.start_offset)
+            buffer.write(chunk)
+            if not chunk.endswith(b"\n"):
+                buffer.write(b"\n")
+    buffer.seek(0)
+    return pd.read_csv(
+        buffer,
+        header=None,
+        names=list(index.columns),
+        **csv_kwargs,
+    )
+
+
 def read_imotions(
     path: str | Path,
     metadata: Iterable[str] | None = None,
+    *,
+    use_store: bool = True,
     **read_csv_kwargs,
 ) -> tuple[pd.DataFrame, dict[str, str]]:
-    """Load an iMotions CSV and return the data alongside optional metadata."""
-    meta_dict, header_rows = extract_imotions_metadata(path, metadata)
+    """Load an iMotions CSV and return the data alongside optional metadata.
+
+    When a sensor store is configured (see :mod:`wbdlib.sensor_store`) and the
+    requested options only project columns or limit rows, the data is served
+    from the columnar copy instead of re-parsing the CSV.
+    """
+    if use_store:
+        from . import sensor_store
+
+        if (
+            sensor_store.get_sensor_store() is not None
+            and sensor_store.supports_store_read(read_csv_kwargs)
+        ):
+            return sensor_store.read_sensor_store(
+                path,
+                metadata,
+                usecols=read_csv_kwargs.get("usecols"),
+                nrows=read_csv_kwargs.get("nrows"),
+            )
+    index = scan_imotions_file(path)
+    meta_dict = index.metadata_subset(metadata)
     csv_kwargs: dict[str, Any] = dict(read_csv_kwargs)
     csv_kwargs.setdefault("low_memory", True)
-    df = pd.read_csv(path, header=header_rows, **csv_kwargs)
+    if _LAYOUT_KWARGS.intersection(csv_kwargs):
+        csv_kwargs.setdefault("header", index.header_rows)
+        df = pd.read_csv(path, **csv_kwargs)
+    else:
+        df = read_imotions_data(index, **csv_kwargs)
     return df, meta_dict
 
 
 __all__ = [
+    "DEFAULT_SENSOR_EXPORT_PATTERN",
+    "IMotionsFileIndex",
+    "StimulusRun",
+    "build_imotions_index",
+    "build_stimulus_index",
     "extract_imotions_metadata",
     "read_imotions",
+    "read_imotions_data",
     "read_imotions_metadata",
+    "read_imotions_rows",
+    "scan_imotions_file",
 ]
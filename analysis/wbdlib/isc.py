@@ -0,0 +1,729 @@
+"""Inter-subject correlation (ISC) of binned respondent time series.
+
+Respondent bins for one title/form/group/metric are pivoted into a
+(respondents x bins) matrix with NaN marking missing bins. Sliding-window
+Pearson correlations are then computed for every respondent pair at once:
+each pair's shared bins are compacted into one flat array and the windows
+are gathered from a strided view of it into a (windows x window_bins)
+array. Correlations use the centred two-pass formula on that array, which
+matches ``np.corrcoef`` without the cancellation of running-sum moments;
+memory is bounded by processing pairs in chunks of at most
+``_MAX_WINDOW_ELEMENTS`` gathered window values. The output frames match
+the schemas the ISC notebook caches (``isc_pairwise_traces.parquet``,
+``isc_pairwise_diagnostics.csv`` and ``isc_curves_by_title.parquet``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+DEFAULT_ISC_GROUP_COLUMNS: tuple[str, ...] = ("title", "form", "group", "metric")
+
+PAIRWISE_COLUMNS = [
+    "title",
+    "form",
+    "group",
+    "metric",
+    "respondent_a",
+    "respondent_b",
+    "pair_key",
+    "window_index",
+    "window_start_bin",
+    "window_end_bin",
+    "window_start_seconds",
+    "window_end_seconds",
+    "window_mid_seconds",
+    "window_width_seconds",
+    "window_step_seconds",
+    "sample_bins",
+    "corr_value",
+]
+
+PAIR_DIAGNOSTIC_COLUMNS = [
+    "title",
+    "form",
+    "group",
+    "metric",
+    "respondent_a",
+    "respondent_b",
+    "pair_key",
+    "shared_bins",
+    "windows_generated",
+]
+
+LEAVE_ONE_OUT_COLUMNS = [
+    "title",
+    "form",
+    "group",
+    "metric",
+    "respondent_id",
+    *PAIRWISE_COLUMNS[PAIRWISE_COLUMNS.index("window_index"):],
+]
+
+LEAVE_ONE_OUT_DIAGNOSTIC_COLUMNS = [
+    "title",
+    "form",
+    "group",
+    "metric",
+    "respondent_id",
+    "shared_bins",
+    "windows_generated",
+]
+
+# Upper bound on gathered window elements held at once per chunk of pairs.
+_MAX_WINDOW_ELEMENTS = 1 << 22
+
+
+@dataclass(frozen=True)
+class RespondentBinMatrix:
+    """Respondent-by-bin values for one title/form/group/metric."""
+
+    respondents: tuple[object, ...]
+    bins: np.ndarray
+    values: np.ndarray
+    bin_start: np.ndarray
+    bin_end: np.ndarray
+    bin_midpoint: np.ndarray
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean matrix flagging bins with a usable value."""
+
+        return np.isfinite(self.values)
+
+
+@dataclass(frozen=True)
+class ISCResult:
+    """Window-level ISC values plus diagnostics and issues.
+
+    ``pairwise`` holds one row per window and pair, or per window and
+    respondent in leave-one-out mode.
+    """
+
+    pairwise: pd.DataFrame
+    diagnostics: pd.DataFrame
+    issues: tuple[str, ...]
+    mode: str = "pairwise"
+
+
+def pivot_respondent_bins(
+    frame: pd.DataFrame,
+    *,
+    value_column: str = "value_smoothed",
+    respondent_column: str = "respondent_id",
+) -> RespondentBinMatrix:
+    """Pivot long-form bins into a contiguous (respondents x bins) matrix.
+
+    Respondents are sorted and bins span the observed bin indices. Repeated
+    (respondent, bin) rows are averaged.
+    """
+
+    values = (
+        frame.groupby([respondent_column, "bin"], sort=True, observed=True)[
+            value_column
+        ]
+        .mean()
+        .unstack("bin")
+    )
+    grid = (
+        frame.groupby("bin", sort=True)[["bin_start", "bin_end", "bin_midpoint"]]
+        .first()
+        .reindex(values.columns)
+    )
+    return RespondentBinMatrix(
+        respondents=tuple(values.index),
+        bins=values.columns.to_numpy(dtype=np.int64),
+        values=np.ascontiguousarray(values.to_numpy(dtype=float)),
+        bin_start=grid["bin_start"].to_numpy(dtype=float),
+        bin_end=grid["bin_end"].to_numpy(dtype=float),
+        bin_midpoint=grid["bin_midpoint"].to_numpy(dtype=float),
+    )
+
+
+def _is_constant(windows: np.ndarray) -> np.ndarray:
+    """``np.allclose(window, window[0])`` along the last axis."""
+
+    first = windows[..., :1]
+    tolerance = 1e-8 + 1e-5 * np.abs(first)
+    return (np.abs(windows - first) <= tolerance).all(axis=-1)
+
+
+def _window_correlations(
+    left: np.ndarray,
+    right: np.ndarray,
+) -> np.ndarray:
+    """Pearson correlation along the last axis of two window arrays."""
+
+    left = left - left.mean(axis=-1, keepdims=True)
+    right = right - right.mean(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = (left * right).sum(axis=-1) / np.sqrt(
+            (left * left).sum(axis=-1) * (right * right).sum(axis=-1)
+        )
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _series_windows(
+    matrix: RespondentBinMatrix,
+    left_series: np.ndarray,
+    right_series: np.ndarray,
+    window_bins: int,
+    step_bins: int,
+) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """Windows for paired rows of two (series x bins) arrays.
+
+    Returns the kept window records (``series`` holds the row position),
+    plus the shared-bin and kept-window counts per row.
+    """
+
+    shared = np.isfinite(left_series) & np.isfinite(right_series)
+    shared_counts = shared.sum(axis=1)
+    series_idx, bin_idx = np.nonzero(shared)
+    left = left_series[series_idx, bin_idx]
+    right = right_series[series_idx, bin_idx]
+
+    n_series = left_series.shape[0]
+    offsets = np.r_[0, np.cumsum(shared_counts)[:-1]]
+    n_windows = np.where(
+        shared_counts >= window_bins,
+        (shared_counts - window_bins) // step_bins + 1,
+        0,
+    )
+    window_series = np.repeat(np.arange(n_series), n_windows)
+    local = np.arange(window_series.size) - np.repeat(
+        np.cumsum(n_windows) - n_windows,
+        n_windows,
+    )
+    starts = offsets[window_series] + local * step_bins
+    if starts.size == 0:
+        return {}, shared_counts, np.zeros(n_series, dtype=np.int64)
+
+    left_windows = sliding_window_view(left, window_bins)[starts]
+    right_windows = sliding_window_view(right, window_bins)[starts]
+    corr = _window_correlations(left_windows, right_windows)
+    keep = (
+        ~_is_constant(left_windows)
+        & ~_is_constant(right_windows)
+        & np.isfinite(corr)
+    )
+    kept_counts = np.bincount(
+        window_series[keep],
+        minlength=n_series,
+    ).astype(np.int64)
+
+    window_series = window_series[keep]
+    starts = starts[keep]
+    first_bin = bin_idx[starts]
+    last_bin = bin_idx[starts + window_bins - 1]
+    midpoints = sliding_window_view(
+        matrix.bin_midpoint[bin_idx],
+        window_bins,
+    )[starts].mean(axis=1)
+    emitted_before = np.cumsum(kept_counts) - kept_counts
+    records = {
+        "series": window_series,
+        "window_index": (
+            np.arange(window_series.size) - emitted_before[window_series]
+        ),
+        "window_start_bin": matrix.bins[first_bin],
+        "window_end_bin": matrix.bins[last_bin],
+        "window_start_seconds": matrix.bin_start[first_bin],
+        "window_end_seconds": matrix.bin_end[last_bin],
+        "window_mid_seconds": midpoints,
+        "corr_value": corr[keep],
+    }
+    return records, shared_counts, kept_counts
+
+
+def _check_window_settings(window_bins: int, step_bins: int) -> None:
+    if window_bins < 2:
+        raise ValueError("window_bins must be at least 2")
+    if step_bins < 1:
+        raise ValueError("step_bins must be positive")
+
+
+def _chunked_windows(
+    matrix: RespondentBinMatrix,
+    rows: int,
+    build_chunk,
+    window_bins: int,
+    step_bins: int,
+) -> tuple[list[pd.DataFrame], np.ndarray, np.ndarray]:
+    """Run :func:`_series_windows` over ``rows`` series in bounded chunks.
+
+    ``build_chunk(lo, hi)`` returns the left/right arrays for rows
+    ``lo:hi``. Window frames carry the global row position in ``series``.
+    """
+
+    n_bins = max(matrix.bins.size, 1)
+    chunk = max(1, _MAX_WINDOW_ELEMENTS // (n_bins * window_bins))
+    window_frames: list[pd.DataFrame] = []
+    shared_parts: list[np.ndarray] = [np.empty(0, dtype=np.int64)]
+    kept_parts: list[np.ndarray] = [np.empty(0, dtype=np.int64)]
+    for lo in range(0, rows, chunk):
+        hi = min(lo + chunk, rows)
+        left_series, right_series = build_chunk(lo, hi)
+        records, shared_counts, kept_counts = _series_windows(
+            matrix,
+            left_series,
+            right_series,
+            window_bins,
+            step_bins,
+        )
+        shared_parts.append(shared_counts)
+        kept_parts.append(kept_counts)
+        if records:
+            records["series"] = records["series"] + lo
+            window_frames.append(pd.DataFrame(records))
+    return (
+        window_frames,
+        np.concatenate(shared_parts),
+        np.concatenate(kept_parts),
+    )
+
+
+def pairwise_window_correlations(
+    matrix: RespondentBinMatrix,
+    *,
+    window_bins: int,
+    step_bins: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Sliding-window correlations for every respondent pair of ``matrix``.
+
+    Windows slide over each pair's shared (non-missing) bins, so gaps are
+    skipped rather than breaking a window. Windows where either series is
+    constant, or the correlation is undefined, are dropped. Returns the
+    window rows and a per-pair frame with ``shared_bins`` and
+    ``windows_generated``; both use positional respondent columns that
+    :func:`compute_isc` relabels.
+    """
+
+    _check_window_settings(window_bins, step_bins)
+    first_all, second_all = np.triu_indices(len(matrix.respondents), k=1)
+    window_frames, shared_counts, kept_counts = _chunked_windows(
+        matrix,
+        first_all.size,
+        lambda lo, hi: (
+            matrix.values[first_all[lo:hi]],
+            matrix.values[second_all[lo:hi]],
+        ),
+        window_bins,
+        step_bins,
+    )
+    pairs = pd.DataFrame(
+        {
+            "index_a": first_all,
+            "index_b": second_all,
+            "shared_bins": shared_counts,
+            "windows_generated": kept_counts,
+        }
+    )
+    windows = (
+        pd.concat(window_frames, ignore_index=True)
+        if window_frames
+        else pd.DataFrame()
+    )
+    if not windows.empty:
+        series = windows.pop("series").to_numpy()
+        windows.insert(0, "index_b", second_all[series])
+        windows.insert(0, "index_a", first_all[series])
+    return windows, pairs
+
+
+def leave_one_out_window_correlations(
+    matrix: RespondentBinMatrix,
+    *,
+    window_bins: int,
+    step_bins: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Sliding-window correlation of each respondent with the others' mean.
+
+    The reference series for a respondent is the mean of every other
+    respondent with a value in that bin, derived from the column totals by
+    subtracting the respondent's own value, so the cost is linear in the
+    number of respondents. Window rules match
+    :func:`pairwise_window_correlations`; the positional ``index`` column is
+    relabelled by :func:`compute_isc`.
+    """
+
+    _check_window_settings(window_bins, step_bins)
+    values = matrix.values
+    mask = matrix.mask
+    totals = np.where(mask, values, 0.0).sum(axis=0)
+    counts = mask.sum(axis=0)
+
+    def build_chunk(lo: int, hi: int) -> tuple[np.ndarray, np.ndarray]:
+        own = values[lo:hi]
+        own_mask = mask[lo:hi]
+        others = counts - own_mask
+        with np.errstate(invalid="ignore", divide="ignore"):
+            reference = (totals - np.where(own_mask, own, 0.0)) / others
+        return own, np.where(others > 0, reference, np.nan)
+
+    n_respondents = len(matrix.respondents)
+    window_frames, shared_counts, kept_counts = _chunked_windows(
+        matrix,
+        n_respondents,
+        build_chunk,
+        window_bins,
+        step_bins,
+    )
+    respondents = pd.DataFrame(
+        {
+            "index": np.arange(n_respondents),
+            "shared_bins": shared_counts,
+            "windows_generated": kept_counts,
+        }
+    )
+    windows = (
+        pd.concat(window_frames, ignore_index=True)
+        if window_frames
+        else pd.DataFrame()
+    )
+    if not windows.empty:
+        windows = windows.rename(columns={"series": "index"})
+    return windows, respondents
+
+
+def _window_frame(
+    labels: dict[str, object],
+    identifiers: dict[str, object],
+    windows: pd.DataFrame,
+    columns: list[str],
+    *,
+    window_bins: int,
+    step_bins: int,
+    bin_seconds: float,
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            **labels,
+            **identifiers,
+            "window_index": windows["window_index"].to_numpy(),
+            "window_start_bin": windows["window_start_bin"].to_numpy(),
+            "window_end_bin": windows["window_end_bin"].to_numpy(),
+            "window_start_seconds": windows["window_start_seconds"].to_numpy(),
+            "window_end_seconds": windows["window_end_seconds"].to_numpy(),
+            "window_mid_seconds": windows["window_mid_seconds"].to_numpy(),
+            "window_width_seconds": bin_seconds * window_bins,
+            "window_step_seconds": bin_seconds * step_bins,
+            "sample_bins": window_bins,
+            "corr_value": windows["corr_value"].to_numpy(),
+        },
+        columns=columns,
+    )
+
+
+def _pairwise_group(
+    matrix: RespondentBinMatrix,
+    labels: dict[str, object],
+    prefix: str,
+    window_bins: int,
+    step_bins: int,
+    bin_seconds: float,
+) -> tuple[pd.DataFrame | None, pd.DataFrame, list[str]]:
+    windows, pairs = pairwise_window_correlations(
+        matrix,
+        window_bins=window_bins,
+        step_bins=step_bins,
+    )
+    respondents = pd.Index(matrix.respondents).to_numpy()
+    issues = [
+        f"{prefix}: pair ({respondents[row.index_a]}, "
+        f"{respondents[row.index_b]}) has only {row.shared_bins} "
+        "overlapping bins"
+        for row in pairs.loc[pairs["shared_bins"] < window_bins].itertuples(
+            index=False
+        )
+    ]
+
+    pairs = pairs.loc[pairs["shared_bins"] >= window_bins]
+    pair_a = respondents[pairs["index_a"].to_numpy()]
+    pair_b = respondents[pairs["index_b"].to_numpy()]
+    diagnostics = pd.DataFrame(
+        {
+            **labels,
+            "respondent_a": pair_a,
+            "respondent_b": pair_b,
+            "pair_key": [f"{a}-{b}" for a, b in zip(pair_a, pair_b)],
+            "shared_bins": pairs["shared_bins"].to_numpy(),
+            "windows_generated": pairs["windows_generated"].to_numpy(),
+        },
+        columns=PAIR_DIAGNOSTIC_COLUMNS,
+    )
+    if windows.empty:
+        return None, diagnostics, issues
+    window_a = respondents[windows["index_a"].to_numpy()]
+    window_b = respondents[windows["index_b"].to_numpy()]
+    frame = _window_frame(
+        labels,
+        {
+            "respondent_a": window_a,
+            "respondent_b": window_b,
+            "pair_key": [f"{a}-{b}" for a, b in zip(window_a, window_b)],
+        },
+        windows,
+        PAIRWISE_COLUMNS,
+        window_bins=window_bins,
+        step_bins=step_bins,
+        bin_seconds=bin_seconds,
+    )
+    return frame, diagnostics, issues
+
+
+def _leave_one_out_group(
+    matrix: RespondentBinMatrix,
+    labels: dict[str, object],
+    prefix: str,
+    window_bins: int,
+    step_bins: int,
+    bin_seconds: float,
+) -> tuple[pd.DataFrame | None, pd.DataFrame, list[str]]:
+    windows, per_respondent = leave_one_out_window_correlations(
+        matrix,
+        window_bins=window_bins,
+        step_bins=step_bins,
+    )
+    respondents = pd.Index(matrix.respondents).to_numpy()
+    issues = [
+        f"{prefix}: respondent {respondents[row.index]} has only "
+        f"{row.shared_bins} bins overlapping the other respondents"
+        for row in per_respondent.loc[
+            per_respondent["shared_bins"] < window_bins
+        ].itertuples(index=False)
+    ]
+
+    per_respondent = per_respondent.loc[
+        per_respondent["shared_bins"] >= window_bins
+    ]
+    diagnostics = pd.DataFrame(
+        {
+            **labels,
+            "respondent_id": respondents[per_respondent["index"].to_numpy()],
+            "shared_bins": per_respondent["shared_bins"].to_numpy(),
+            "windows_generated": per_respondent["windows_generated"].to_numpy(),
+        },
+        columns=LEAVE_ONE_OUT_DIAGNOSTIC_COLUMNS,
+    )
+    if windows.empty:
+        return None, diagnostics, issues
+    frame = _window_frame(
+        labels,
+        {"respondent_id": respondents[windows["index"].to_numpy()]},
+        windows,
+        LEAVE_ONE_OUT_COLUMNS,
+        window_bins=window_bins,
+        step_bins=step_bins,
+        bin_seconds=bin_seconds,
+    )
+    return frame, diagnostics, issues
+
+
+_ISC_MODES = {
+    "pairwise": _pairwise_group,
+    "leave_one_out": _leave_one_out_group,
+}
+
+
+def _group_matrices(
+    binned,
+    value_column: str,
+    group_columns: Sequence[str],
+) -> Iterator[tuple[dict[str, object], RespondentBinMatrix]]:
+    """Yield (labels, matrix) per title/form/group/metric.
+
+    ``binned`` is a long frame or binned tensors (a mapping or iterable of
+    :class:`~wbdlib.binned_tensor.BinnedTensor`); tensors are read
+    directly, using only bins that pass coverage.
+    """
+
+    group_columns = list(group_columns)
+    if isinstance(binned, pd.DataFrame):
+        for group_key, group_df in binned.groupby(group_columns, observed=True):
+            yield (
+                dict(zip(group_columns, group_key)),
+                pivot_respondent_bins(group_df, value_column=value_column),
+            )
+        return
+
+    tensors = binned.values() if isinstance(binned, Mapping) else binned
+    items: list[tuple[tuple, dict[str, object], RespondentBinMatrix]] = []
+    for tensor in tensors:
+        group_labels = pd.unique(np.asarray(tensor.groups, dtype=object))
+        for group in group_labels:
+            if pd.isna(group):
+                continue
+            for sensor, metric in tensor.metrics:
+                matrix = tensor.respondent_matrix(
+                    (sensor, metric),
+                    field=value_column,
+                    group=group,
+                )
+                if not matrix.respondents:
+                    continue
+                labels = {
+                    "title": tensor.title,
+                    "form": tensor.form,
+                    "group": group,
+                    "metric": metric,
+                }
+                key = tuple(labels.get(column) for column in group_columns)
+                items.append((key, labels, matrix))
+    items.sort(key=lambda item: item[0])
+    for _, labels, matrix in items:
+        yield labels, matrix
+
+
+def compute_isc(
+    binned: pd.DataFrame | Iterable | Mapping,
+    *,
+    window_bins: int,
+    step_bins: int,
+    bin_seconds: float,
+    mode: str = "pairwise",
+    value_column: str = "value_smoothed",
+    group_columns: Sequence[str] = DEFAULT_ISC_GROUP_COLUMNS,
+) -> ISCResult:
+    """Sliding-window ISC for each title/form/group/metric.
+
+    ``mode="pairwise"`` correlates every respondent pair (quadratic in
+    respondents); ``mode="leave_one_out"`` correlates each respondent with
+    the mean of the others and returns one time course per respondent.
+    ``binned`` holds respondent bins that already passed coverage checks,
+    either as a long frame or as binned tensors. Group rows with missing
+    keys are skipped, as ``groupby`` does.
+    """
+
+    try:
+        run_group = _ISC_MODES[mode]
+    except KeyError:
+        raise ValueError(
+            f"Unknown ISC mode {mode!r}; expected one of {sorted(_ISC_MODES)}"
+        ) from None
+
+    window_frames: list[pd.DataFrame] = []
+    diagnostic_frames: list[pd.DataFrame] = []
+    issues: list[str] = []
+    for labels, matrix in _group_matrices(binned, value_column, group_columns):
+        prefix = f"{labels.get('title')}/{labels.get('form')}/{labels.get('metric')}"
+        if len(matrix.respondents) < 2:
+            issues.append(f"{prefix}: fewer than two respondents with valid bins")
+            continue
+
+        frame, diagnostics, group_issues = run_group(
+            matrix,
+            labels,
+            prefix,
+            window_bins,
+            step_bins,
+            bin_seconds,
+        )
+        issues.extend(group_issues)
+        diagnostic_frames.append(diagnostics)
+        if frame is not None:
+            window_frames.append(frame)
+
+    windows_df = (
+        pd.concat(window_frames, ignore_index=True)
+        if window_frames
+        else pd.DataFrame()
+    )
+    diagnostics_df = (
+        pd.concat(diagnostic_frames, ignore_index=True)
+        if diagnostic_frames
+        else pd.DataFrame()
+    )
+    return ISCResult(
+        pairwise=windows_df,
+        diagnostics=diagnostics_df,
+        issues=tuple(issues),
+        mode=mode,
+    )
+
+
+def summarise_isc_curves(
+    pairwise_df: pd.DataFrame,
+    *,
+    curve_group_columns: Sequence[str] = (
+        *DEFAULT_ISC_GROUP_COLUMNS,
+        "window_mid_seconds",
+    ),
+) -> pd.DataFrame:
+    """Roll window-level ISC values up to title/form curves.
+
+    Adds the mean, median, standard deviation, SEM and 95% half-width of the
+    correlations plus pair and respondent counts per window. Leave-one-out
+    frames (no ``pair_key``) count one series per respondent, so
+    ``pair_count`` equals ``respondent_count`` there.
+    """
+
+    curve_group_columns = list(curve_group_columns)
+    series_column = (
+        "pair_key" if "pair_key" in pairwise_df.columns else "respondent_id"
+    )
+    curve_stats = (
+        pairwise_df.groupby(curve_group_columns, dropna=False, observed=True)
+        .agg(
+            corr_mean=("corr_value", "mean"),
+            corr_median=("corr_value", "median"),
+            corr_std=("corr_value", "std"),
+            pair_count=(series_column, "nunique"),
+        )
+        .reset_index()
+    )
+    curve_stats["corr_std"] = curve_stats["corr_std"].fillna(0.0)
+    curve_stats["corr_sem"] = curve_stats["corr_std"] / np.sqrt(
+        curve_stats["pair_count"].clip(lower=1)
+    )
+    curve_stats["corr_ci95"] = curve_stats["corr_sem"] * 1.96
+
+    if series_column == "pair_key":
+        long_pairs = pairwise_df[
+            curve_group_columns + ["respondent_a", "respondent_b"]
+        ].melt(
+            id_vars=curve_group_columns,
+            value_vars=["respondent_a", "respondent_b"],
+            value_name="respondent_id",
+        )
+    else:
+        long_pairs = pairwise_df[curve_group_columns + ["respondent_id"]]
+    respondent_counts = (
+        long_pairs.groupby(
+            curve_group_columns,
+            dropna=False,
+            observed=True,
+        )["respondent_id"]
+        .nunique()
+        .reset_index(name="respondent_count")
+    )
+    curve_stats = curve_stats.merge(
+        respondent_counts,
+        on=curve_group_columns,
+        how="left",
+    )
+    curve_stats["respondent_count"] = (
+        curve_stats["respondent_count"].fillna(0).astype(int)
+    )
+    return curve_stats
+
+
+__all__ = [
+    "DEFAULT_ISC_GROUP_COLUMNS",
+    "ISCResult",
+    "LEAVE_ONE_OUT_COLUMNS",
+    "LEAVE_ONE_OUT_DIAGNOSTIC_COLUMNS",
+    "PAIRWISE_COLUMNS",
+    "PAIR_DIAGNOSTIC_COLUMNS",
+    "RespondentBinMatrix",
+    "compute_isc",
+    "leave_one_out_window_correlations",
+    "pairwise_window_correlations",
+    "pivot_respondent_bins",
+    "summarise_isc_curves",
+]
@@ -0,0 +1,282 @@
+"""Circular-shift null distribution for inter-subject correlation curves.
+
+Each surrogate shifts every respondent's binned series by an independent
+random offset, which keeps the series' own autocorrelation but breaks the
+alignment to the stimulus that shared responses depend on. Shifted
+respondent matrices are strided views into a doubled copy of the observed
+matrix, and surrogates are evaluated in chunks whose size is capped so that
+memory stays bounded regardless of the number of surrogates.
+
+The curve statistic is the mean leave-one-out correlation per window of
+contiguous bins, so a surrogate costs O(respondents x bins) rather than the
+quadratic pairwise cost.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .isc import (
+    DEFAULT_ISC_GROUP_COLUMNS,
+    RespondentBinMatrix,
+    _is_constant,
+    _window_correlations,
+    pivot_respondent_bins,
+)
+from .stats import adjust_p_values
+
+
+ISC_NULL_COLUMNS = [
+    "title",
+    "form",
+    "group",
+    "metric",
+    "window_index",
+    "window_start_bin",
+    "window_end_bin",
+    "window_start_seconds",
+    "window_end_seconds",
+    "window_mid_seconds",
+    "observed_isc",
+    "respondent_count",
+    "null_mean",
+    "null_std",
+    "n_surrogates",
+    "p_value",
+    "p_fdr",
+    "significant",
+]
+
+# Upper bound on gathered window elements per surrogate chunk.
+_MAX_SURROGATE_ELEMENTS = 1 << 23
+
+
+def _contiguous_bins(matrix: RespondentBinMatrix) -> RespondentBinMatrix:
+    """Reindex ``matrix`` onto every bin between its first and last bin."""
+
+    if matrix.bins.size == 0:
+        return matrix
+    bins = np.arange(matrix.bins[0], matrix.bins[-1] + 1)
+    if bins.size == matrix.bins.size:
+        return matrix
+    values = np.full((len(matrix.respondents), bins.size), np.nan)
+    values[:, matrix.bins - bins[0]] = matrix.values
+    return RespondentBinMatrix(
+        respondents=matrix.respondents,
+        bins=bins,
+        values=values,
+        bin_start=np.interp(bins, matrix.bins, matrix.bin_start),
+        bin_end=np.interp(bins, matrix.bins, matrix.bin_end),
+        bin_midpoint=np.interp(bins, matrix.bins, matrix.bin_midpoint),
+    )
+
+
+def circular_shift_surrogates(
+    values: np.ndarray,
+    shifts: np.ndarray,
+) -> np.ndarray:
+    """Return ``values`` rolled per respondent by ``shifts``.
+
+    ``values`` is (respondents x bins) and ``shifts`` is (surrogates x
+    respondents); row ``r`` of surrogate ``s`` equals
+    ``np.roll(values[r], -shifts[s, r])``. The rows are read from strided
+    views of the doubled matrix, so only the returned array is allocated.
+    """
+
+    n_respondents, n_bins = values.shape
+    doubled = np.concatenate([values, values], axis=1)
+    views = sliding_window_view(doubled, n_bins, axis=1)
+    return views[np.arange(n_respondents)[None, :], shifts % n_bins]
+
+
+def leave_one_out_curve(
+    values: np.ndarray,
+    *,
+    window_bins: int,
+    step_bins: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Mean leave-one-out ISC per window for stacked respondent matrices.
+
+    ``values`` is (..., respondents, bins) with NaN for missing bins. A
+    respondent contributes to a window only when it and the mean of the
+    others are complete and non-constant there. Returns the mean correlation
+    and the number of contributing respondents, both shaped (..., windows).
+    """
+
+    mask = np.isfinite(values)
+    filled = np.where(mask, values, 0.0)
+    totals = filled.sum(axis=-2, keepdims=True)
+    others = mask.sum(axis=-2, keepdims=True) - mask
+    with np.errstate(invalid="ignore", divide="ignore"):
+        reference = np.where(others > 0, (totals - filled) / others, np.nan)
+
+    starts = np.arange(0, values.shape[-1] - window_bins + 1, step_bins)
+    own = sliding_window_view(values, window_bins, axis=-1)[..., starts, :]
+    ref = sliding_window_view(reference, window_bins, axis=-1)[..., starts, :]
+    corr = _window_correlations(own, ref)
+    keep = (
+        np.isfinite(own).all(axis=-1)
+        & np.isfinite(ref).all(axis=-1)
+        & ~_is_constant(own)
+        & ~_is_constant(ref)
+        & np.isfinite(corr)
+    )
+    counts = keep.sum(axis=-2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(keep, corr, 0.0).sum(axis=-2) / counts
+    return np.where(counts > 0, mean, np.nan), counts
+
+
+def surrogate_isc_curves(
+    matrix: RespondentBinMatrix,
+    *,
+    window_bins: int,
+    step_bins: int,
+    n_surrogates: int,
+    rng: np.random.Generator,
+    min_shift: int | None = None,
+    max_elements: int = _MAX_SURROGATE_ELEMENTS,
+) -> np.ndarray:
+    """Leave-one-out ISC curves for ``n_surrogates`` circular shifts.
+
+    Shifts are drawn uniformly from ``[min_shift, bins - min_shift]`` so no
+    respondent stays close to its observed alignment; ``min_shift`` defaults
+    to one window. Returns a (surrogates x windows) array.
+    """
+
+    n_respondents, n_bins = matrix.values.shape
+    min_shift = window_bins if min_shift is None else int(min_shift)
+    if n_bins - 2 * min_shift < 0:
+        raise ValueError(
+            f"{n_bins} bins leave no room for shifts of at least {min_shift}"
+        )
+    n_windows = max((n_bins - window_bins) // step_bins + 1, 0)
+    per_surrogate = max(n_respondents * n_windows * window_bins, 1)
+    chunk = max(1, max_elements // per_surrogate)
+
+    curves = np.empty((n_surrogates, n_windows))
+    for lo in range(0, n_surrogates, chunk):
+        hi = min(lo + chunk, n_surrogates)
+        shifts = rng.integers(
+            min_shift,
+            n_bins - min_shift + 1,
+            size=(hi - lo, n_respondents),
+        )
+        surrogates = circular_shift_surrogates(matrix.values, shifts)
+        curves[lo:hi], _ = leave_one_out_curve(
+            surrogates,
+            window_bins=window_bins,
+            step_bins=step_bins,
+        )
+    return curves
+
+
+def isc_null_test(
+    binned: pd.DataFrame,
+    *,
+    window_bins: int,
+    step_bins: int,
+    n_surrogates: int = 1000,
+    seed: int | np.random.Generator | None = None,
+    alpha: float = 0.05,
+    min_shift: int | None = None,
+    value_column: str = "value_smoothed",
+    group_columns: Sequence[str] = DEFAULT_ISC_GROUP_COLUMNS,
+) -> pd.DataFrame:
+    """Per-window circular-shift p-values for each title/form/group/metric.
+
+    ``p_value`` is the one-sided share of surrogate curves at or above the
+    observed mean ISC, with the usual +1 correction; ``p_fdr`` applies
+    Benjamini-Hochberg across the windows of each curve and ``significant``
+    flags ``p_fdr <= alpha``. Groups with fewer than two respondents, or too
+    few bins to shift, are skipped. Passing the same ``seed`` reproduces the
+    surrogates exactly.
+    """
+
+    rng = np.random.default_rng(seed)
+    group_columns = list(group_columns)
+    frames: list[pd.DataFrame] = []
+    for group_key, group_df in binned.groupby(group_columns, observed=True):
+        labels = dict(zip(group_columns, group_key))
+        matrix = _contiguous_bins(
+            pivot_respondent_bins(group_df, value_column=value_column)
+        )
+        n_bins = matrix.bins.size
+        shift = window_bins if min_shift is None else int(min_shift)
+        if (
+            len(matrix.respondents) < 2
+            or n_bins < window_bins
+            or n_bins - 2 * shift < 0
+        ):
+            continue
+
+        observed, respondent_count = leave_one_out_curve(
+            matrix.values,
+            window_bins=window_bins,
+            step_bins=step_bins,
+        )
+        null = surrogate_isc_curves(
+            matrix,
+            window_bins=window_bins,
+            step_bins=step_bins,
+            n_surrogates=n_surrogates,
+            rng=rng,
+            min_shift=shift,
+        )
+        finite_null = np.isfinite(null)
+        exceed = (finite_null & (null >= observed[None, :])).sum(axis=0)
+        valid = finite_null.sum(axis=0)
+        p_value = np.where(
+            np.isfinite(observed) & (valid > 0),
+            (exceed + 1) / (valid + 1),
+            np.nan,
+        )
+        p_fdr = adjust_p_values(p_value, method="fdr_bh")
+        with np.errstate(invalid="ignore"):
+            null_mean = np.nanmean(np.where(finite_null, null, np.nan), axis=0)
+            null_std = np.nanstd(np.where(finite_null, null, np.nan), axis=0)
+
+        starts = np.arange(0, n_bins - window_bins + 1, step_bins)
+        ends = starts + window_bins - 1
+        frames.append(
+            pd.DataFrame(
+                {
+                    **labels,
+                    "window_index": np.arange(starts.size),
+                    "window_start_bin": matrix.bins[starts],
+                    "window_end_bin": matrix.bins[ends],
+                    "window_start_seconds": matrix.bin_start[starts],
+                    "window_end_seconds": matrix.bin_end[ends],
+                    "window_mid_seconds": sliding_window_view(
+                        matrix.bin_midpoint,
+                        window_bins,
+                    )[starts].mean(axis=1),
+                    "observed_isc": observed,
+                    "respondent_count": respondent_count,
+                    "null_mean": null_mean,
+                    "null_std": null_std,
+                    "n_surrogates": valid,
+                    "p_value": p_value,
+                    "p_fdr": p_fdr,
+                    "significant": p_fdr <= alpha,
+                },
+                columns=ISC_NULL_COLUMNS,
+            )
+        )
+
+    if not frames:
+        return pd.DataFrame(columns=ISC_NULL_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+__all__ = [
+    "ISC_NULL_COLUMNS",
+    "circular_shift_surrogates",
+    "isc_null_test",
+    "leave_one_out_curve",
+    "surrogate_isc_curves",
+]
@@ -0,0 +1,485 @@
+"""Mixed-effects models fitted per metric/stat across the long table.
+
+:func:`fit_mixed_models` fits one linear mixed model (by default
+``form * group`` fixed effects with a random intercept per respondent) for
+every sensor/metric/stat in a table from
+:func:`~wbdlib.biometric.reshape_biometric_long`. Keys whose observations
+share the same respondents and covariates share one design matrix, which
+is built once; their fits run back to back so each can start from the
+previous solution. Keys are spread over a process pool and, with
+``cache_dir``, each fitted summary is stored under a hash of its data and
+the model configuration so unchanged keys are not refitted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+# Bump when a change alters fitted output so cached summaries are refitted.
+MIXED_MODEL_CODE_VERSION = "1"
+
+MIXED_MODEL_COEFFICIENT_COLUMNS: tuple[str, ...] = (
+    "term",
+    "coef",
+    "std_err",
+    "z",
+    "p_value",
+    "ci_low",
+    "ci_high",
+)
+
+_CACHE_SUFFIX = ".pkl"
+# Keys sharing a design are split into tasks of at most this many fits so
+# large designs still spread over the pool.
+_FITS_PER_TASK = 16
+
+
+def _require_statsmodels():
+    try:
+        from statsmodels.regression.mixed_linear_model import MixedLM
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "Mixed-effects models require 'statsmodels'; install it with "
+            "`pip install statsmodels`."
+        ) from exc
+    return MixedLM
+
+
+@dataclass(frozen=True)
+class MixedModelConfig:
+    """Model specification shared by every metric/stat fit.
+
+    ``fixed_effects`` is the right-hand side of a patsy formula for the
+    response ``value``; ``covariates`` names the columns it reads. The
+    random intercept is taken over ``random_intercept``. ``methods`` are
+    the optimisers tried in order until one converges.
+    """
+
+    fixed_effects: str = "C(form, Treatment('Short')) * C(group)"
+    covariates: tuple[str, ...] = ("form", "group")
+    random_intercept: str = "respondent_id"
+    reml: bool = True
+    methods: tuple[str, ...] = ("bfgs", "lbfgs", "cg")
+    maxiter: int = 200
+    confidence: float = 0.95
+
+
+@dataclass(frozen=True)
+class MixedModelFit:
+    """Fixed-effect estimates and variance components for one key."""
+
+    key: tuple[str, ...]
+    coefficients: pd.DataFrame
+    group_variance: float
+    residual_variance: float
+    llf: float
+    n_obs: int
+    n_groups: int
+    converged: bool
+
+
+@dataclass(frozen=True)
+class MixedModelResults:
+    """Outcome of :func:`fit_mixed_models`.
+
+    ``coefficients`` stacks every fit's coefficient table behind the key
+    columns and ``summary`` holds one row per fitted key. Keys whose fit
+    failed are reported in ``issues`` instead.
+    """
+
+    fits: Mapping[tuple[str, ...], MixedModelFit]
+    coefficients: pd.DataFrame
+    summary: pd.DataFrame
+    issues: tuple[str, ...]
+    designs: int
+    cache_hits: int
+
+
+@dataclass(frozen=True)
+class _DesignTask:
+    exog: np.ndarray
+    exog_names: tuple[str, ...]
+    groups: np.ndarray
+    fits: tuple[tuple[tuple[str, ...], np.ndarray], ...]
+    config: MixedModelConfig
+
+
+def _hash_frame(frame: pd.DataFrame) -> bytes:
+    hashed = pd.util.hash_pandas_object(frame, index=False)
+    return hashed.to_numpy().tobytes()
+
+
+def _fit_cache_key(
+    config: MixedModelConfig,
+    key: tuple[str, ...],
+    data: pd.DataFrame,
+) -> str:
+    from statsmodels import __version__ as statsmodels_version
+
+    digest = hashlib.sha1()
+    for part in (
+        MIXED_MODEL_CODE_VERSION,
+        statsmodels_version,
+        repr(config),
+        repr(key),
+        list(data.columns),
+    ):
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    digest.update(_hash_frame(data))
+    return digest.hexdigest()[:20]
+
+
+def _key_slug(key: tuple[str, ...]) -> str:
+    text = re.sub(r"[^A-Za-z0-9_.-]+", "_", "-".join(map(str, key)))
+    return text.strip("_") or "model"
+
+
+def _cache_path(cache_dir: str | Path, key: tuple[str, ...], digest: str) -> Path:
+    return Path(cache_dir) / f"{_key_slug(key)}--{digest}{_CACHE_SUFFIX}"
+
+
+def _load_cached_fit(
+    cache_dir: str | Path,
+    key: tuple[str, ...],
+    digest: str,
+) -> MixedModelFit | None:
+    path = _cache_path(cache_dir, key, digest)
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as handle:
+            fit = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+    return fit if isinstance(fit, MixedModelFit) else None
+
+
+def _store_cached_fit(
+    cache_dir: str | Path,
+    digest: str,
+    fit: MixedModelFit,
+) -> Path:
+    directory = Path(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    target = _cache_path(directory, fit.key, digest)
+    tmp_path = target.with_name(target.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        pickle.dump(fit, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, target)
+
+    slug = _key_slug(fit.key)
+    for stale in directory.glob(f"{slug}--*{_CACHE_SUFFIX}"):
+        if stale != target and stale.stem.rsplit("--", 1)[0] == slug:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return target
+
+
+def _summarise_fit(
+    key: tuple[str, ...],
+    result: Any,
+    exog_names: Sequence[str],
+    n_groups: int,
+    scale: float,
+    confidence: float,
+) -> MixedModelFit:
+    # The model was fitted to ``value / scale``; fixed effects and standard
+    # errors scale back linearly and variances quadratically. z and p are
+    # unchanged by the rescaling.
+    k_fe = len(exog_names)
+    coef = np.asarray(result.fe_params, dtype=float) * scale
+    std_err = np.asarray(result.bse_fe, dtype=float) * scale
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = coef / std_err
+    p_value = 2 * stats.norm.sf(np.abs(z))
+    half_width = stats.norm.ppf(0.5 + confidence / 2) * std_err
+    coefficients = pd.DataFrame(
+        {
+            "term": list(exog_names),
+            "coef": coef,
+            "std_err": std_err,
+            "z": z,
+            "p_value": p_value,
+            "ci_low": coef - half_width,
+            "ci_high": coef + half_width,
+        },
+        columns=list(MIXED_MODEL_COEFFICIENT_COLUMNS),
+    )
+    n_obs = int(result.nobs)
+    dof = n_obs - k_fe if result.model.reml else n_obs
+    return MixedModelFit(
+        key=key,
+        coefficients=coefficients,
+        group_variance=float(np.asarray(result.cov_re)[0, 0]) * scale**2,
+        residual_variance=float(result.scale) * scale**2,
+        llf=float(result.llf) - dof * np.log(scale),
+        n_obs=n_obs,
+        n_groups=n_groups,
+        converged=bool(result.converged),
+    )
+
+
+def _fit_with_fallback(
+    model: Any,
+    start_params: Any,
+    config: MixedModelConfig,
+) -> tuple[Any, Exception | None]:
+    """Try ``config.methods`` in turn until a fit converges.
+
+    Only the first attempt uses ``start_params``; fallbacks start cold. The
+    last fit is returned unconverged when no method converges.
+    """
+
+    from statsmodels.tools.sm_exceptions import ConvergenceWarning
+
+    result, error = None, None
+    for method in config.methods:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", ConvergenceWarning)
+                warnings.simplefilter("ignore", RuntimeWarning)
+                result = model.fit(
+                    start_params=start_params,
+                    reml=config.reml,
+                    method=method,
+                    maxiter=config.maxiter,
+                )
+        except (np.linalg.LinAlgError, ValueError) as exc:
+            error = exc
+        else:
+            if result.converged:
+                break
+        start_params = None
+    return result, error
+
+
+def _fit_design_task(
+    task: _DesignTask,
+) -> list[MixedModelFit | str]:
+    """Fit every response sharing one design, warm-starting each fit."""
+
+    MixedLM = _require_statsmodels()
+    config = task.config
+    n_groups = int(np.unique(task.groups).size)
+    start_params = None
+    outcomes: list[MixedModelFit | str] = []
+    for key, endog in task.fits:
+        # Fitting a unit-scale response keeps the previous solution a
+        # sensible starting point whatever the metric's units.
+        scale = float(np.std(endog))
+        if not np.isfinite(scale) or scale == 0:
+            scale = 1.0
+        model = MixedLM(endog / scale, task.exog, groups=task.groups)
+        result, error = _fit_with_fallback(model, start_params, config)
+        if result is None:
+            outcomes.append(f"{'/'.join(map(str, key))}: {error}")
+            start_params = None
+            continue
+        start_params = result.params_object if result.converged else None
+        outcomes.append(
+            _summarise_fit(
+                key,
+                result,
+                task.exog_names,
+                n_groups,
+                scale,
+                config.confidence,
+            )
+        )
+    return outcomes
+
+
+def _build_design(
+    data: pd.DataFrame,
+    config: MixedModelConfig,
+) -> tuple[np.ndarray, tuple[str, ...], np.ndarray]:
+    from patsy import dmatrix
+
+    covariates = data[list(config.covariates)].copy()
+    for column in covariates.columns:
+        if isinstance(covariates[column].dtype, pd.CategoricalDtype):
+            covariates[column] = covariates[
+                column
+            ].cat.remove_unused_categories()
+    design = dmatrix(config.fixed_effects, covariates, return_type="dataframe")
+    groups = pd.factorize(data[config.random_intercept].to_numpy())[0]
+    return (
+        design.to_numpy(dtype=float),
+        tuple(design.columns),
+        groups,
+    )
+
+
+def fit_mixed_models(
+    long_df: pd.DataFrame,
+    *,
+    config: MixedModelConfig | None = None,
+    respondent_groups: Mapping[object, object] | pd.Series | None = None,
+    key_columns: Sequence[str] = ("sensor", "metric", "stat"),
+    keys: Sequence[tuple[str, ...]] | None = None,
+    max_workers: int | None = None,
+    cache_dir: str | Path | None = None,
+) -> MixedModelResults:
+    """Fit ``config``'s mixed model for every key in ``long_df``.
+
+    ``respondent_groups`` maps respondent ids to a ``group`` column when
+    the table does not already carry one. ``keys`` restricts the fits to
+    the listed ``key_columns`` tuples. Rows with a missing value or
+    covariate are dropped per key. Pass ``max_workers=1`` (or 0) to fit
+    serially in the current process.
+    """
+
+    _require_statsmodels()
+    config = config or MixedModelConfig()
+    key_columns = list(key_columns)
+    frame = long_df
+    if respondent_groups is not None:
+        frame = frame.assign(
+            group=frame[config.random_intercept].map(respondent_groups)
+        )
+    needed = [*key_columns, config.random_intercept, *config.covariates]
+    columns = list(dict.fromkeys([*needed, "value"]))
+    frame = frame[columns].dropna(subset=[*needed, "value"])
+    if keys is not None:
+        wanted = pd.MultiIndex.from_tuples(
+            [tuple(key) for key in keys],
+            names=key_columns,
+        )
+        frame = frame.loc[
+            pd.MultiIndex.from_frame(frame[key_columns]).isin(wanted)
+        ]
+    # Stable row order within each key so identical layouts hash alike.
+    layout_columns = [config.random_intercept, *config.covariates]
+    frame = frame.sort_values(
+        [*key_columns, *layout_columns],
+        kind="stable",
+    )
+
+    fits: dict[tuple[str, ...], MixedModelFit] = {}
+    issues: list[str] = []
+    cache_keys: dict[tuple[str, ...], str] = {}
+    layouts: dict[bytes, list[tuple[tuple[str, ...], pd.DataFrame]]] = {}
+    for raw_key, data in frame.groupby(key_columns, observed=True, sort=True):
+        key = tuple(str(part) for part in raw_key)
+        if cache_dir is not None:
+            cache_keys[key] = _fit_cache_key(config, key, data)
+            cached = _load_cached_fit(cache_dir, key, cache_keys[key])
+            if cached is not None:
+                fits[key] = cached
+                continue
+        layout = hashlib.sha1(_hash_frame(data[layout_columns])).digest()
+        layouts.setdefault(layout, []).append((key, data))
+    cache_hits = len(fits)
+
+    tasks: list[_DesignTask] = []
+    for members in layouts.values():
+        try:
+            exog, exog_names, groups = _build_design(members[0][1], config)
+        except Exception as exc:  # patsy raises its own error types
+            issues.extend(
+                f"{'/'.join(key)}: could not build design ({exc})"
+                for key, _ in members
+            )
+            continue
+        responses = [
+            (key, data["value"].to_numpy(dtype=float))
+            for key, data in members
+        ]
+        for lo in range(0, len(responses), _FITS_PER_TASK):
+            tasks.append(
+                _DesignTask(
+                    exog=exog,
+                    exog_names=exog_names,
+                    groups=groups,
+                    fits=tuple(responses[lo:lo + _FITS_PER_TASK]),
+                    config=config,
+                )
+            )
+
+    serial = (max_workers is not None and max_workers <= 1) or len(tasks) <= 1
+    if serial:
+        computed = [_fit_design_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            computed = list(executor.map(_fit_design_task, tasks))
+
+    for outcomes in computed:
+        for outcome in outcomes:
+            if isinstance(outcome, str):
+                issues.append(outcome)
+                continue
+            fits[outcome.key] = outcome
+            if cache_dir is not None:
+                _store_cached_fit(cache_dir, cache_keys[outcome.key], outcome)
+
+    ordered = dict(sorted(fits.items()))
+    coefficient_frames = [
+        fit.coefficients.assign(
+            **dict(zip(key_columns, key))
+        )[[*key_columns, *MIXED_MODEL_COEFFICIENT_COLUMNS]]
+        for key, fit in ordered.items()
+    ]
+    coefficients = (
+        pd.concat(coefficient_frames, ignore_index=True)
+        if coefficient_frames
+        else pd.DataFrame(
+            columns=[*key_columns, *MIXED_MODEL_COEFFICIENT_COLUMNS]
+        )
+    )
+    summary = pd.DataFrame(
+        [
+            {
+                **dict(zip(key_columns, key)),
+                "n_obs": fit.n_obs,
+                "n_groups": fit.n_groups,
+                "group_variance": fit.group_variance,
+                "residual_variance": fit.residual_variance,
+                "llf": fit.llf,
+                "converged": fit.converged,
+            }
+            for key, fit in ordered.items()
+        ],
+        columns=[
+            *key_columns,
+            "n_obs",
+            "n_groups",
+            "group_variance",
+            "residual_variance",
+            "llf",
+            "converged",
+        ],
+    )
+    return MixedModelResults(
+        fits=ordered,
+        coefficients=coefficients,
+        summary=summary,
+        issues=tuple(issues),
+        designs=len(layouts),
+        cache_hits=cache_hits,
+    )
+
+
+__all__ = [
+    "MIXED_MODEL_COEFFICIENT_COLUMNS",
+    "MIXED_MODEL_CODE_VERSION",
+    "MixedModelConfig",
+    "MixedModelFit",
+    "MixedModelResults",
+    "fit_mixed_models",
+]
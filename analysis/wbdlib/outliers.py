@@ -0,0 +1,253 @@
+"""Vectorised outlier detection for (respondent x key x column) score arrays.
+
+Bounds for every key and column come from one sort (or moment) pass over
+the whole array rather than one pandas call per metric/stat. The
+paired within-subject tests screen the Long, Short and Long-Short columns
+of each key together; :func:`outlier_audit` lists every flag as a sparse
+(respondent, key, column, reason) table so summaries can report why a
+respondent was excluded without recomputing the bounds.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Literal, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+OutlierMethod = Literal["iqr", "zscore", "mad"]
+OutlierAction = Literal["remove", "winsorize"]
+DEFAULT_OUTLIER_METHOD: OutlierMethod = "iqr"
+
+PAIRED_OUTLIER_COLUMNS: tuple[str, ...] = ("Long", "Short", "Long-Short")
+
+OUTLIER_AUDIT_COLUMNS: tuple[str, ...] = (
+    "column",
+    "reason",
+    "value",
+    "lower",
+    "upper",
+    "method",
+)
+
+# Scales a median absolute deviation to a standard deviation under
+# normality (the 0.6745 of Iglewicz and Hoaglin's modified z-score).
+_MAD_CONSISTENCY = 0.6745
+
+
+@dataclass(frozen=True)
+class OutlierFlags:
+    """Bounds and flags for a (respondent x key x column) array.
+
+    ``lower`` and ``upper`` are (key x column) and NaN where the spread is
+    zero or undefined, which flags nobody; ``low`` and ``high`` mark values
+    beyond them.
+    """
+
+    method: OutlierMethod
+    lower: np.ndarray
+    upper: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+
+    @property
+    def mask(self) -> np.ndarray:
+        """(respondent x key) mask of respondents flagged in any column."""
+
+        return (self.low | self.high).any(axis=-1)
+
+
+def paired_outlier_columns(scores: np.ndarray) -> np.ndarray:
+    """Append the Long-Short difference to a (respondent x key x 2) cube."""
+
+    scores = np.asarray(scores, dtype=float)
+    return np.concatenate(
+        [scores, (scores[..., 0] - scores[..., 1])[..., None]],
+        axis=-1,
+    )
+
+
+def nan_quantiles(
+    values: np.ndarray,
+    quantiles: Sequence[float],
+) -> np.ndarray:
+    """``np.nanquantile(values, quantiles, axis=0)`` from one sort.
+
+    ``np.nanquantile`` falls back to a per-column loop whenever NaNs are
+    present; sorting once (NaNs sort last) and interpolating between the
+    ranks bracketing each quantile gives the same linear-interpolation
+    result for every column together. Columns without values give NaN.
+    """
+
+    values = np.asarray(values, dtype=float)
+    if values.shape[0] == 0:
+        return np.full((len(quantiles), *values.shape[1:]), np.nan)
+    ordered = np.sort(values, axis=0)
+    count = (~np.isnan(values)).sum(axis=0)
+    quantiles = np.asarray(quantiles, dtype=float).reshape(
+        (-1,) + (1,) * (values.ndim - 1)
+    )
+    position = quantiles * np.maximum(count - 1, 0)
+    below = np.floor(position).astype(np.intp)
+    above = np.minimum(below + 1, np.maximum(count - 1, 0))
+    fraction = position - below
+    low = np.take_along_axis(ordered, below, axis=0)
+    high = np.take_along_axis(ordered, above, axis=0)
+    # Same interpolation as numpy's linear method.
+    step = high - low
+    result = np.where(
+        fraction >= 0.5,
+        high - step * (1 - fraction),
+        low + step * fraction,
+    )
+    return np.where(count > 0, result, np.nan)
+
+
+def outlier_bounds(
+    columns: np.ndarray,
+    *,
+    method: OutlierMethod = DEFAULT_OUTLIER_METHOD,
+    whisker_width: float = 1.5,
+    z_threshold: float = 3.0,
+    mad_threshold: float = 3.5,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bounds over the respondent axis of ``columns``.
+
+    ``"iqr"`` uses Tukey fences ``whisker_width`` IQRs beyond the
+    quartiles, ``"zscore"`` the mean plus or minus ``z_threshold``
+    standard deviations and ``"mad"`` the median plus or minus
+    ``mad_threshold`` robust (MAD-based) z-units. Missing values are
+    ignored.
+    """
+
+    columns = np.asarray(columns, dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if method == "iqr":
+            q1, q3 = nan_quantiles(columns, [0.25, 0.75])
+            spread = q3 - q1
+            lower = q1 - whisker_width * spread
+            upper = q3 + whisker_width * spread
+        elif method == "zscore":
+            centre = np.nanmean(columns, axis=0)
+            spread = np.nanstd(columns, axis=0)
+            lower = centre - z_threshold * spread
+            upper = centre + z_threshold * spread
+        elif method == "mad":
+            centre = nan_quantiles(columns, [0.5])[0]
+            spread = nan_quantiles(np.abs(columns - centre), [0.5])[0]
+            reach = mad_threshold * spread / _MAD_CONSISTENCY
+            lower = centre - reach
+            upper = centre + reach
+        else:
+            raise ValueError(f"Unsupported outlier method '{method}'")
+    valid = np.isfinite(spread) & (spread != 0)
+    return np.where(valid, lower, np.nan), np.where(valid, upper, np.nan)
+
+
+def detect_outliers(
+    columns: np.ndarray,
+    *,
+    method: OutlierMethod = DEFAULT_OUTLIER_METHOD,
+    whisker_width: float = 1.5,
+    z_threshold: float = 3.0,
+    mad_threshold: float = 3.5,
+) -> OutlierFlags:
+    """Flag values of ``columns`` outside :func:`outlier_bounds`."""
+
+    columns = np.asarray(columns, dtype=float)
+    if columns.size == 0:
+        empty = np.zeros(columns.shape, dtype=bool)
+        bounds = np.full(columns.shape[1:], np.nan)
+        return OutlierFlags(method, bounds, bounds, empty, empty)
+    lower, upper = outlier_bounds(
+        columns,
+        method=method,
+        whisker_width=whisker_width,
+        z_threshold=z_threshold,
+        mad_threshold=mad_threshold,
+    )
+    with np.errstate(invalid="ignore"):
+        low = columns < lower
+        high = columns > upper
+    return OutlierFlags(method, lower, upper, low, high)
+
+
+def winsorize(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """Clip ``values`` to broadcastable bounds; NaN bounds clip nothing."""
+
+    values = np.asarray(values, dtype=float)
+    lower = np.where(np.isnan(lower), -np.inf, lower)
+    upper = np.where(np.isnan(upper), np.inf, upper)
+    return np.clip(values, lower, upper)
+
+
+def outlier_audit(
+    flags: OutlierFlags,
+    columns: np.ndarray,
+    respondents: Sequence[object],
+    keys: Sequence[tuple[object, ...]],
+    *,
+    column_names: Sequence[str] = PAIRED_OUTLIER_COLUMNS,
+    id_column: str = "respondent_id",
+    key_names: Sequence[str] = ("metric", "stat"),
+) -> pd.DataFrame:
+    """One row per flagged (respondent, key, column) with the broken bound.
+
+    ``reason`` is ``"low"`` or ``"high"``. Only flagged entries are listed,
+    so the table stays small however many keys were screened.
+    """
+
+    key_names = list(key_names)
+    parts = []
+    for reason, hits in (("low", flags.low), ("high", flags.high)):
+        rows, key_pos, column_pos = np.nonzero(hits)
+        parts.append((reason, rows, key_pos, column_pos))
+    rows = np.concatenate([part[1] for part in parts])
+    key_pos = np.concatenate([part[2] for part in parts])
+    column_pos = np.concatenate([part[3] for part in parts])
+    reasons = np.repeat(
+        [part[0] for part in parts],
+        [part[1].size for part in parts],
+    )
+    order = np.lexsort((column_pos, key_pos, rows))
+    rows, key_pos, column_pos = rows[order], key_pos[order], column_pos[order]
+
+    key_array = np.empty(len(keys), dtype=object)
+    key_array[:] = [tuple(key) for key in keys]
+    audit = pd.DataFrame(
+        {id_column: np.asarray(respondents, dtype=object)[rows]}
+    )
+    for position, name in enumerate(key_names):
+        audit[name] = [key[position] for key in key_array[key_pos]]
+    audit["column"] = np.asarray(column_names, dtype=object)[column_pos]
+    audit["reason"] = reasons[order]
+    values = np.asarray(columns, dtype=float)
+    audit["value"] = values[rows, key_pos, column_pos]
+    audit["lower"] = flags.lower[key_pos, column_pos]
+    audit["upper"] = flags.upper[key_pos, column_pos]
+    audit["method"] = flags.method
+    return audit[[id_column, *key_names, *OUTLIER_AUDIT_COLUMNS]]
+
+
+__all__ = [
+    "DEFAULT_OUTLIER_METHOD",
+    "OUTLIER_AUDIT_COLUMNS",
+    "OutlierAction",
+    "OutlierFlags",
+    "OutlierMethod",
+    "PAIRED_OUTLIER_COLUMNS",
+    "detect_outliers",
+    "nan_quantiles",
+    "outlier_audit",
+    "outlier_bounds",
+    "paired_outlier_columns",
+    "winsorize",
+]
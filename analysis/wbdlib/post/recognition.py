@@ -10,6 +10,7 @@ from typing import Any, Iterable
 import numpy as np
 import pandas as pd
 
+from ..schema import apply_long_schema
 from .io import PostFile, extract_question_code, merge_duplicate_columns
 
 TITLE_NORMALIZATION = {
@@ -697,7 +698,7 @@ def build_recognition_features(
     return RecognitionResult(
         features=recognition_features,
         issues=issues_df,
-        records=recognition_df,
+        records=apply_long_schema(recognition_df),
         composite_columns=composite_columns,
         raw_columns=raw_columns,
         respondent_post_paths=respondent_post_paths,
@@ -0,0 +1,154 @@
+"""Canonical column dtypes for the long-form analysis tables.
+
+The long tables repeat a few labels (respondent, title, form, sensor,
+metric, stat) on every row. Stored as categoricals those labels cost one
+integer code per row, and groupbys with ``observed=True`` run on the codes.
+Value columns are stored as float32 and bin indices in the narrowest
+integer type that holds them. Statistics computed from float32 values match
+float64 input only to float32 precision.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Literal, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .biometric import FORM_ORDER, KNOWN_SENSORS, KNOWN_STATS
+
+
+ColumnKind = Literal["category", "float32", "integer"]
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Target dtype for one long-table column.
+
+    ``categories`` lists labels that always come first in a category
+    column; labels found in the data but not listed are appended in sorted
+    order, so a cast never turns a value into NaN.
+    """
+
+    kind: ColumnKind
+    categories: tuple[object, ...] = ()
+    ordered: bool = False
+
+
+_CATEGORY = ColumnSpec("category")
+_FLOAT32 = ColumnSpec("float32")
+_INTEGER = ColumnSpec("integer")
+
+LONG_TABLE_SCHEMA: Mapping[str, ColumnSpec] = {
+    "respondent_id": _CATEGORY,
+    "respondent": _CATEGORY,
+    "group": _CATEGORY,
+    "title": _CATEGORY,
+    "form": ColumnSpec("category", FORM_ORDER, ordered=True),
+    "sensor": ColumnSpec("category", KNOWN_SENSORS),
+    "metric": _CATEGORY,
+    "stat": ColumnSpec("category", KNOWN_STATS),
+    "raw_stimulus": _CATEGORY,
+    "smoothing_label": _CATEGORY,
+    "source_path": _CATEGORY,
+    "category": _CATEGORY,
+    "accuracy": _CATEGORY,
+    "column_name": _CATEGORY,
+    "value": _FLOAT32,
+    "value_mean": _FLOAT32,
+    "value_median": _FLOAT32,
+    "value_std": _FLOAT32,
+    "value_smoothed": _FLOAT32,
+    "coverage": _FLOAT32,
+    "bin": _INTEGER,
+    "sample_count": _INTEGER,
+    "question_number": _INTEGER,
+}
+
+_INTEGER_DTYPES = (np.int16, np.int32, np.int64)
+
+
+def _sorted_labels(labels: Iterable[object]) -> list[object]:
+    labels = list(labels)
+    try:
+        return sorted(labels)
+    except TypeError:
+        return sorted(labels, key=str)
+
+
+def _as_category(series: pd.Series, spec: ColumnSpec) -> pd.Series:
+    # One factorize pass finds the labels and their codes; the codes are
+    # then remapped onto the final category order. Missing values carry
+    # code -1, which the trailing -1 in ``positions`` maps to itself.
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.cat.remove_unused_categories()
+        codes = series.cat.codes.to_numpy()
+        present = series.cat.categories
+    else:
+        codes, present = pd.factorize(series.to_numpy())
+    declared = set(spec.categories)
+    extras = _sorted_labels(label for label in present if label not in declared)
+    dtype = pd.CategoricalDtype(
+        [*spec.categories, *extras],
+        ordered=spec.ordered,
+    )
+    if series.dtype == dtype:
+        return series
+    positions = np.append(dtype.categories.get_indexer(present), -1)
+    return pd.Series(
+        pd.Categorical.from_codes(positions[codes], dtype=dtype),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def _as_compact_integer(series: pd.Series) -> pd.Series:
+    if not pd.api.types.is_integer_dtype(series.dtype) or series.empty:
+        return series
+    low, high = series.min(), series.max()
+    for dtype in _INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return series.astype(dtype)
+    return series
+
+
+def _cast(series: pd.Series, spec: ColumnSpec) -> pd.Series:
+    if spec.kind == "category":
+        return _as_category(series, spec)
+    if spec.kind == "float32":
+        return pd.to_numeric(series, errors="coerce").astype(np.float32)
+    if spec.kind == "integer":
+        return _as_compact_integer(series)
+    raise ValueError(f"Unknown column kind {spec.kind!r}")
+
+
+def apply_long_schema(
+    frame: pd.DataFrame,
+    schema: Mapping[str, ColumnSpec] = LONG_TABLE_SCHEMA,
+) -> pd.DataFrame:
+    """Return ``frame`` with the columns named in ``schema`` cast to its dtypes.
+
+    Other columns are left untouched. Integer columns are narrowed to the
+    smallest of int16/int32/int64 that holds their range; integer columns
+    that arrive as float because of missing values keep their dtype.
+    Re-applying the schema after a ``pd.concat`` restores categoricals whose
+    category sets differed between the pieces.
+    """
+
+    converted = {
+        column: _cast(frame[column], schema[column])
+        for column in frame.columns
+        if column in schema
+    }
+    if not converted:
+        return frame
+    return frame.assign(**converted)
+
+
+__all__ = [
+    "ColumnSpec",
+    "LONG_TABLE_SCHEMA",
+    "apply_long_schema",
+]
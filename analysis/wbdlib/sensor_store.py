@@ -0,0 +1,347 @@
+"""Persistent columnar cache for iMotions sensor exports.
+
+The raw exports are wide CSV files that take longer to parse than any of the
+downstream processing. The store converts each export to a Parquet file the
+first time it is read and serves later reads straight from the columnar copy,
+so only the requested columns are decoded. Entries are keyed on the source
+path, modification time and size, which means an updated export is converted
+again automatically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import pandas as pd
+
+from .imotions import (
+    DEFAULT_SENSOR_EXPORT_PATTERN,
+    read_imotions_data,
+    scan_imotions_file,
+)
+
+
+SENSOR_STORE_ENV = "WBD_SENSOR_STORE"
+
+_METADATA_KEY = b"wbd_imotions"
+_STORE_SUFFIX = ".parquet"
+
+# read_csv options that only influence how the CSV text is parsed. They have
+# no meaning for a columnar read, so the store can safely ignore them.
+# ``encoding`` is deliberately absent: the conversion decodes with the
+# encoding detected from the header, so an explicit one is read from the CSV.
+_PARSE_ONLY_KWARGS = frozenset(
+    {"low_memory", "engine", "on_bad_lines", "memory_map"}
+)
+_STORE_KWARGS = frozenset({"usecols", "nrows"})
+
+_store_dir: Path | None = None
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "The sensor store requires 'pyarrow'; install it with "
+            "`pip install pyarrow`."
+        ) from exc
+    return pq
+
+
+def set_sensor_store(path: str | Path | None) -> Path | None:
+    """Enable (or disable with ``None``) the default sensor store location."""
+
+    global _store_dir
+    if path is None:
+        _store_dir = None
+        return None
+    store = Path(path)
+    store.mkdir(parents=True, exist_ok=True)
+    _store_dir = store
+    return store
+
+
+def get_sensor_store() -> Path | None:
+    """Return the active store directory, honouring ``WBD_SENSOR_STORE``."""
+
+    if _store_dir is not None:
+        return _store_dir
+    env_value = os.environ.get(SENSOR_STORE_ENV, "").strip()
+    if env_value:
+        return set_sensor_store(env_value)
+    return None
+
+
+def _resolve_store_dir(store_dir: str | Path | None) -> Path | None:
+    if store_dir is not None:
+        store = Path(store_dir)
+        store.mkdir(parents=True, exist_ok=True)
+        return store
+    return get_sensor_store()
+
+
+def _path_token(path: Path) -> str:
+    resolved = str(path.resolve())
+    return hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:10]
+
+
+def sensor_store_key(path: str | Path) -> str:
+    """Return the cache key for a sensor export (path + mtime + size)."""
+
+    path_obj = Path(path)
+    stat = path_obj.stat()
+    payload = f"{path_obj.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def sensor_store_path(
+    path: str | Path,
+    store_dir: str | Path | None = None,
+    *,
+    suffix: str = _STORE_SUFFIX,
+) -> Path | None:
+    """Return where the columnar copy of ``path`` lives in the store.
+
+    ``suffix`` selects a sidecar entry (for example the stimulus index)
+    that shares the export's cache key.
+    """
+
+    store = _resolve_store_dir(store_dir)
+    if store is None:
+        return None
+    path_obj = Path(path)
+    name = (
+        f"{path_obj.stem}-{_path_token(path_obj)}-"
+        f"{sensor_store_key(path_obj)}{suffix}"
+    )
+    return store / name
+
+
+def _remove_stale_entries(path: Path, target: Path, suffix: str) -> None:
+    """Drop entries produced from older versions of the same export."""
+
+    prefix = f"{path.stem}-{_path_token(path)}-"
+    for stale in target.parent.glob(f"{prefix}*{suffix}"):
+        if stale != target and stale.name.endswith(suffix):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _replace_atomically(target: Path, write: Callable[[Path], None]) -> None:
+    """Write ``target`` through a process-unique temporary file.
+
+    Concurrent builders of the same entry each get their own partial file,
+    so ``os.replace`` only ever moves a complete file into place.
+    """
+
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _stringify_mixed_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Cast object columns to strings so Arrow can serialise them."""
+
+    for column in frame.columns:
+        series = frame[column]
+        if not pd.api.types.is_object_dtype(series.dtype):
+            continue
+        mask = series.notna()
+        frame[column] = series.where(~mask, series.astype(str))
+    return frame
+
+
+def ensure_sensor_store(
+    path: str | Path,
+    *,
+    store_dir: str | Path | None = None,
+    overwrite: bool = False,
+) -> Path:
+    """Convert an export to the store if needed and return the store path."""
+
+    pq = _require_pyarrow()
+    import pyarrow as pa
+
+    path_obj = Path(path)
+    target = sensor_store_path(path_obj, store_dir)
+    if target is None:
+        raise ValueError(
+            "No sensor store configured; call set_sensor_store() or pass "
+            "store_dir explicitly."
+        )
+    if target.exists() and not overwrite:
+        return target
+
+    index = scan_imotions_file(path_obj)
+    frame = read_imotions_data(index, low_memory=False)
+    frame = _stringify_mixed_columns(frame)
+    file_metadata = {
+        "metadata": dict(index.metadata),
+        "source_path": str(index.path),
+        "mtime_ns": index.mtime_ns,
+        "size": index.size,
+        "header_rows": index.header_rows,
+    }
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[_METADATA_KEY] = json.dumps(file_metadata).encode("utf-8")
+    table = table.replace_schema_metadata(schema_metadata)
+
+    _replace_atomically(target, lambda tmp: pq.write_table(table, tmp))
+
+    _remove_stale_entries(path_obj, target, _STORE_SUFFIX)
+    return target
+
+
+def read_store_sidecar(
+    path: str | Path,
+    suffix: str,
+    *,
+    store_dir: str | Path | None = None,
+) -> Any | None:
+    """Return the JSON sidecar saved for ``path`` or ``None`` if absent."""
+
+    target = sensor_store_path(path, store_dir, suffix=suffix)
+    if target is None or not target.exists():
+        return None
+    try:
+        return json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_store_sidecar(
+    path: str | Path,
+    suffix: str,
+    payload: Any,
+    *,
+    store_dir: str | Path | None = None,
+) -> Path | None:
+    """Persist a JSON sidecar for ``path``; returns ``None`` without a store."""
+
+    path_obj = Path(path)
+    target = sensor_store_path(path_obj, store_dir, suffix=suffix)
+    if target is None:
+        return None
+    text = json.dumps(payload)
+    _replace_atomically(
+        target, lambda tmp: tmp.write_text(text, encoding="utf-8")
+    )
+    _remove_stale_entries(path_obj, target, suffix)
+    return target
+
+
+def read_sensor_store_metadata(store_path: str | Path) -> dict[str, Any]:
+    """Return the file-level metadata block saved alongside a store entry."""
+
+    pq = _require_pyarrow()
+    schema = pq.read_schema(store_path)
+    raw = (schema.metadata or {}).get(_METADATA_KEY)
+    if raw is None:
+        return {}
+    return json.loads(raw.decode("utf-8"))
+
+
+def _select_columns(
+    available: Sequence[str],
+    usecols: Iterable[str] | Callable[[str], bool] | None,
+) -> list[str]:
+    if usecols is None:
+        return list(available)
+    if callable(usecols):
+        return [name for name in available if usecols(name)]
+    requested = list(usecols)
+    if requested and all(isinstance(item, int) for item in requested):
+        positions = set(requested)
+        return [
+            name for idx, name in enumerate(available) if idx in positions
+        ]
+    missing = [name for name in requested if name not in available]
+    if missing:
+        # Mirror the error pandas raises for unknown usecols.
+        raise ValueError(
+            "Usecols do not match columns, columns expected but not found: "
+            f"{missing}"
+        )
+    requested_set = set(requested)
+    return [name for name in available if name in requested_set]
+
+
+def supports_store_read(read_csv_kwargs: Mapping[str, Any]) -> bool:
+    """Return True when ``read_csv`` options can be served by the store."""
+
+    allowed = _PARSE_ONLY_KWARGS | _STORE_KWARGS
+    return all(key in allowed for key in read_csv_kwargs)
+
+
+def read_sensor_store(
+    path: str | Path,
+    metadata: Iterable[str] | None = None,
+    *,
+    store_dir: str | Path | None = None,
+    usecols: Iterable[str] | Callable[[str], bool] | None = None,
+    nrows: int | None = None,
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Load an export from the store, decoding only the requested columns."""
+
+    pq = _require_pyarrow()
+    store_path = ensure_sensor_store(path, store_dir=store_dir)
+    schema = pq.read_schema(store_path)
+    columns = _select_columns(schema.names, usecols)
+    table = pq.read_table(store_path, columns=columns)
+    if nrows is not None:
+        table = table.slice(0, max(int(nrows), 0))
+    frame = table.to_pandas()
+
+    file_metadata = read_sensor_store_metadata(store_path)
+    meta_dict: dict[str, str] = dict(file_metadata.get("metadata", {}))
+    if metadata:
+        requested = set(metadata)
+        meta_dict = {
+            key: value for key, value in meta_dict.items() if key in requested
+        }
+    return frame, meta_dict
+
+
+def convert_sensor_exports(
+    root: str | Path,
+    *,
+    pattern: str = DEFAULT_SENSOR_EXPORT_PATTERN,
+    store_dir: str | Path | None = None,
+    overwrite: bool = False,
+) -> list[Path]:
+    """Populate the store for every export under ``root`` matching pattern."""
+
+    return [
+        ensure_sensor_store(path, store_dir=store_dir, overwrite=overwrite)
+        for path in sorted(Path(root).glob(pattern))
+    ]
+
+
+__all__ = [
+    "DEFAULT_SENSOR_EXPORT_PATTERN",
+    "SENSOR_STORE_ENV",
+    "convert_sensor_exports",
+    "ensure_sensor_store",
+    "get_sensor_store",
+    "read_sensor_store",
+    "read_sensor_store_metadata",
+    "read_store_sidecar",
+    "sensor_store_key",
+    "sensor_store_path",
+    "set_sensor_store",
+    "supports_store_read",
+    "write_store_sidecar",
+]
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import warnings
+from typing import Literal
+
+import numpy as np
 import pandas as pd
 from scipy import stats
 
+ResamplingTest = Literal["bootstrap", "permutation"]
+CorrectionMethod = Literal["holm", "fdr_bh"]
+
+# Upper bound on (resamples x keys) statistics held per chunk of keys.
+_MAX_RESAMPLE_ELEMENTS = 1 << 24
+
 
 def one_tailed_p_from_paired_t(
     long_values,
@@ -29,4 +39,214 @@ def one_tailed_p_from_paired_t(
     return t_stat, df, p_one, paired
 
 
-__all__ = ["one_tailed_p_from_paired_t"]
+def one_tailed_paired_t_matrix(
+    long_values: np.ndarray,
+    short_values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Column-wise ``one_tailed_p_from_paired_t`` for (respondent x key) arrays.
+
+    Respondents missing either value are dropped per column. Returns the t
+    statistic, degrees of freedom, one-tailed p-value (Long > Short) and
+    pair count for every column; columns with fewer than two pairs get NaN
+    statistics.
+    """
+
+    long_values = np.asarray(long_values, dtype=float)
+    short_values = np.asarray(short_values, dtype=float)
+    both = np.isfinite(long_values) & np.isfinite(short_values)
+    n_pairs = both.sum(axis=0)
+    deltas = np.where(both, long_values - short_values, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_delta = deltas.sum(axis=0) / n_pairs
+        spread = np.where(both, deltas - mean_delta, 0.0)
+        variance = (spread * spread).sum(axis=0) / (n_pairs - 1)
+        t_stat = mean_delta / np.sqrt(variance / n_pairs)
+    df = np.maximum(n_pairs - 1, 0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        p_one = np.where(
+            n_pairs > 1,
+            stats.t.sf(t_stat, np.maximum(df, 1)),
+            np.nan,
+        )
+    t_stat = np.where(n_pairs > 1, t_stat, np.nan)
+    return t_stat, df, p_one, n_pairs
+
+
+def bootstrap_index_matrix(
+    n_items: int,
+    n_resamples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Return (resamples x items) row indices drawn with replacement."""
+
+    return rng.integers(0, n_items, size=(n_resamples, n_items), dtype=np.int32)
+
+
+def sign_flip_matrix(
+    n_items: int,
+    n_resamples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Return (resamples x items) random signs of +1 or -1."""
+
+    flips = rng.integers(0, 2, size=(n_resamples, n_items), dtype=np.int8)
+    return 1.0 - 2.0 * flips
+
+
+def _resample_weights(indices: np.ndarray) -> np.ndarray:
+    """Count how often each item appears in every row of ``indices``."""
+
+    n_resamples, n_items = indices.shape
+    offsets = indices + n_items * np.arange(n_resamples)[:, None]
+    counts = np.bincount(offsets.ravel(), minlength=indices.size)
+    return counts.reshape(indices.shape).astype(float)
+
+
+def paired_resampling_test(
+    long_values: np.ndarray,
+    short_values: np.ndarray,
+    *,
+    test: ResamplingTest = "bootstrap",
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    seed: int | np.random.Generator | None = None,
+    max_elements: int = _MAX_RESAMPLE_ELEMENTS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resampled one-tailed tests of Long > Short for (respondent x key) arrays.
+
+    Keys sharing the same set of complete pairs share one resample matrix,
+    drawn once, and every resampled mean difference comes from a matrix
+    product over those keys. Keys are processed in chunks so at most
+    ``max_elements`` resampled statistics are held at once; the draws do
+    not depend on the chunking, so a seed reproduces results exactly.
+
+    ``"bootstrap"`` resamples respondents with replacement and returns the
+    share of resampled mean differences at or below zero plus a percentile
+    confidence interval. ``"permutation"`` flips the sign of each
+    respondent's difference and returns the share of flipped means at or
+    above the observed mean; its interval is NaN. Both p-values carry the
+    usual +1 correction. Returns ``(p_value, ci_low, ci_high)`` per key;
+    keys with fewer than two pairs get NaN.
+    """
+
+    if test not in ("bootstrap", "permutation"):
+        raise ValueError(
+            f"Unknown resampling test {test!r}; "
+            "expected 'bootstrap' or 'permutation'"
+        )
+    long_values = np.asarray(long_values, dtype=float)
+    short_values = np.asarray(short_values, dtype=float)
+    rng = np.random.default_rng(seed)
+    both = np.isfinite(long_values) & np.isfinite(short_values)
+    differences = long_values - short_values
+    n_keys = both.shape[1]
+    p_value = np.full(n_keys, np.nan)
+    ci_low = np.full(n_keys, np.nan)
+    ci_high = np.full(n_keys, np.nan)
+    if n_keys == 0:
+        return p_value, ci_low, ci_high
+    alpha = 1.0 - confidence
+    chunk = max(1, max_elements // max(n_resamples, 1))
+
+    # Respondent sets are visited in order of their first key so the draws
+    # for a given seed do not depend on how the sets sort.
+    patterns, first_keys, key_sets = np.unique(
+        both.T,
+        axis=0,
+        return_index=True,
+        return_inverse=True,
+    )
+    key_sets = key_sets.ravel()
+    for item in np.argsort(first_keys):
+        rows = np.flatnonzero(patterns[item])
+        if rows.size < 2:
+            continue
+        keys = np.flatnonzero(key_sets == item)
+        if test == "bootstrap":
+            weights = _resample_weights(
+                bootstrap_index_matrix(rows.size, n_resamples, rng)
+            )
+        else:
+            weights = sign_flip_matrix(rows.size, n_resamples, rng)
+        for lo in range(0, keys.size, chunk):
+            block = keys[lo:lo + chunk]
+            deltas = differences[np.ix_(rows, block)]
+            observed = np.ones(rows.size) @ deltas / rows.size
+            resampled = weights @ deltas / rows.size
+            if test == "bootstrap":
+                extreme = (resampled <= 0).sum(axis=0)
+                ci_low[block], ci_high[block] = np.quantile(
+                    resampled,
+                    [alpha / 2, 1 - alpha / 2],
+                    axis=0,
+                )
+            else:
+                tolerance = 1e-12 * np.maximum(np.abs(observed), 1.0)
+                extreme = (resampled >= observed - tolerance).sum(axis=0)
+            p_value[block] = (extreme + 1) / (n_resamples + 1)
+    return p_value, ci_low, ci_high
+
+
+def adjust_p_values(
+    p_values: np.ndarray,
+    families: np.ndarray | None = None,
+    *,
+    method: CorrectionMethod = "holm",
+) -> np.ndarray:
+    """Holm or Benjamini-Hochberg adjusted p-values within each family.
+
+    ``families`` gives an integer family code per p-value (one family when
+    omitted). All families are corrected together: one sort orders the
+    p-values within their family and the step-down/step-up running
+    extremes are taken over the whole array, offset per family so they
+    never cross a family boundary. NaN p-values are left out of the family
+    sizes and stay NaN.
+    """
+
+    if method not in ("holm", "fdr_bh"):
+        raise ValueError(
+            f"Unknown correction {method!r}; expected 'holm' or 'fdr_bh'"
+        )
+    p_values = np.asarray(p_values, dtype=float)
+    adjusted = np.full(p_values.shape, np.nan)
+    finite = np.flatnonzero(np.isfinite(p_values))
+    if finite.size == 0:
+        return adjusted
+    if families is None:
+        codes = np.zeros(finite.size, dtype=np.int64)
+    else:
+        codes = pd.factorize(np.asarray(families)[finite], sort=True)[0]
+    order = np.lexsort((p_values[finite], codes))
+    codes = codes[order]
+    values = p_values[finite][order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, codes.size])
+    family_start = np.repeat(starts, sizes)
+    family_size = np.repeat(sizes, sizes)
+    rank = np.arange(codes.size) - family_start + 1
+    # Adjusted values lie in [0, 1], so an offset of 2 per family keeps the
+    # running max (min) from carrying into the next (previous) family.
+    offset = 2.0 * np.repeat(np.arange(starts.size), sizes)
+    if method == "holm":
+        scaled = np.minimum((family_size - rank + 1) * values, 1.0)
+        result = np.maximum.accumulate(scaled + offset) - offset
+    else:
+        scaled = np.minimum(values * family_size / rank, 1.0)
+        result = (
+            np.minimum.accumulate((scaled + offset)[::-1])[::-1] - offset
+        )
+    adjusted[finite[order]] = result
+    return adjusted
+
+
+__all__ = [
+    "CorrectionMethod",
+    "ResamplingTest",
+    "adjust_p_values",
+    "bootstrap_index_matrix",
+    "one_tailed_p_from_paired_t",
+    "one_tailed_paired_t_matrix",
+    "paired_resampling_test",
+    "sign_flip_matrix",
+]
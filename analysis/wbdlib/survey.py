@@ -10,6 +10,7 @@ from typing import Any, Iterable, Mapping, Sequence
 import numpy as np
 import pandas as pd
 
+from .events import detect_events
 from .imotions import read_imotions
 from .uv import extract_group_letter
 
@@ -278,7 +279,10 @@ def get_biometric_data(
     The implementation mirrors the original notebook helper: it aggregates
     sensor features per stimulus and writes ``biometric_results.csv`` and
     ``errors_biometric.csv`` under ``results_folder``. Both DataFrames are
-    returned so callers can bypass the on-disk outputs if desired.
+    returned so callers can bypass the on-disk outputs if desired. New code
+    should use :func:`wbdlib.features.extract_features_batch`, which emits
+    the ``{form}_{title}_{sensor}_{metric}_{stat}`` columns the biometric
+    helpers parse.
     """
 
     in_path = Path(in_folder)
@@ -386,12 +390,8 @@ def get_biometric_data(
                 try:
                     gsr_data = df_task[["Timestamp", "Peak Detected"]].dropna()
                     mask = gsr_data["Peak Detected"] == 1
-                    segments = (mask != mask.shift()).cumsum()
-                    count_patches = (
-                        gsr_data.loc[mask, "Peak Detected"]
-                        .groupby(segments)
-                        .ngroup()
-                        .nunique()
+                    count_patches = int(
+                        detect_events(mask.to_numpy()).counts.sum()
                     )
                     interaction[f"sens_{window}_GSR_PeakDetected_Binary"] = (
                         1 if gsr_data["Peak Detected"].sum() > 0 else 0
@@ -408,12 +408,8 @@ def get_biometric_data(
                         ["Timestamp", "Blink Detected"]
                     ].dropna()
                     mask = blink_data["Blink Detected"] == 1
-                    segments = (mask != mask.shift()).cumsum()
-                    count_patches = (
-                        blink_data.loc[mask, "Blink Detected"]
-                        .groupby(segments)
-                        .ngroup()
-                        .nunique()
+                    count_patches = int(
+                        detect_events(mask.to_numpy()).counts.sum()
                     )
                     interaction[
                         f"sens_{window}_ET_Blink_Count"
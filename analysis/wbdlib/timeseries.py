@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
-from scipy.signal import butter, filtfilt
+from scipy.signal import butter, sosfiltfilt
 
-from .imotions import read_imotions
+from .batch import RespondentSensorJob, coerce_job, run_respondent_jobs
+from .imotions import (
+    build_stimulus_index,
+    read_imotions,
+    read_imotions_rows,
+    scan_imotions_file,
+)
+from .schema import apply_long_schema
 
 
+# Bump whenever a change alters processing outputs so cached respondent
+# results (see ``wbdlib.timeseries_cache``) are recomputed.
+TIME_SERIES_CODE_VERSION = "4"
+
 DEFAULT_SENSOR_METRICS: Mapping[str, tuple[str, ...]] = {
     "FAC": (
         "Anger",
@@ -84,6 +95,18 @@ class SensorProcessingResult:
     metadata: Mapping[str, str]
 
 
+@dataclass(frozen=True)
+class SensorBatchResult:
+    """Combined outputs of :func:`process_sensor_time_series_batch`."""
+
+    binned: pd.DataFrame
+    diagnostics: pd.DataFrame
+    issues: tuple[str, ...]
+    metadata: pd.DataFrame
+    processed: int
+    cache_hits: int = 0
+
+
 @lru_cache(maxsize=1)
 def _get_canonicalise_title():
     """Return canonicalise_title without triggering circular imports."""
@@ -186,6 +209,27 @@ def build_stimulus_lookup(
     return lookup
 
 
+def resolve_stimulus_in_group(
+    stimulus_name: str,
+    group: object | None,
+    stimulus_lookup: Mapping[tuple[str, str], Mapping[str, str]],
+) -> tuple[str, str] | None:
+    """Return (title, form) from the group's own rename entries, else None.
+
+    Unlike :func:`resolve_stimulus_identity` there is no fallback to other
+    groups, so a missing or unknown group resolves nothing.
+    """
+
+    try:
+        group_key = _clean_group(group)
+    except ValueError:
+        return None
+    record = stimulus_lookup.get((group_key, _canonical_token(stimulus_name)))
+    if not record:
+        return None
+    return record["title"], record["form"]
+
+
 def resolve_stimulus_identity(
     stimulus_name: str,
     group: str,
@@ -194,10 +238,12 @@ def resolve_stimulus_identity(
     """Return the canonical (title, form) pair for a raw stimulus label."""
 
     group_key = _clean_group(group)
+    resolved = resolve_stimulus_in_group(
+        stimulus_name, group_key, stimulus_lookup
+    )
+    if resolved is not None:
+        return resolved
     stim_key = _canonical_token(stimulus_name)
-    record = stimulus_lookup.get((group_key, stim_key))
-    if record:
-        return record["title"], record["form"]
     candidates = [
         record
         for (_group_key, token), record in stimulus_lookup.items()
@@ -336,6 +382,216 @@ def extract_stimulus_segment(
     return window
 
 
+def load_stimulus_segment(
+    path: str | Path,
+    stimulus_name: str,
+    *,
+    usecols: Iterable[str] | Callable[[str], bool] | None = None,
+    stimulus_col: str = "SourceStimuliName",
+    timestamp_col: str = "Timestamp",
+    event_col: str = "SlideEvent",
+    start_label: str = "StartMedia",
+    end_label: str = "EndMedia",
+    align_to_zero: bool = True,
+    **read_csv_kwargs,
+) -> pd.DataFrame:
+    """Load and align one stimulus without parsing the rest of the export.
+
+    The rows are located through :func:`build_stimulus_index`; when the
+    index has no byte offsets for the stimulus the whole file is read
+    instead. The result matches ``extract_stimulus_segment`` applied to
+    ``load_sensor_file``.
+    """
+
+    runs = [
+        run
+        for run in build_stimulus_index(
+            path,
+            stimulus_col=stimulus_col,
+            timestamp_col=timestamp_col,
+            event_col=event_col,
+            start_label=start_label,
+            end_label=end_label,
+        )
+        if run.stimulus == stimulus_name
+    ]
+    if not runs:
+        raise KeyError(
+            f"Stimulus '{stimulus_name}' not present in sensor file"
+        )
+
+    required = {stimulus_col, timestamp_col, event_col}
+    if callable(usecols):
+        selector = usecols
+        read_csv_kwargs["usecols"] = (
+            lambda name: name in required or bool(selector(name))
+        )
+    elif usecols is not None:
+        read_csv_kwargs["usecols"] = list(
+            dict.fromkeys([*usecols, *sorted(required)])
+        )
+
+    if all(run.start_offset is not None for run in runs):
+        frame = read_imotions_rows(
+            scan_imotions_file(path),
+            runs,
+            **read_csv_kwargs,
+        )
+    else:
+        frame, _ = read_imotions(path, **read_csv_kwargs)
+    if timestamp_col in frame.columns:
+        frame = frame.sort_values(timestamp_col).reset_index(drop=True)
+    return extract_stimulus_segment(
+        frame,
+        stimulus_name,
+        stimulus_col=stimulus_col,
+        timestamp_col=timestamp_col,
+        event_col=event_col,
+        start_label=start_label,
+        end_label=end_label,
+        align_to_zero=align_to_zero,
+    )
+
+
+_BIN_RESULT_COLUMNS = [
+    "bin",
+    "bin_start",
+    "bin_end",
+    "bin_midpoint",
+    "value_mean",
+    "value_median",
+    "value_std",
+    "sample_count",
+    "coverage",
+    "passes_coverage",
+]
+
+# Values at or beyond this magnitude are iMotions "no data" sentinels.
+SENTINEL_LIMIT = 9000
+
+
+def _bin_matrix_statistics(
+    times: np.ndarray,
+    values: np.ndarray,
+    *,
+    bin_width: float,
+    min_coverage: Sequence[float | None],
+) -> list[pd.DataFrame]:
+    """Bin every row of ``values`` (metrics x samples) against ``times``.
+
+    Bin indices are derived once from the shared time axis. Each metric is
+    then sorted by (bin, value) with a single column-wise argsort, so all
+    statistics, including the median, are contiguous segment reductions.
+    Missing and sentinel samples sink to the end of their bin and are
+    excluded through the validity mask.
+    """
+
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    n_metrics = values.shape[0]
+    valid = (
+        np.isfinite(times)[None, :]
+        & ~np.isnan(values)
+        & (values < SENTINEL_LIMIT)
+        & (values > -SENTINEL_LIMIT)
+    )
+    rows = valid.any(axis=0)
+    if not rows.any():
+        return [
+            pd.DataFrame(columns=_BIN_RESULT_COLUMNS)
+            for _ in range(n_metrics)
+        ]
+    times = times[rows]
+    values = values[:, rows]
+    valid = valid[:, rows]
+
+    bins = np.floor(times / bin_width).astype(np.int64)
+    order = np.argsort(bins, kind="stable")
+    bins = bins[order]
+    times = times[order]
+    values = values[:, order]
+    valid = valid[:, order]
+
+    n_samples = bins.size
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    bin_sizes = np.diff(np.r_[starts, n_samples])
+    bin_rank = np.repeat(np.arange(starts.size, dtype=np.int64), bin_sizes)
+
+    keyed = np.where(valid, values, np.inf)
+    value_rank = np.empty_like(bin_rank, shape=keyed.shape)
+    np.put_along_axis(
+        value_rank,
+        np.argsort(keyed, axis=1, kind="stable"),
+        np.arange(n_samples, dtype=np.int64)[None, :],
+        axis=1,
+    )
+    column_order = np.argsort(bin_rank[None, :] * n_samples + value_rank, axis=1)
+    sorted_values = np.take_along_axis(keyed, column_order, axis=1)
+    sorted_valid = np.take_along_axis(valid, column_order, axis=1)
+    sorted_times = times[column_order]
+
+    counts = np.add.reduceat(sorted_valid.astype(np.int64), starts, axis=1)
+    filled = np.where(sorted_valid, sorted_values, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.add.reduceat(filled, starts, axis=1) / counts
+        deviations = np.where(
+            sorted_valid,
+            sorted_values - np.repeat(means, bin_sizes, axis=1),
+            0.0,
+        )
+        squares = np.add.reduceat(deviations * deviations, starts, axis=1)
+        stds = np.where(
+            counts > 1,
+            np.sqrt(squares / np.maximum(counts - 1, 1)),
+            0.0,
+        )
+    lower = np.clip(starts[None, :] + (counts - 1) // 2, 0, n_samples - 1)
+    upper = np.clip(starts[None, :] + counts // 2, 0, n_samples - 1)
+    medians = 0.5 * (
+        np.take_along_axis(sorted_values, lower, axis=1)
+        + np.take_along_axis(sorted_values, upper, axis=1)
+    )
+
+    # A bin whose samples share one timestamp has no measurable span; the
+    # median spacing of its samples is then zero (or undefined), so the
+    # coverage falls back to a full bin width.
+    spans = np.maximum.reduceat(
+        np.where(sorted_valid, sorted_times, -np.inf), starts, axis=1
+    ) - np.minimum.reduceat(
+        np.where(sorted_valid, sorted_times, np.inf), starts, axis=1
+    )
+    effective = np.where(np.isfinite(spans) & (spans > 0.0), spans, bin_width)
+    coverage = np.minimum(1.0, effective / bin_width)
+
+    bin_ids = bins[starts]
+    results: list[pd.DataFrame] = []
+    for idx in range(n_metrics):
+        present = counts[idx] > 0
+        if not present.any():
+            results.append(pd.DataFrame(columns=_BIN_RESULT_COLUMNS))
+            continue
+        ids = bin_ids[present]
+        metric_coverage = coverage[idx, present]
+        results.append(
+            pd.DataFrame(
+                {
+                    "bin": ids,
+                    "bin_start": ids * bin_width,
+                    "bin_end": (ids + 1) * bin_width,
+                    "bin_midpoint": (ids + 0.5) * bin_width,
+                    "value_mean": means[idx, present],
+                    "value_median": medians[idx, present],
+                    "value_std": stds[idx, present],
+                    "sample_count": counts[idx, present],
+                    "coverage": metric_coverage,
+                    "passes_coverage": (
+                        metric_coverage >= (min_coverage[idx] or 0.0)
+                    ),
+                }
+            )
+        )
+    return results
+
+
 def bin_time_series(
     frame: pd.DataFrame,
     value_column: str,
@@ -354,93 +610,108 @@ def bin_time_series(
         raise KeyError(f"Column '{value_column}' not present for binning")
     cleaned = frame[[time_column, value_column]].dropna()
     if cleaned.empty:
-        return pd.DataFrame(
-            columns=[
-                "bin",
-                "bin_start",
-                "bin_end",
-                "bin_midpoint",
-                "value_mean",
-                "value_median",
-                "value_std",
-                "sample_count",
-                "coverage",
-                "passes_coverage",
-            ]
-        )
-    cleaned = cleaned.sort_values(time_column)
-    bin_indices = np.floor(cleaned[time_column] / bin_width).astype(int)
-    cleaned = cleaned.assign(bin=bin_indices)
-    records: list[dict[str, float | int | bool]] = []
-    for bin_id, chunk in cleaned.groupby("bin"):
-        chunk = chunk.loc[(chunk[value_column] < 9000) &
-                          (chunk[value_column] > -9000)]
-        if chunk.empty:
-            continue
-        span = float(chunk[time_column].max() - chunk[time_column].min())
-        effective_span = span
-        if not np.isfinite(effective_span) or effective_span <= 0.0:
-            diffs = (
-                chunk[time_column]
-                .sort_values()
-                .diff()
-                .dropna()
-                .astype(float)
-            )
-            approx_spacing = (
-                float(diffs.median()) if not diffs.empty else np.nan
-            )
-            if not np.isfinite(approx_spacing) or approx_spacing <= 0.0:
-                approx_spacing = bin_width
-            effective_span = approx_spacing
-        coverage = min(1.0, effective_span / bin_width) if bin_width else 0.0
-        passes = coverage >= (min_coverage or 0.0)
-        values = chunk[value_column].astype(float)
-        record = {
-            "bin": int(bin_id),
-            "bin_start": float(bin_id * bin_width),
-            "bin_end": float((bin_id + 1) * bin_width),
-            "bin_midpoint": float((bin_id + 0.5) * bin_width),
-            "value_mean": float(values.mean()),
-            "value_median": float(values.median()),
-            "value_std": float(values.std(ddof=1)) if values.size > 1 else 0.0,
-            "sample_count": int(values.size),
-            "coverage": coverage,
-            "passes_coverage": passes,
-        }
-        records.append(record)
-    result = pd.DataFrame.from_records(records)
-    result = result.sort_values("bin").reset_index(drop=True)
+        return pd.DataFrame(columns=_BIN_RESULT_COLUMNS)
+    return _bin_matrix_statistics(
+        cleaned[time_column].to_numpy(dtype=float),
+        cleaned[value_column].to_numpy(dtype=float)[None, :],
+        bin_width=float(bin_width),
+        min_coverage=(min_coverage,),
+    )[0]
+
+
+@lru_cache(maxsize=None)
+def butterworth_sos(
+    order: int,
+    cutoffs: float | tuple[float, ...],
+    sample_rate_hz: float,
+    btype: str,
+) -> tuple[np.ndarray, int]:
+    """Return memoised second-order sections and the zero-phase pad length.
+
+    The pad length matches what ``filtfilt`` used with the equivalent
+    ``(b, a)`` coefficients, so switching to SOS keeps edge handling.
+    """
+
+    sos = butter(
+        order,
+        cutoffs,
+        fs=sample_rate_hz,
+        btype=btype,
+        analog=False,
+        output="sos",
+    )
+    filter_order = order * (2 if btype in ("band", "bandstop") else 1)
+    return sos, 3 * (filter_order + 1)
+
+
+def zero_phase_filter_matrix(
+    values: np.ndarray,
+    sos: np.ndarray,
+    padlen: int,
+) -> np.ndarray:
+    """Zero-phase filter every row of a (series x samples) matrix at once.
+
+    Gaps are linearly interpolated (edges take the nearest value) before
+    filtering and restored to NaN afterwards. Rows with fewer than
+    ``padlen`` observed samples, or matrices too short to pad, are returned
+    unchanged.
+    """
+
+    values = np.asarray(values, dtype=float)
+    result = values.copy()
+    if values.ndim != 2 or values.shape[1] <= padlen:
+        return result
+    mask = np.isfinite(values)
+    rows = np.flatnonzero(mask.sum(axis=1) >= padlen)
+    if rows.size == 0:
+        return result
+
+    block = values[rows]
+    block_mask = mask[rows]
+    positions = np.arange(block.shape[1])
+    previous = np.maximum.accumulate(
+        np.where(block_mask, positions, -1),
+        axis=1,
+    )
+    following = np.minimum.accumulate(
+        np.where(block_mask, positions, block.shape[1])[:, ::-1],
+        axis=1,
+    )[:, ::-1]
+    left = np.where(previous >= 0, previous, following)
+    right = np.where(following < block.shape[1], following, previous)
+    left_values = np.take_along_axis(block, left, axis=1)
+    right_values = np.take_along_axis(block, right, axis=1)
+    span = right - left
+    weight = np.divide(
+        positions - left,
+        span,
+        out=np.zeros(block.shape),
+        where=span > 0,
+    )
+    filled = left_values + weight * (right_values - left_values)
+
+    filtered = sosfiltfilt(sos, filled, axis=1, padlen=padlen)
+    filtered[~block_mask] = np.nan
+    result[rows] = filtered
     return result
 
 
 def _apply_zero_phase_filter(
     series: pd.Series,
-    b: np.ndarray,
-    a: np.ndarray,
+    sos: np.ndarray,
+    padlen: int,
 ) -> pd.Series:
-    """Apply a filtfilt operation while preserving NaNs and index."""
+    """Apply a zero-phase filter while preserving NaNs and index."""
 
     if series.empty:
         return series.astype(float)
     values = series.astype(float)
-    mask = values.notna()
-    if mask.sum() < max(len(a), len(b)) * 3:
-        return values
-    interpolated = values.interpolate(limit_direction="both")
-    if interpolated.isna().any():
-        interpolated = (
-            interpolated.fillna(method="bfill").fillna(method="ffill")
-        )
-    if interpolated.isna().any():
-        return values
-    try:
-        filtered = filtfilt(b, a, interpolated.to_numpy(), method="pad")
-    except ValueError:
-        return values
-    result = pd.Series(filtered, index=series.index, name=series.name)
-    result.loc[~mask] = np.nan
-    return result
+    filtered = zero_phase_filter_matrix(
+        values.to_numpy()[None, :],
+        sos,
+        padlen,
+    )[0]
+    return pd.Series(filtered, index=series.index, name=series.name)
 
 
 def butterworth_lowpass_filter(
@@ -454,14 +725,13 @@ def butterworth_lowpass_filter(
 
     if cutoff_hz <= 0 or sample_rate_hz <= 0:
         raise ValueError("cutoff_hz and sample_rate_hz must be positive")
-    b, a = butter(
+    sos, padlen = butterworth_sos(
         order,
-        cutoff_hz,
-        fs=sample_rate_hz,
-        btype="low",
-        analog=False,
+        float(cutoff_hz),
+        float(sample_rate_hz),
+        "low",
     )
-    return _apply_zero_phase_filter(series, b, a)
+    return _apply_zero_phase_filter(series, sos, padlen)
 
 
 def butterworth_highpass_filter(
@@ -475,14 +745,13 @@ def butterworth_highpass_filter(
 
     if cutoff_hz <= 0 or sample_rate_hz <= 0:
         raise ValueError("cutoff_hz and sample_rate_hz must be positive")
-    b, a = butter(
+    sos, padlen = butterworth_sos(
         order,
-        cutoff_hz,
-        fs=sample_rate_hz,
-        btype="high",
-        analog=False,
+        float(cutoff_hz),
+        float(sample_rate_hz),
+        "high",
     )
-    return _apply_zero_phase_filter(series, b, a)
+    return _apply_zero_phase_filter(series, sos, padlen)
 
 
 def butterworth_bandpass_filter(
@@ -501,14 +770,13 @@ def butterworth_bandpass_filter(
         raise ValueError("high_cutoff_hz must exceed low_cutoff_hz")
     if sample_rate_hz <= 0:
         raise ValueError("sample_rate_hz must be positive")
-    b, a = butter(
+    sos, padlen = butterworth_sos(
         order,
-        (low_cutoff_hz, high_cutoff_hz),
-        fs=sample_rate_hz,
-        btype="band",
-        analog=False,
+        (float(low_cutoff_hz), float(high_cutoff_hz)),
+        float(sample_rate_hz),
+        "band",
     )
-    return _apply_zero_phase_filter(series, b, a)
+    return _apply_zero_phase_filter(series, sos, padlen)
 
 
 def moving_average(
@@ -544,24 +812,153 @@ def zscore_series(series: pd.Series) -> pd.Series:
     return (values - mean) / std
 
 
-def _create_moving_average_smoother(
-    window: int,
-) -> Callable[[pd.Series], pd.Series]:
-    """Return a centred moving-average smoother with sensible defaults."""
+@dataclass(frozen=True)
+class _MovingAverageSmoother:
+    """Centred moving-average smoother (picklable for worker processes)."""
 
-    if window <= 0:
-        raise ValueError("window must be positive")
+    window: int
+
+    @property
+    def __name__(self) -> str:
+        return f"moving_average_{self.window}"
 
-    def _smooth(series: pd.Series) -> pd.Series:
+    def __call__(self, series: pd.Series) -> pd.Series:
         return moving_average(
             series,
-            window=window,
+            window=self.window,
             center=True,
             min_periods=1,
         )
 
-    _smooth.__name__ = f"moving_average_{window}"
-    return _smooth
+    def smooth_segments(
+        self,
+        values: np.ndarray,
+        starts: np.ndarray,
+    ) -> np.ndarray:
+        """Smooth consecutive segments beginning at ``starts`` in one pass."""
+
+        segment_ids = np.zeros(values.size, dtype=np.int64)
+        segment_ids[starts[1:]] = 1
+        return _segmented_moving_average(
+            values,
+            np.cumsum(segment_ids),
+            self.window,
+        )
+
+
+def _segmented_moving_average(
+    values: np.ndarray,
+    segment_ids: np.ndarray,
+    window: int,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """Centred rolling mean that never reaches across segment boundaries.
+
+    Matches ``moving_average(..., center=True)`` applied to every segment
+    separately. Each window offset is one vectorised pass over the whole
+    array, so the cost grows with ``window`` rather than segment count.
+    """
+
+    n_values = values.size
+    finite = np.isfinite(values)
+    clean = np.where(finite, values, 0.0)
+    total = np.zeros(n_values)
+    count = np.zeros(n_values, dtype=np.int64)
+    for shift in range(-(window // 2), window - window // 2):
+        if abs(shift) >= n_values:
+            continue
+        if shift >= 0:
+            source, target = slice(shift, None), slice(0, n_values - shift)
+        else:
+            source, target = slice(0, n_values + shift), slice(-shift, None)
+        hit = finite[source] & (segment_ids[source] == segment_ids[target])
+        total[target] += np.where(hit, clean[source], 0.0)
+        count[target] += hit
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count >= min_periods, total / count, np.nan)
+
+
+@dataclass(frozen=True)
+class _LowpassSmoother:
+    """Butterworth low-pass smoother (picklable for worker processes)."""
+
+    cutoff_hz: float
+    sample_rate_hz: float
+    order: int
+
+    @property
+    def __name__(self) -> str:
+        return f"butterworth_lowpass_{self.cutoff_hz:.2f}Hz"
+
+    def __call__(self, series: pd.Series) -> pd.Series:
+        return butterworth_lowpass_filter(
+            series,
+            cutoff_hz=self.cutoff_hz,
+            sample_rate_hz=self.sample_rate_hz,
+            order=self.order,
+        )
+
+    def smooth_matrix(self, values: np.ndarray) -> np.ndarray:
+        """Filter equal-length series stacked as rows in one call."""
+
+        sos, padlen = butterworth_sos(
+            self.order,
+            float(self.cutoff_hz),
+            float(self.sample_rate_hz),
+            "low",
+        )
+        return zero_phase_filter_matrix(values, sos, padlen)
+
+
+def smooth_segments(
+    values: np.ndarray,
+    starts: np.ndarray,
+    smoother: Callable[[pd.Series], pd.Series],
+) -> np.ndarray:
+    """Apply ``smoother`` to consecutive segments of ``values`` separately.
+
+    ``starts`` holds the first position of every segment in ascending
+    order. Smoothers with a ``smooth_segments`` method (the moving
+    average) handle every segment in one call; those with
+    ``smooth_matrix`` (the Butterworth low-pass) run once per segment
+    length on the stacked segments; any other callable is applied to each
+    segment as a Series.
+    """
+
+    values = np.asarray(values, dtype=float)
+    starts = np.asarray(starts, dtype=np.int64)
+    if values.size == 0:
+        return values.copy()
+    if hasattr(smoother, "smooth_segments"):
+        return np.asarray(
+            smoother.smooth_segments(values, starts),
+            dtype=float,
+        )
+    bounds = np.r_[starts, values.size]
+    lengths = np.diff(bounds)
+    result = np.empty_like(values)
+    if hasattr(smoother, "smooth_matrix"):
+        for length in np.unique(lengths):
+            members = starts[lengths == length]
+            rows = members[:, None] + np.arange(length)
+            result[rows] = smoother.smooth_matrix(values[rows])
+        return result
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        result[lo:hi] = np.asarray(
+            smoother(pd.Series(values[lo:hi])),
+            dtype=float,
+        )
+    return result
+
+
+def _create_moving_average_smoother(
+    window: int,
+) -> Callable[[pd.Series], pd.Series]:
+    """Return a centred moving-average smoother with sensible defaults."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    return _MovingAverageSmoother(window=window)
 
 
 def _create_lowpass_smoother(
@@ -574,18 +971,11 @@ def _create_lowpass_smoother(
 
     if bin_width <= 0:
         raise ValueError("bin_width must be positive for smoothing")
-    sample_rate = 1.0 / bin_width
-
-    def _smooth(series: pd.Series) -> pd.Series:
-        return butterworth_lowpass_filter(
-            series,
-            cutoff_hz=cutoff_hz,
-            sample_rate_hz=sample_rate,
-            order=order,
-        )
-
-    _smooth.__name__ = f"butterworth_lowpass_{cutoff_hz:.2f}Hz"
-    return _smooth
+    return _LowpassSmoother(
+        cutoff_hz=cutoff_hz,
+        sample_rate_hz=1.0 / bin_width,
+        order=order,
+    )
 
 
 def default_metric_columns() -> dict[str, tuple[str, ...]]:
@@ -719,6 +1109,153 @@ def _empty_diagnostic_frame() -> pd.DataFrame:
     return pd.DataFrame(columns=_DIAGNOSTIC_COLUMNS)
 
 
+@dataclass(frozen=True)
+class _MetricBinning:
+    """Binned statistics for one metric of one stimulus segment."""
+
+    sensor: str
+    metric: str
+    config: TimeSeriesProcessingConfig
+    smoothing_label: str | None
+    bins: pd.DataFrame
+    raw_samples: int
+    max_time_seconds: float
+
+
+def _smoothing_label(config: TimeSeriesProcessingConfig) -> str | None:
+    if config.label is None and config.smoothing is not None:
+        return getattr(config.smoothing, "__name__", "smoothing")
+    return config.label
+
+
+def _bin_segment_multi(
+    segment: pd.DataFrame,
+    metrics: Mapping[str, Sequence[str]],
+    configs: Mapping[tuple[str, str], TimeSeriesProcessingConfig],
+    *,
+    default_config: TimeSeriesProcessingConfig | None = None,
+    time_column: str = "time_seconds",
+) -> list[_MetricBinning]:
+    """Bin all metrics of a segment, sharing bin indices per bin width."""
+
+    pairs = [
+        (sensor, metric)
+        for sensor, names in metrics.items()
+        for metric in names
+        if metric in segment.columns
+    ]
+    if not pairs or time_column not in segment.columns:
+        return []
+    fallback = default_config or TimeSeriesProcessingConfig(bin_width=1.0)
+    resolved = [configs.get(pair, fallback) for pair in pairs]
+
+    times = pd.to_numeric(segment[time_column], errors="coerce").to_numpy(
+        dtype=float
+    )
+    values = np.vstack(
+        [
+            pd.to_numeric(segment[metric], errors="coerce").to_numpy(
+                dtype=float
+            )
+            for _, metric in pairs
+        ]
+    )
+    present = ~np.isnan(values) & ~np.isnan(times)[None, :]
+    raw_samples = present.sum(axis=1)
+    with np.errstate(invalid="ignore"):
+        max_times = np.where(present, times[None, :], -np.inf).max(axis=1)
+    max_times = np.where(raw_samples > 0, max_times, np.nan)
+
+    stats: list[pd.DataFrame | None] = [None] * len(pairs)
+    by_width: dict[float, list[int]] = {}
+    for idx, config in enumerate(resolved):
+        if raw_samples[idx]:
+            by_width.setdefault(float(config.bin_width), []).append(idx)
+    for bin_width, indices in by_width.items():
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive")
+        frames = _bin_matrix_statistics(
+            times,
+            values[indices],
+            bin_width=bin_width,
+            min_coverage=[resolved[idx].min_coverage for idx in indices],
+        )
+        for idx, frame in zip(indices, frames):
+            stats[idx] = frame
+
+    results: list[_MetricBinning] = []
+    for idx, ((sensor, metric), config) in enumerate(zip(pairs, resolved)):
+        bins = stats[idx]
+        if bins is None:
+            bins = pd.DataFrame(columns=_BIN_RESULT_COLUMNS)
+        elif not bins.empty:
+            bins["value_smoothed"] = (
+                config.smoothing(bins["value_mean"])
+                if config.smoothing is not None
+                else bins["value_mean"]
+            )
+        results.append(
+            _MetricBinning(
+                sensor=sensor,
+                metric=metric,
+                config=config,
+                smoothing_label=_smoothing_label(config),
+                bins=bins,
+                raw_samples=int(raw_samples[idx]),
+                max_time_seconds=float(max_times[idx]),
+            )
+        )
+    return results
+
+
+def bin_segment_multi(
+    segment: pd.DataFrame,
+    metrics: Mapping[str, Sequence[str]],
+    configs: Mapping[tuple[str, str], TimeSeriesProcessingConfig],
+    *,
+    default_config: TimeSeriesProcessingConfig | None = None,
+    time_column: str = "time_seconds",
+    labels: Mapping[str, object] | None = None,
+) -> pd.DataFrame:
+    """Bin every metric of a stimulus segment into one long-form frame.
+
+    ``metrics`` maps sensor labels to metric columns and ``configs`` maps
+    ``(sensor, metric)`` to its processing config. Bin indices are computed
+    once per distinct bin width and all metrics sharing it are reduced
+    together. ``labels`` fills the identifying columns (``respondent_id``,
+    ``group``, ``title``, ``form``, ``raw_stimulus``).
+    """
+
+    identity = {
+        "respondent_id": None,
+        "group": None,
+        "title": None,
+        "form": None,
+        "raw_stimulus": None,
+    }
+    identity.update(labels or {})
+    frames = [
+        item.bins.assign(
+            **identity,
+            sensor=item.sensor,
+            metric=item.metric,
+            bin_width=item.config.bin_width,
+            smoothing_label=item.smoothing_label,
+        )[_BINNED_COLUMNS]
+        for item in _bin_segment_multi(
+            segment,
+            metrics,
+            configs,
+            default_config=default_config,
+            time_column=time_column,
+        )
+        if not item.bins.empty
+    ]
+    if not frames:
+        return _empty_binned_frame()
+    return apply_long_schema(pd.concat(frames, ignore_index=True))
+
+
 _AGGREGATED_COLUMNS = [
     "group",
     "title",
@@ -803,7 +1340,9 @@ def aggregate_binned_time_series(
             f"binned frame missing required columns: {missing_list}"
         )
 
-    filtered = binned.loc[binned["passes_coverage"].astype(bool)].copy()
+    filtered = binned.loc[binned["passes_coverage"].astype(bool)].astype(
+        {"value_mean": float, "value_smoothed": float, "coverage": float}
+    )
     if filtered.empty:
         return _empty_aggregated_frame()
 
@@ -822,7 +1361,7 @@ def aggregate_binned_time_series(
     ]
 
     aggregated = (
-        filtered.groupby(group_fields, dropna=False)
+        filtered.groupby(group_fields, dropna=False, observed=True)
         .agg(
             contributors=("respondent_id", pd.Series.nunique),
             total_samples=("sample_count", "sum"),
@@ -892,9 +1431,16 @@ def process_sensor_time_series(
     ]
     | None = None,
     default_config: TimeSeriesProcessingConfig | None = None,
+    forms: Iterable[str] | None = None,
     **read_csv_kwargs,
 ) -> SensorProcessingResult:
-    """Process a respondent sensor file into binned series and diagnostics."""
+    """Process a respondent sensor file into binned series and diagnostics.
+
+    With ``forms`` (e.g. ``{"Short"}``) only stimuli mapped to those forms
+    are processed, and each one is read on its own through
+    :func:`load_stimulus_segment`, so the rows of the other stimuli are
+    never parsed.
+    """
 
     metrics_by_sensor = (
         {
@@ -916,11 +1462,19 @@ def process_sensor_time_series(
     def _usecols(name: str) -> bool:
         return name in required_columns
 
-    frame, metadata = load_sensor_file(
-        sensor_path,
-        usecols=_usecols,
-        **read_csv_kwargs,
-    )
+    selected_forms = None if forms is None else frozenset(forms)
+    frame: pd.DataFrame | None = None
+    if selected_forms is None:
+        frame, metadata = load_sensor_file(
+            sensor_path,
+            usecols=_usecols,
+            **read_csv_kwargs,
+        )
+        columns = frame.columns
+    else:
+        index = scan_imotions_file(sensor_path)
+        metadata = index.metadata_subset(None)
+        columns = index.columns
     config_map = processing_config or default_time_series_processing_config()
     fallback_config = default_config or TimeSeriesProcessingConfig(
         bin_width=1.0
@@ -928,7 +1482,7 @@ def process_sensor_time_series(
 
     respondent_label = str(respondent_id)
 
-    if "SourceStimuliName" not in frame.columns:
+    if "SourceStimuliName" not in columns:
         issue = (
             f"{respondent_label}: sensor frame missing "
             "'SourceStimuliName' column"
@@ -953,7 +1507,13 @@ def process_sensor_time_series(
     diagnostic_rows: list[dict[str, object]] = []
     issues: list[str] = []
 
-    for raw_name in frame["SourceStimuliName"].dropna().unique():
+    if frame is not None:
+        raw_names = list(frame["SourceStimuliName"].dropna().unique())
+    else:
+        runs = build_stimulus_index(sensor_path)
+        raw_names = list(dict.fromkeys(run.stimulus for run in runs))
+
+    for raw_name in raw_names:
         resolved = _resolve_title_form_with_fallback(
             raw_name,
             cleaned_group or group,
@@ -966,8 +1526,18 @@ def process_sensor_time_series(
             )
             continue
         title, form = resolved
+        if selected_forms is not None and form not in selected_forms:
+            continue
         try:
-            segment = extract_stimulus_segment(frame, raw_name)
+            if frame is None:
+                segment = load_stimulus_segment(
+                    sensor_path,
+                    raw_name,
+                    usecols=_usecols,
+                    **read_csv_kwargs,
+                )
+            else:
+                segment = extract_stimulus_segment(frame, raw_name)
         except KeyError as exc:
             issues.append(f"{respondent_label}: {exc}")
             continue
@@ -1001,130 +1571,86 @@ def process_sensor_time_series(
                 continue
             segment["time_seconds"] = segment["time_seconds"] - start
 
-        for sensor_label, metrics in metrics_by_sensor.items():
-            if not metrics:
-                continue
-            for metric_name in metrics:
-                if metric_name not in segment.columns:
-                    continue
-                metric_frame = segment[["time_seconds", metric_name]].copy()
-                # Coerce raw sensor values to numeric in case of stray strings
-                metric_frame["time_seconds"] = pd.to_numeric(
-                    metric_frame["time_seconds"], errors="coerce"
-                )
-                metric_frame[metric_name] = pd.to_numeric(
-                    metric_frame[metric_name], errors="coerce"
-                )
-                metric_frame = metric_frame.dropna(
-                    subset=["time_seconds", metric_name]
-                )
-                raw_samples = int(metric_frame.shape[0])
-                diagnostic_record = {
-                    "respondent_id": respondent_id,
-                    "group": cleaned_group,
-                    "title": title,
-                    "form": form,
-                    "sensor": sensor_label,
-                    "metric": metric_name,
-                    "raw_stimulus": raw_name,
-                    "raw_samples": raw_samples,
-                    "bin_width": np.nan,
-                    "smoothing_label": None,
-                }
-                if raw_samples == 0:
-                    diagnostic_record.update(
-                        {
-                            "bins_total": 0,
-                            "bins_passing": 0,
-                            "bins_failing": 0,
-                            "mean_coverage": np.nan,
-                            "max_time_seconds": np.nan,
-                        }
-                    )
-                    diagnostic_rows.append(diagnostic_record)
-                    continue
-
-                metric_frame = metric_frame.rename(
-                    columns={metric_name: "value"}
-                )
-                metric_frame = metric_frame.sort_values("time_seconds")
-
-                config = config_map.get(
-                    (sensor_label, metric_name),
-                    fallback_config,
-                )
-                diagnostic_record["bin_width"] = config.bin_width
-                smoothing_label = config.label
-                if smoothing_label is None and config.smoothing is not None:
-                    smoothing_label = getattr(
-                        config.smoothing,
-                        "__name__",
-                        "smoothing",
-                    )
-                diagnostic_record["smoothing_label"] = smoothing_label
-
-                binned = bin_time_series(
-                    metric_frame,
-                    value_column="value",
-                    time_column="time_seconds",
-                    bin_width=config.bin_width,
-                    min_coverage=config.min_coverage,
+        for item in _bin_segment_multi(
+            segment,
+            metrics_by_sensor,
+            config_map,
+            default_config=fallback_config,
+        ):
+            diagnostic_record = {
+                "respondent_id": respondent_id,
+                "group": cleaned_group,
+                "title": title,
+                "form": form,
+                "sensor": item.sensor,
+                "metric": item.metric,
+                "raw_stimulus": raw_name,
+                "raw_samples": item.raw_samples,
+                "bin_width": np.nan,
+                "smoothing_label": None,
+            }
+            if item.raw_samples == 0:
+                diagnostic_record.update(
+                    {
+                        "bins_total": 0,
+                        "bins_passing": 0,
+                        "bins_failing": 0,
+                        "mean_coverage": np.nan,
+                        "max_time_seconds": np.nan,
+                    }
                 )
-                if binned.empty:
-                    diagnostic_record.update(
-                        {
-                            "bins_total": 0,
-                            "bins_passing": 0,
-                            "bins_failing": 0,
-                            "mean_coverage": np.nan,
-                            "max_time_seconds": float(
-                                metric_frame["time_seconds"].max()
-                            ),
-                        }
-                    )
-                    diagnostic_rows.append(diagnostic_record)
-                    continue
+                diagnostic_rows.append(diagnostic_record)
+                continue
 
-                if config.smoothing is not None:
-                    binned["value_smoothed"] = config.smoothing(
-                        binned["value_mean"]
-                    )
-                else:
-                    binned["value_smoothed"] = binned["value_mean"]
-
-                binned = binned.assign(
-                    respondent_id=respondent_id,
-                    group=cleaned_group,
-                    title=title,
-                    form=form,
-                    sensor=sensor_label,
-                    metric=metric_name,
-                    raw_stimulus=raw_name,
-                    bin_width=config.bin_width,
-                    smoothing_label=smoothing_label,
-                )
-                binned_frames.append(binned[_BINNED_COLUMNS])
-
-                bins_total = int(binned.shape[0])
-                bins_passing = int(binned["passes_coverage"].sum())
-                bins_failing = bins_total - bins_passing
-                mean_coverage = (
-                    float(binned["coverage"].mean())
-                    if bins_total
-                    else np.nan
-                )
-                max_time_seconds = float(metric_frame["time_seconds"].max())
+            diagnostic_record["bin_width"] = item.config.bin_width
+            diagnostic_record["smoothing_label"] = item.smoothing_label
 
+            binned = item.bins
+            if binned.empty:
                 diagnostic_record.update(
                     {
-                        "bins_total": bins_total,
-                        "bins_passing": bins_passing,
-                        "bins_failing": bins_failing,
-                        "mean_coverage": mean_coverage,
-                        "max_time_seconds": max_time_seconds,
+                        "bins_total": 0,
+                        "bins_passing": 0,
+                        "bins_failing": 0,
+                        "mean_coverage": np.nan,
+                        "max_time_seconds": item.max_time_seconds,
                     }
                 )
                 diagnostic_rows.append(diagnostic_record)
+                continue
+
+            binned = binned.assign(
+                respondent_id=respondent_id,
+                group=cleaned_group,
+                title=title,
+                form=form,
+                sensor=item.sensor,
+                metric=item.metric,
+                raw_stimulus=raw_name,
+                bin_width=item.config.bin_width,
+                smoothing_label=item.smoothing_label,
+            )
+            binned_frames.append(binned[_BINNED_COLUMNS])
+
+            bins_total = int(binned.shape[0])
+            bins_passing = int(binned["passes_coverage"].sum())
+            bins_failing = bins_total - bins_passing
+            mean_coverage = (
+                float(binned["coverage"].mean())
+                if bins_total
+                else np.nan
+            )
+
+            diagnostic_record.update(
+                {
+                    "bins_total": bins_total,
+                    "bins_passing": bins_passing,
+                    "bins_failing": bins_failing,
+                    "mean_coverage": mean_coverage,
+                    "max_time_seconds": item.max_time_seconds,
+                }
+            )
+            diagnostic_rows.append(diagnostic_record)
 
     binned_df = (
         pd.concat(binned_frames, ignore_index=True)
@@ -1138,34 +1664,339 @@ def process_sensor_time_series(
     )
 
     return SensorProcessingResult(
-        binned=binned_df,
-        diagnostics=diagnostics_df,
+        binned=apply_long_schema(binned_df),
+        diagnostics=apply_long_schema(diagnostics_df),
         issues=tuple(issues),
         metadata=metadata,
     )
 
 
+def _batch_failure(job: RespondentSensorJob, exc: Exception) -> str:
+    """Report a failed respondent as an issue string."""
+
+    return (
+        f"{job.respondent_id}: failed to process "
+        f"'{Path(job.sensor_path).name}' ({exc})"
+    )
+
+
+def _defer_matrix_smoothing(
+    processing_config: Mapping[tuple[str, str], TimeSeriesProcessingConfig]
+    | None,
+    default_config: TimeSeriesProcessingConfig | None,
+) -> tuple[
+    dict[tuple[str, str], TimeSeriesProcessingConfig],
+    TimeSeriesProcessingConfig | None,
+    dict[tuple[str, str], Any],
+    Any,
+]:
+    """Strip smoothers that can filter a whole matrix from the configs.
+
+    Workers then return unsmoothed bins, and the batch runner smooths all
+    respondents' series together. Labels are pinned so the output still
+    names the smoother.
+    """
+
+    def strip(config: TimeSeriesProcessingConfig) -> tuple[Any, Any]:
+        smoother = config.smoothing
+        if smoother is None or not hasattr(smoother, "smooth_matrix"):
+            return config, None
+        return (
+            replace(config, smoothing=None, label=_smoothing_label(config)),
+            smoother,
+        )
+
+    configs: dict[tuple[str, str], TimeSeriesProcessingConfig] = {}
+    deferred: dict[tuple[str, str], Any] = {}
+    for key, config in (
+        processing_config or default_time_series_processing_config()
+    ).items():
+        configs[key], smoother = strip(config)
+        if smoother is not None:
+            deferred[key] = smoother
+    default_smoother = None
+    if default_config is not None:
+        default_config, default_smoother = strip(default_config)
+    return configs, default_config, deferred, default_smoother
+
+
+def _apply_deferred_smoothing(
+    results: Sequence[SensorProcessingResult],
+    configs: Mapping[tuple[str, str], TimeSeriesProcessingConfig],
+    deferred: Mapping[tuple[str, str], Any],
+    default_smoother: Any,
+) -> list[SensorProcessingResult]:
+    """Smooth deferred series across respondents, one call per length.
+
+    A series is one respondent's bins for one stimulus and metric; series
+    sharing a smoother and a bin count are stacked into a matrix.
+    """
+
+    frames = [result.binned.copy() for result in results]
+    batches: dict[tuple[Any, int], list[tuple[int, np.ndarray]]] = {}
+    for position, frame in enumerate(frames):
+        if frame.empty:
+            continue
+        keys = frame.groupby(
+            ["sensor", "metric", "raw_stimulus", "title", "form"],
+            dropna=False,
+            observed=True,
+            sort=False,
+        ).ngroup().to_numpy()
+        bins = frame["bin"].to_numpy()
+        starts = np.flatnonzero(
+            np.r_[True, (keys[1:] != keys[:-1]) | (bins[1:] <= bins[:-1])]
+        )
+        bounds = np.r_[starts, len(frame)]
+        sensors = frame["sensor"].to_numpy()
+        metrics = frame["metric"].to_numpy()
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            pair = (sensors[lo], metrics[lo])
+            smoother = deferred.get(pair)
+            if smoother is None and pair not in configs:
+                smoother = default_smoother
+            if smoother is None:
+                continue
+            batches.setdefault((smoother, hi - lo), []).append(
+                (position, np.arange(lo, hi))
+            )
+
+    smoothed = [
+        frame["value_smoothed"].to_numpy(dtype=float, copy=True)
+        for frame in frames
+    ]
+    for (smoother, _), members in batches.items():
+        matrix = np.vstack(
+            [
+                frames[position]["value_mean"].to_numpy(dtype=float)[rows]
+                for position, rows in members
+            ]
+        )
+        filtered = smoother.smooth_matrix(matrix)
+        for (position, rows), values in zip(members, filtered):
+            smoothed[position][rows] = values
+
+    updated: list[SensorProcessingResult] = []
+    for result, frame, values in zip(results, frames, smoothed):
+        if not frame.empty:
+            frame["value_smoothed"] = values.astype(
+                frame["value_smoothed"].dtype
+            )
+        updated.append(replace(result, binned=frame))
+    return updated
+
+
+def process_sensor_time_series_batch(
+    respondents: Iterable[
+        RespondentSensorJob | tuple[object, object | None, str | Path]
+    ],
+    *,
+    stimulus_lookup: Mapping[tuple[str, str], Mapping[str, str]],
+    stimulus_map: pd.DataFrame,
+    key_moment_table: pd.DataFrame,
+    metric_columns: Mapping[str, Sequence[str]] | None = None,
+    processing_config: Mapping[
+        tuple[str, str],
+        TimeSeriesProcessingConfig,
+    ]
+    | None = None,
+    default_config: TimeSeriesProcessingConfig | None = None,
+    max_workers: int | None = None,
+    cache_dir: str | Path | None = None,
+    forms: Iterable[str] | None = None,
+    **read_csv_kwargs,
+) -> SensorBatchResult:
+    """Run :func:`process_sensor_time_series` for many respondents.
+
+    Respondents are spread over a process pool; pass ``max_workers=1`` (or
+    0) to run serially in the current process, which is easier to debug.
+    Outputs are concatenated in input order regardless of completion order,
+    and per-respondent failures are collected as issues. With ``cache_dir``
+    each respondent's result is cached (see :mod:`wbdlib.timeseries_cache`)
+    and only respondents whose inputs changed are recomputed; inputs with
+    a lambda or closure smoother bypass the cache. Smoothers
+    with a ``smooth_matrix`` method (the Butterworth low-pass) run once per
+    series length over all respondents instead of once per series.
+    ``forms`` restricts every respondent to the stimuli of those forms, as
+    in :func:`process_sensor_time_series`.
+    """
+
+    jobs = [coerce_job(item) for item in respondents]
+    if forms is not None:
+        forms = tuple(sorted(set(forms)))
+    outcomes: list[SensorProcessingResult | str | None] = [None] * len(jobs)
+    cache_keys: list[str | None] = [None] * len(jobs)
+    if cache_dir is not None:
+        from .timeseries_cache import load_cached_result, time_series_cache_key
+
+        for position, job in enumerate(jobs):
+            try:
+                cache_keys[position] = time_series_cache_key(
+                    job.sensor_path,
+                    respondent_id=job.respondent_id,
+                    group=job.group,
+                    stimulus_lookup=stimulus_lookup,
+                    stimulus_map=stimulus_map,
+                    key_moment_table=key_moment_table,
+                    metric_columns=metric_columns,
+                    processing_config=processing_config,
+                    default_config=default_config,
+                    forms=forms,
+                    read_csv_kwargs=read_csv_kwargs,
+                )
+            except OSError:
+                # Missing export; let the worker report it as an issue.
+                continue
+            if cache_keys[position] is None:
+                # A lambda or closure smoother; recompute and do not store.
+                continue
+            outcomes[position] = load_cached_result(
+                cache_dir,
+                job.respondent_id,
+                cache_keys[position],
+            )
+    cache_hits = sum(outcome is not None for outcome in outcomes)
+    pending = [
+        position
+        for position, outcome in enumerate(outcomes)
+        if outcome is None
+    ]
+    pending_jobs = [jobs[position] for position in pending]
+    (
+        worker_configs,
+        worker_default,
+        deferred,
+        default_smoother,
+    ) = _defer_matrix_smoothing(processing_config, default_config)
+    computed = run_respondent_jobs(
+        process_sensor_time_series,
+        pending_jobs,
+        {
+            "stimulus_lookup": stimulus_lookup,
+            "stimulus_map": stimulus_map,
+            "key_moment_table": key_moment_table,
+            "metric_columns": metric_columns,
+            "processing_config": worker_configs,
+            "default_config": worker_default,
+            "forms": forms,
+        },
+        on_error=_batch_failure,
+        read_csv_kwargs=read_csv_kwargs,
+        max_workers=max_workers,
+    )
+
+    if deferred or default_smoother is not None:
+        successes = [
+            index
+            for index, outcome in enumerate(computed)
+            if not isinstance(outcome, str)
+        ]
+        smoothed = _apply_deferred_smoothing(
+            [computed[index] for index in successes],
+            worker_configs,
+            deferred,
+            default_smoother,
+        )
+        for index, outcome in zip(successes, smoothed):
+            computed[index] = outcome
+
+    for position, outcome in zip(pending, computed):
+        outcomes[position] = outcome
+        key = cache_keys[position]
+        if key is not None and not isinstance(outcome, str):
+            from .timeseries_cache import store_cached_result
+
+            store_cached_result(
+                cache_dir,
+                jobs[position].respondent_id,
+                key,
+                outcome,
+            )
+
+    binned_frames: list[pd.DataFrame] = []
+    diagnostic_frames: list[pd.DataFrame] = []
+    metadata_records: list[dict[str, object]] = []
+    issues: list[str] = []
+    processed = 0
+    for job, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, str):
+            issues.append(outcome)
+            continue
+        processed += 1
+        source_path = str(job.sensor_path)
+        if not outcome.binned.empty:
+            binned_frames.append(
+                outcome.binned.assign(source_path=source_path)
+            )
+        if not outcome.diagnostics.empty:
+            diagnostic_frames.append(
+                outcome.diagnostics.assign(source_path=source_path)
+            )
+        if outcome.metadata:
+            record: dict[str, object] = {
+                "respondent_id": job.respondent_id,
+                "source_path": source_path,
+            }
+            record.update(outcome.metadata)
+            metadata_records.append(record)
+        issues.extend(outcome.issues)
+
+    binned_df = (
+        pd.concat(binned_frames, ignore_index=True)
+        if binned_frames
+        else _empty_binned_frame().assign(source_path=pd.Series(dtype=object))
+    )
+    diagnostics_df = (
+        pd.concat(diagnostic_frames, ignore_index=True)
+        if diagnostic_frames
+        else _empty_diagnostic_frame().assign(
+            source_path=pd.Series(dtype=object)
+        )
+    )
+    # Respondents carry different label sets, so concatenated categoricals
+    # fall back to object; re-applying the schema merges the categories.
+    return SensorBatchResult(
+        binned=apply_long_schema(binned_df),
+        diagnostics=apply_long_schema(diagnostics_df),
+        issues=tuple(issues),
+        metadata=pd.DataFrame(metadata_records),
+        processed=processed,
+        cache_hits=cache_hits,
+    )
+
+
 __all__ = [
     "DEFAULT_SENSOR_METRICS",
+    "TIME_SERIES_CODE_VERSION",
     "KeyMomentWindow",
     "load_stimulus_map",
     "build_stimulus_lookup",
     "resolve_stimulus_identity",
+    "resolve_stimulus_in_group",
+    "smooth_segments",
     "load_key_moments",
     "get_key_moment_window",
     "load_sensor_file",
     "extract_stimulus_segment",
+    "load_stimulus_segment",
     "bin_time_series",
+    "bin_segment_multi",
     "TimeSeriesProcessingConfig",
     "SensorProcessingResult",
     "parse_duration_to_milliseconds",
     "butterworth_lowpass_filter",
     "butterworth_highpass_filter",
     "butterworth_bandpass_filter",
+    "butterworth_sos",
+    "zero_phase_filter_matrix",
     "moving_average",
     "zscore_series",
     "default_metric_columns",
     "default_time_series_processing_config",
     "process_sensor_time_series",
+    "process_sensor_time_series_batch",
+    "RespondentSensorJob",
+    "SENTINEL_LIMIT",
+    "SensorBatchResult",
     "aggregate_binned_time_series",
 ]
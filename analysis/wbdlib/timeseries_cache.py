@@ -0,0 +1,253 @@
+"""Content-addressed cache for per-respondent time-series results.
+
+Each :class:`~wbdlib.timeseries.SensorProcessingResult` is stored under a key
+derived from everything that can change it: the sensor export (path,
+modification time and size), the stimulus map and lookup, the key-moment
+table, the metric selection, every per-metric processing config, the form
+filter and ``TIME_SERIES_CODE_VERSION``. A changed input produces a new key,
+so stale respondents are recomputed automatically while untouched ones are
+loaded. Inputs that cannot be fingerprinted across runs (a lambda or
+closure smoother) have no key and are never cached.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+import pandas as pd
+
+from .timeseries import (
+    DEFAULT_SENSOR_METRICS,
+    TIME_SERIES_CODE_VERSION,
+    SensorProcessingResult,
+    TimeSeriesProcessingConfig,
+    default_time_series_processing_config,
+)
+
+
+_CACHE_SUFFIX = ".pkl"
+
+
+class _UnstableKey(Exception):
+    """Raised when an input has no description that survives a restart."""
+
+
+def _update(digest: Any, *parts: object) -> None:
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+
+
+def _frame_fingerprint(frame: pd.DataFrame | None) -> str:
+    if frame is None:
+        return "none"
+    digest = hashlib.sha1()
+    _update(digest, list(frame.columns), [str(dtype) for dtype in frame.dtypes])
+    hashed = pd.util.hash_pandas_object(frame, index=True)
+    digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _file_fingerprint(path: str | Path) -> tuple[str, int, int]:
+    path_obj = Path(path)
+    stat = path_obj.stat()
+    return str(path_obj.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def _callable_fingerprint(func: object | None) -> str:
+    """Describe a smoother so that equal parameters give equal keys.
+
+    Dataclass smoothers have a value-based repr. Plain functions are
+    identified by their qualified name and partials by the wrapped function
+    and bound arguments. Closures and lambdas cannot be inspected reliably
+    and raise :class:`_UnstableKey` rather than risking a stale hit.
+    """
+
+    if func is None:
+        return "none"
+    if isinstance(func, functools.partial):
+        return repr(
+            (
+                "partial",
+                _callable_fingerprint(func.func),
+                _value_fingerprint(func.args),
+                _value_fingerprint(func.keywords),
+            )
+        )
+    qualname = getattr(func, "__qualname__", "")
+    if "<lambda>" in qualname or "<locals>" in qualname:
+        raise _UnstableKey(qualname)
+    if hasattr(func, "__dataclass_fields__"):
+        return repr(func)
+    module = getattr(func, "__module__", type(func).__module__)
+    return f"{module}.{qualname or type(func).__qualname__}"
+
+
+def _value_fingerprint(value: object) -> object:
+    """Describe a ``read_csv`` keyword value without memory addresses.
+
+    Callables (a ``usecols`` predicate, converters) go through
+    :func:`_callable_fingerprint`; containers are described element-wise,
+    with sets and mapping keys sorted so the key is stable across processes.
+    """
+
+    if callable(value) and not isinstance(value, type):
+        return ("callable", _callable_fingerprint(value))
+    if isinstance(value, Mapping):
+        return (
+            "mapping",
+            sorted(
+                (repr(key), _value_fingerprint(item))
+                for key, item in value.items()
+            ),
+        )
+    if isinstance(value, (set, frozenset)):
+        return ("set", sorted(repr(_value_fingerprint(item)) for item in value))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, [_value_fingerprint(item) for item in value])
+    return value
+
+
+def _config_fingerprint(config: TimeSeriesProcessingConfig | None) -> tuple:
+    if config is None:
+        return ("none",)
+    return (
+        float(config.bin_width),
+        config.min_coverage,
+        config.label,
+        _callable_fingerprint(config.smoothing),
+    )
+
+
+def time_series_cache_key(
+    sensor_path: str | Path,
+    *,
+    respondent_id: object,
+    group: object | None,
+    stimulus_lookup: Mapping[tuple[str, str], Mapping[str, str]],
+    stimulus_map: pd.DataFrame,
+    key_moment_table: pd.DataFrame,
+    metric_columns: Mapping[str, Sequence[str]] | None = None,
+    processing_config: Mapping[
+        tuple[str, str],
+        TimeSeriesProcessingConfig,
+    ]
+    | None = None,
+    default_config: TimeSeriesProcessingConfig | None = None,
+    forms: Iterable[str] | None = None,
+    read_csv_kwargs: Mapping[str, Any] | None = None,
+) -> str | None:
+    """Return the cache key for one respondent's processing inputs.
+
+    ``None`` means the inputs include a callable without a stable
+    description, so the result must not be cached.
+    """
+
+    metrics = metric_columns or DEFAULT_SENSOR_METRICS
+    configs = processing_config or default_time_series_processing_config()
+    digest = hashlib.sha1()
+    try:
+        _update(
+            digest,
+            TIME_SERIES_CODE_VERSION,
+            _file_fingerprint(sensor_path),
+            str(respondent_id),
+            None if group is None else str(group),
+            _frame_fingerprint(stimulus_map),
+            _frame_fingerprint(key_moment_table),
+            sorted(
+                (key, sorted(record.items()))
+                for key, record in stimulus_lookup.items()
+            ),
+            {sensor: list(names) for sensor, names in metrics.items()},
+            sorted(
+                (key, _config_fingerprint(config))
+                for key, config in configs.items()
+            ),
+            _config_fingerprint(default_config),
+            None if forms is None else sorted(set(forms)),
+            sorted(
+                (key, _value_fingerprint(value))
+                for key, value in (read_csv_kwargs or {}).items()
+            ),
+        )
+    except _UnstableKey:
+        return None
+    return digest.hexdigest()[:20]
+
+
+def _respondent_slug(respondent_id: object) -> str:
+    text = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(respondent_id)).strip("_")
+    return text or "respondent"
+
+
+def time_series_cache_path(
+    cache_dir: str | Path,
+    respondent_id: object,
+    key: str,
+) -> Path:
+    """Return where a cached result for ``respondent_id`` is stored."""
+
+    return Path(cache_dir) / (
+        f"{_respondent_slug(respondent_id)}-{key}{_CACHE_SUFFIX}"
+    )
+
+
+def load_cached_result(
+    cache_dir: str | Path,
+    respondent_id: object,
+    key: str,
+) -> SensorProcessingResult | None:
+    """Return the cached result for ``key`` or ``None`` on a miss."""
+
+    path = time_series_cache_path(cache_dir, respondent_id, key)
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as handle:
+            result = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+    if not isinstance(result, SensorProcessingResult):
+        return None
+    return result
+
+
+def store_cached_result(
+    cache_dir: str | Path,
+    respondent_id: object,
+    key: str,
+    result: SensorProcessingResult,
+) -> Path:
+    """Save ``result`` under ``key`` and drop older entries for the respondent."""
+
+    directory = Path(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    target = time_series_cache_path(directory, respondent_id, key)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as handle:
+        pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, target)
+
+    slug = _respondent_slug(respondent_id)
+    for stale in directory.glob(f"{slug}-*{_CACHE_SUFFIX}"):
+        if stale != target and stale.stem.rsplit("-", 1)[0] == slug:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return target
+
+
+__all__ = [
+    "load_cached_result",
+    "store_cached_result",
+    "time_series_cache_key",
+    "time_series_cache_path",
+]
@@ -0,0 +1,467 @@
+"""Streaming cohort aggregation of respondent time-series bins.
+
+:func:`wbdlib.timeseries.aggregate_binned_time_series` needs every
+respondent's bins in one frame. :class:`StreamingTimeSeriesAggregator`
+instead folds respondents in one at a time, keeping only running moments
+per cohort bin plus a mergeable log-bucket quantile sketch for medians, and
+produces the same ``_AGGREGATED_COLUMNS`` frame at the end. Partial
+aggregators built in worker processes can be merged.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .timeseries import (
+    _AGGREGATED_COLUMNS,
+    SensorProcessingResult,
+    _empty_aggregated_frame,
+)
+
+
+_KEY_FIELDS = (
+    "group",
+    "title",
+    "form",
+    "sensor",
+    "metric",
+    "bin",
+    "bin_start",
+    "bin_end",
+    "bin_midpoint",
+    "bin_width",
+    "smoothing_label",
+)
+
+_REQUIRED_COLUMNS = frozenset(
+    {
+        "respondent_id",
+        *_KEY_FIELDS,
+        "value_mean",
+        "value_smoothed",
+        "sample_count",
+        "coverage",
+        "passes_coverage",
+    }
+)
+
+_CHANNELS = ("value", "smoothed")
+
+# Magnitudes below this land in the sketch's zero bucket; above the upper
+# bound they share the last bucket.
+_SKETCH_MIN_VALUE = 1e-12
+_SKETCH_MAX_VALUE = 1e12
+
+
+class _KeyedLogSketch:
+    """Log-bucket quantile sketch for many keys at once (DDSketch style).
+
+    Every value is mapped to a bucket whose representative is within
+    ``relative_accuracy`` of it, so quantiles carry that relative error.
+    Bucket counts for all keys live in one pair of sorted arrays indexed by
+    ``key_id * span + bucket``; new samples are buffered and folded in
+    periodically, which keeps memory proportional to occupied buckets.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float,
+        *,
+        compact_every: int = 1_000_000,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._limit = int(
+            math.ceil(math.log(_SKETCH_MAX_VALUE) / self._log_gamma)
+        )
+        self._offset = 2 * self._limit + 1
+        self.span = 2 * self._offset + 1
+        self._compact_every = compact_every
+        self._codes = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._pending: list[tuple[np.ndarray, np.ndarray]] = []
+        self._pending_size = 0
+
+    def _buckets(self, values: np.ndarray) -> np.ndarray:
+        magnitude = np.abs(values)
+        zero = magnitude < _SKETCH_MIN_VALUE
+        with np.errstate(divide="ignore"):
+            index = np.ceil(
+                np.log(np.where(zero, 1.0, magnitude)) / self._log_gamma
+            )
+        index = np.clip(index, -self._limit, self._limit).astype(np.int64)
+        sign = np.sign(values).astype(np.int64)
+        signed = np.where(zero, 0, sign * (index + self._limit + 1))
+        return signed + self._offset
+
+    def _representatives(self, buckets: np.ndarray) -> np.ndarray:
+        signed = buckets - self._offset
+        index = np.abs(signed) - self._limit - 1
+        value = 2.0 * np.power(self.gamma, index.astype(float)) / (
+            self.gamma + 1.0
+        )
+        return np.where(signed == 0, 0.0, np.sign(signed) * value)
+
+    def _append(self, codes: np.ndarray, counts: np.ndarray) -> None:
+        if codes.size == 0:
+            return
+        self._pending.append((codes, counts))
+        self._pending_size += codes.size
+        if self._pending_size >= self._compact_every:
+            self.compact()
+
+    def add(self, key_ids: np.ndarray, values: np.ndarray) -> None:
+        finite = np.isfinite(values)
+        codes = key_ids[finite] * self.span + self._buckets(values[finite])
+        self._append(codes, np.ones(codes.size, dtype=np.int64))
+
+    def compact(self) -> None:
+        if not self._pending:
+            return
+        codes = np.concatenate([self._codes, *(c for c, _ in self._pending)])
+        counts = np.concatenate(
+            [self._counts, *(n for _, n in self._pending)]
+        )
+        self._pending = []
+        self._pending_size = 0
+        unique, inverse = np.unique(codes, return_inverse=True)
+        self._codes = unique
+        self._counts = np.bincount(
+            inverse,
+            weights=counts,
+            minlength=unique.size,
+        ).astype(np.int64)
+
+    def merge(self, other: "_KeyedLogSketch", key_map: np.ndarray) -> None:
+        if other.span != self.span:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        other.compact()
+        keys = other._codes // other.span
+        buckets = other._codes % other.span
+        self._append(key_map[keys] * self.span + buckets, other._counts.copy())
+
+    def medians(self, n_keys: int) -> np.ndarray:
+        """Return per-key medians (mean of the two middle ranks)."""
+
+        self.compact()
+        result = np.full(n_keys, np.nan)
+        if self._codes.size == 0:
+            return result
+        keys = self._codes // self.span
+        totals = np.bincount(keys, weights=self._counts, minlength=n_keys)
+        cumulative = np.cumsum(self._counts)
+        present = np.flatnonzero(totals > 0)
+        starts = np.searchsorted(keys, present, side="left")
+        base = np.where(starts > 0, cumulative[np.maximum(starts - 1, 0)], 0)
+        n = totals[present].astype(np.int64)
+        representatives = self._representatives(self._codes % self.span)
+        lower = np.searchsorted(cumulative, base + (n - 1) // 2, side="right")
+        upper = np.searchsorted(cumulative, base + n // 2, side="right")
+        result[present] = 0.5 * (
+            representatives[lower] + representatives[upper]
+        )
+        return result
+
+
+def _normalise_key(values: tuple) -> tuple:
+    return tuple(None if pd.isna(value) else value for value in values)
+
+
+class StreamingTimeSeriesAggregator:
+    """Fold respondent bins into cohort summaries without keeping them.
+
+    Call :meth:`add` with each respondent's :class:`SensorProcessingResult`
+    (or binned frame), :meth:`merge` to combine partial aggregators, and
+    :meth:`finalize` for the ``aggregate_binned_time_series`` schema.
+    Means, standard deviations and coverage are exact; medians come from a
+    quantile sketch and are accurate to ``relative_accuracy``.
+    """
+
+    def __init__(self, *, relative_accuracy: float = 0.005) -> None:
+        self._key_index: dict[tuple, int] = {}
+        self._keys: list[tuple] = []
+        self._respondents: set[Hashable] = set()
+        self._contributors = np.empty(0, dtype=np.int64)
+        self._total_samples = np.empty(0, dtype=np.int64)
+        self._coverage_sum = np.empty(0, dtype=float)
+        self._coverage_count = np.empty(0, dtype=np.int64)
+        self._moments = {
+            channel: {
+                "count": np.empty(0, dtype=np.int64),
+                "mean": np.empty(0, dtype=float),
+                "m2": np.empty(0, dtype=float),
+            }
+            for channel in _CHANNELS
+        }
+        self._sketches = {
+            channel: _KeyedLogSketch(relative_accuracy)
+            for channel in _CHANNELS
+        }
+
+    @property
+    def respondents(self) -> frozenset:
+        """Respondent identifiers folded in so far."""
+
+        return frozenset(self._respondents)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _claim_respondents(self, respondents: Iterable[Hashable]) -> None:
+        incoming = set(respondents)
+        duplicates = incoming & self._respondents
+        if duplicates:
+            listed = ", ".join(sorted(map(str, duplicates)))
+            raise ValueError(f"Respondents already aggregated: {listed}")
+        self._respondents |= incoming
+
+    def _key_ids(self, keys: Iterable[tuple]) -> np.ndarray:
+        ids = []
+        for key in keys:
+            key_id = self._key_index.get(key)
+            if key_id is None:
+                key_id = len(self._keys)
+                self._key_index[key] = key_id
+                self._keys.append(key)
+            ids.append(key_id)
+        self._grow(len(self._keys))
+        return np.asarray(ids, dtype=np.int64)
+
+    def _grow(self, size: int) -> None:
+        extra = size - self._contributors.size
+        if extra <= 0:
+            return
+
+        def _pad(array: np.ndarray) -> np.ndarray:
+            return np.concatenate([array, np.zeros(extra, dtype=array.dtype)])
+
+        self._contributors = _pad(self._contributors)
+        self._total_samples = _pad(self._total_samples)
+        self._coverage_sum = _pad(self._coverage_sum)
+        self._coverage_count = _pad(self._coverage_count)
+        for moments in self._moments.values():
+            for name in moments:
+                moments[name] = _pad(moments[name])
+
+    def _fold_moments(
+        self,
+        channel: str,
+        key_ids: np.ndarray,
+        count: np.ndarray,
+        mean: np.ndarray,
+        m2: np.ndarray,
+    ) -> None:
+        """Combine per-key moments with Chan's parallel update."""
+
+        moments = self._moments[channel]
+        n_a = moments["count"][key_ids].astype(float)
+        mean_a = moments["mean"][key_ids]
+        n_b = count.astype(float)
+        total = n_a + n_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - mean_a
+            ratio = np.where(total > 0, n_b / total, 0.0)
+            new_mean = np.where(n_a > 0, mean_a + delta * ratio, mean)
+            new_m2 = moments["m2"][key_ids] + m2 + np.where(
+                (n_a > 0) & (n_b > 0),
+                delta * delta * n_a * ratio,
+                0.0,
+            )
+        moments["count"][key_ids] += count
+        moments["mean"][key_ids] = np.where(total > 0, new_mean, 0.0)
+        moments["m2"][key_ids] = new_m2
+
+    def add(
+        self,
+        result: SensorProcessingResult | pd.DataFrame,
+        *,
+        group: object | None = None,
+    ) -> "StreamingTimeSeriesAggregator":
+        """Fold one respondent's bins (or any binned frame) into the totals.
+
+        ``group`` overrides the frame's group label. Adding a respondent
+        that is already part of the aggregate raises ``ValueError``.
+        """
+
+        binned = (
+            result.binned
+            if isinstance(result, SensorProcessingResult)
+            else result
+        )
+        if binned.empty:
+            return self
+        missing = _REQUIRED_COLUMNS.difference(binned.columns)
+        if missing:
+            missing_list = ", ".join(sorted(missing))
+            raise KeyError(
+                f"binned frame missing required columns: {missing_list}"
+            )
+        filtered = binned.loc[binned["passes_coverage"].astype(bool)]
+        if group is not None:
+            filtered = filtered.assign(group=group)
+        self._claim_respondents(binned["respondent_id"].dropna().unique())
+        if filtered.empty:
+            return self
+
+        frame = pd.DataFrame(
+            {
+                "respondent_id": filtered["respondent_id"].to_numpy(),
+                "sample_count": pd.to_numeric(filtered["sample_count"]),
+                "coverage": pd.to_numeric(filtered["coverage"]).astype(float),
+                "value": pd.to_numeric(filtered["value_mean"]).astype(float),
+                "smoothed": pd.to_numeric(
+                    filtered["value_smoothed"]
+                ).astype(float),
+            }
+        )
+        key_frame = filtered[list(_KEY_FIELDS)].astype(object)
+        codes = (
+            key_frame.groupby(list(_KEY_FIELDS), dropna=False, sort=False)
+            .ngroup()
+            .to_numpy()
+        )
+        _, first_rows = np.unique(codes, return_index=True)
+        target = self._key_ids(
+            _normalise_key(key)
+            for key in key_frame.iloc[first_rows].itertuples(
+                index=False,
+                name=None,
+            )
+        )
+        row_ids = target[codes]
+        frame["key"] = codes
+
+        grouped = frame.groupby("key", sort=True)
+        self._contributors[target] += (
+            grouped["respondent_id"].nunique().to_numpy()
+        )
+        self._total_samples[target] += (
+            grouped["sample_count"].sum().to_numpy().astype(np.int64)
+        )
+        self._coverage_sum[target] += grouped["coverage"].sum().to_numpy()
+        self._coverage_count[target] += grouped["coverage"].count().to_numpy()
+
+        for channel in _CHANNELS:
+            count = grouped[channel].count().to_numpy()
+            mean = grouped[channel].mean().to_numpy()
+            deviations = frame[channel] - mean[codes]
+            m2 = (
+                (deviations * deviations)
+                .groupby(frame["key"], sort=True)
+                .sum()
+                .to_numpy()
+            )
+            self._fold_moments(
+                channel,
+                target,
+                count,
+                np.nan_to_num(mean),
+                m2,
+            )
+            self._sketches[channel].add(
+                row_ids,
+                frame[channel].to_numpy(dtype=float),
+            )
+        return self
+
+    def merge(
+        self,
+        other: "StreamingTimeSeriesAggregator",
+    ) -> "StreamingTimeSeriesAggregator":
+        """Fold another (partial) aggregator into this one."""
+
+        self._claim_respondents(other._respondents)
+        if not other._keys:
+            return self
+        key_map = self._key_ids(other._keys)
+        np.add.at(self._contributors, key_map, other._contributors)
+        np.add.at(self._total_samples, key_map, other._total_samples)
+        np.add.at(self._coverage_sum, key_map, other._coverage_sum)
+        np.add.at(self._coverage_count, key_map, other._coverage_count)
+        for channel in _CHANNELS:
+            moments = other._moments[channel]
+            self._fold_moments(
+                channel,
+                key_map,
+                moments["count"],
+                moments["mean"],
+                moments["m2"],
+            )
+            self._sketches[channel].merge(other._sketches[channel], key_map)
+        return self
+
+    def finalize(self, *, min_contributors: int | None = None) -> pd.DataFrame:
+        """Return cohort summaries in the ``_AGGREGATED_COLUMNS`` schema."""
+
+        if not self._keys:
+            return _empty_aggregated_frame()
+        aggregated = pd.DataFrame.from_records(
+            self._keys,
+            columns=list(_KEY_FIELDS),
+        )
+        aggregated["contributors"] = self._contributors
+        aggregated["total_samples"] = self._total_samples
+        with np.errstate(invalid="ignore", divide="ignore"):
+            aggregated["mean_coverage"] = (
+                self._coverage_sum / self._coverage_count
+            )
+        n_keys = len(self._keys)
+        for channel in _CHANNELS:
+            moments = self._moments[channel]
+            count = moments["count"]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                variance = np.where(
+                    count > 1,
+                    moments["m2"] / np.maximum(count - 1, 1),
+                    np.nan,
+                )
+            mean = np.where(count > 0, moments["mean"], np.nan)
+            std = np.nan_to_num(np.sqrt(np.maximum(variance, 0.0)), nan=0.0)
+            aggregated[f"mean_{channel}"] = mean
+            aggregated[f"median_{channel}"] = self._sketches[channel].medians(
+                n_keys
+            )
+            aggregated[f"std_{channel}"] = std
+
+        contributors = aggregated["contributors"].clip(lower=1).astype(float)
+        aggregated["sem_value"] = aggregated["std_value"] / np.sqrt(contributors)
+        aggregated["sem_smoothed"] = (
+            aggregated["std_smoothed"] / np.sqrt(contributors)
+        )
+        z_score = 1.96
+        aggregated["ci95_low"] = aggregated["mean_value"] - (
+            aggregated["sem_value"] * z_score
+        )
+        aggregated["ci95_high"] = aggregated["mean_value"] + (
+            aggregated["sem_value"] * z_score
+        )
+        aggregated["ci95_low_smoothed"] = (
+            aggregated["mean_smoothed"] - aggregated["sem_smoothed"] * z_score
+        )
+        aggregated["ci95_high_smoothed"] = (
+            aggregated["mean_smoothed"] + aggregated["sem_smoothed"] * z_score
+        )
+
+        if min_contributors:
+            aggregated = aggregated.loc[
+                aggregated["contributors"] >= min_contributors
+            ]
+            if aggregated.empty:
+                return _empty_aggregated_frame()
+
+        aggregated = aggregated[_AGGREGATED_COLUMNS].sort_values(
+            ["title", "form", "sensor", "metric", "bin", "group"],
+            kind="stable",
+            na_position="last",
+        )
+        return aggregated.reset_index(drop=True)
+
+
+__all__ = ["StreamingTimeSeriesAggregator"]